@@ -0,0 +1,60 @@
+"""
+Versioned response caching for read-heavy endpoints
+"""
+import hashlib
+from typing import Any, Callable, Hashable, Optional
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Session
+
+from app.core.cache import VersionedCache
+from app.core.config import settings
+from app.db.repositories.data_version_repo import DataVersionRepository
+
+# Serialized JSON bodies keyed by (user_id, endpoint, params)
+response_cache = VersionedCache(settings.RESPONSE_CACHE_SIZE)
+
+
+def make_etag(user_id: int, version: int, endpoint: str, params: Hashable) -> str:
+    digest = hashlib.sha1(repr((endpoint, params)).encode("utf-8")).hexdigest()[:16]
+    return f'W/"{user_id}-{version}-{digest}"'
+
+
+def cached_json_response(
+    request: Request,
+    db: Session,
+    user_id: int,
+    endpoint: str,
+    params: Hashable,
+    compute: Callable[[], Any],
+    authorize: Optional[Callable[[], Any]] = None,
+) -> Response:
+    """
+    Serve a user-scoped JSON payload from the response cache.
+    The user's data version decides both cache validity and the ETag, so an
+    unchanged payload is answered with 304 without being recomputed or re-sent.
+    `authorize` runs before either, so a refused request (e.g. 404 for a piggy
+    bank the user doesn't own) is refused even with a matching If-None-Match.
+    """
+    if authorize is not None:
+        authorize()
+    version = DataVersionRepository(db).get(user_id)
+    etag = make_etag(user_id, version, endpoint, params)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in [tag.strip() for tag in if_none_match.split(",")]:
+        return Response(status_code=304, headers=headers)
+
+    key = (user_id, endpoint, params)
+    body = response_cache.get(key, version)
+    if body is None:
+        body = JSONResponse(jsonable_encoder(compute())).body
+        response_cache.set(key, body, version)
+
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def invalidate_user(user_id: int) -> None:
+    response_cache.discard_where(lambda key: key[0] == user_id)
@@ -1,39 +1,115 @@
+import time
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached
+from app.core.cache import TTLCache
 from app.core.config import settings
-from app.db.session import get_db
+from app.db.session import get_async_db, get_db
 from app.models.user import User
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_PREFIX}/auth/login")
 
-def get_current_user(
-    db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)
-) -> User:
-    credentials_exception = HTTPException(
+# Column values of recently authenticated users keyed by user id
+user_cache = TTLCache(settings.AUTH_USER_CACHE_SIZE, settings.AUTH_USER_CACHE_TTL_SECONDS)
+# User id claimed by recently seen tokens, never kept past the token's expiry
+token_cache = TTLCache(settings.AUTH_TOKEN_CACHE_SIZE, settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60)
+
+# Loaded lazily on access instead of being kept in memory
+UNCACHED_COLUMNS = {"hashed_password"}
+
+def credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+def user_id_from_token(token: str) -> int:
+    user_id = token_cache.get(token)
+    if user_id is not None:
+        return user_id
+
     try:
         payload = jwt.decode(
             token, settings.ALGORITHM, algorithms=["HS256"]
         )
         user_id: str = payload.get("sub")
         if user_id is None:
-            raise credentials_exception
+            raise credentials_exception()
     except JWTError:
-        raise credentials_exception
-    
-    user = db.query(User).filter(User.id == int(user_id)).first()
-    if user is None:
-        raise credentials_exception
+        raise credentials_exception()
+
+    expires_in = payload["exp"] - time.time() if "exp" in payload else None
+    token_cache.set(token, int(user_id), expires_in)
+    return int(user_id)
+
+def snapshot_user(user: User) -> dict:
+    return {
+        column.key: getattr(user, column.key)
+        for column in User.__table__.columns
+        if column.key not in UNCACHED_COLUMNS
+    }
+
+def user_from_snapshot(snapshot: dict) -> User:
+    """
+    Rebuild a detached User from cached column values. Merging it with
+    `load=False` attaches it to a session without emitting a SELECT.
+    """
+    user = User(**snapshot)
+    make_transient_to_detached(user)
     return user
 
+def inactive_user_exception() -> HTTPException:
+    return HTTPException(status_code=400, detail="Inactive user")
+
+def active_user(user: User) -> User:
+    """Reject deactivated accounts, e.g. one whose deletion is still purging."""
+    if not user.is_active:
+        raise inactive_user_exception()
+    return user
+
+def invalidate_cached_user(user_id: int) -> None:
+    """Forget the cached snapshot after the user row was updated or deleted."""
+    user_cache.pop(user_id)
+
+def get_current_user(
+    db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)
+) -> User:
+    user_id = user_id_from_token(token)
+    snapshot = user_cache.get(user_id)
+    if snapshot is not None:
+        if not snapshot["is_active"]:
+            raise inactive_user_exception()
+        return db.merge(user_from_snapshot(snapshot), load=False)
+
+    user = db.query(User).filter(User.id == user_id).first()
+    if user is None:
+        raise credentials_exception()
+    user_cache.set(user_id, snapshot_user(user))
+    return active_user(user)
+
+async def get_current_user_async(
+    db: AsyncSession = Depends(get_async_db), token: str = Depends(oauth2_scheme)
+) -> User:
+    """
+    Async counterpart of `get_current_user` for routes served with AsyncSession.
+    """
+    user_id = user_id_from_token(token)
+    snapshot = user_cache.get(user_id)
+    if snapshot is not None:
+        if not snapshot["is_active"]:
+            raise inactive_user_exception()
+        return await db.merge(user_from_snapshot(snapshot), load=False)
+
+    user = await db.get(User, user_id)
+    if user is None:
+        raise credentials_exception()
+    user_cache.set(user_id, snapshot_user(user))
+    return active_user(user)
+
 def get_current_active_user(
     current_user: User = Depends(get_current_user),
 ) -> User:
-    if not current_user.is_active:
-        raise HTTPException(status_code=400, detail="Inactive user")
-    return current_user
+    return active_user(current_user)
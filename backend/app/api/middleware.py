@@ -0,0 +1,56 @@
+"""
+ASGI middleware recording per-request latency, SQL query count and SQL time.
+"""
+import time
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core import metrics
+
+
+def route_label(scope: Scope) -> str:
+    """
+    The matched route template (e.g. `/api/v1/transactions/{transaction_id}`),
+    so ids don't explode the number of series.
+    """
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp, server_timing: bool = False):
+        self.app = app
+        self.server_timing = server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = metrics.RequestStats()
+        token = metrics.current_request.set(stats)
+        start = time.perf_counter()
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if self.server_timing:
+                    # Streaming bodies may run more SQL later; this is the work done up to the headers
+                    elapsed = time.perf_counter() - start
+                    headers = MutableHeaders(scope=message)
+                    headers.append(
+                        "Server-Timing",
+                        f'db;dur={stats.sql_seconds * 1000:.2f};desc="{stats.queries} queries", '
+                        f"app;dur={elapsed * 1000:.2f}",
+                    )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            metrics.current_request.reset(token)
+            metrics.record_request(
+                scope["method"], route_label(scope), status, time.perf_counter() - start, stats
+            )
@@ -0,0 +1,109 @@
+from datetime import datetime
+from typing import Any, List, Literal, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.db.session import get_async_db, get_db
+from app.api.caching import cached_json_response
+from app.db.repositories.analytics_repo import AnalyticsRepository
+from app.domain.analytics import build_cube
+from app.models.user import User
+from app.schemas.analytics import CubeResponse, Dimension, Measure
+from app.api.deps import get_current_user, get_current_user_async
+
+router = APIRouter()
+# Same endpoint served with AsyncSession, mounted instead of `router` when DB_MODE is "async"
+async_router = APIRouter()
+
+MAX_DIMENSIONS = 4
+
+def cube_response(
+    db: Session,
+    request: Request,
+    user_id: int,
+    dimensions: List[str],
+    measures: List[str],
+    piggy_bank_id: Optional[int],
+    start_date: Optional[datetime],
+    end_date: Optional[datetime],
+    top: Optional[int],
+    top_dimension: Optional[str],
+    top_by: str,
+):
+    if len(set(dimensions)) != len(dimensions) or len(set(measures)) != len(measures):
+        raise HTTPException(status_code=400, detail="Dimensions and measures must not repeat")
+    if len(dimensions) > MAX_DIMENSIONS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_DIMENSIONS} dimensions are supported")
+    if top is not None:
+        top_dimension = top_dimension or (dimensions[-1] if dimensions else None)
+        if top_dimension not in dimensions:
+            raise HTTPException(status_code=400, detail="top_dimension must be one of the requested dimensions")
+    else:
+        top_dimension = None
+
+    params = (
+        tuple(dimensions), tuple(measures), piggy_bank_id, start_date, end_date, top, top_dimension, top_by,
+    )
+    repo = AnalyticsRepository(db)
+    return cached_json_response(
+        request, db, user_id, "analytics_cube", params,
+        lambda: build_cube(
+            repo.cube(
+                user_id, dimensions, measures, piggy_bank_id, start_date, end_date,
+                top, top_dimension, top_by,
+            ),
+            dimensions,
+            measures,
+        ),
+    )
+
+@router.get("/cube", response_model=CubeResponse)
+def get_cube(
+    request: Request,
+    dimensions: List[Dimension] = Query(default=["month"]),
+    measures: List[Measure] = Query(default=["sum", "count"]),
+    piggy_bank_id: Optional[int] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    top: Optional[int] = Query(default=None, ge=1),
+    top_dimension: Optional[Dimension] = None,
+    top_by: Literal["sum", "count"] = "sum",
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> Any:
+    """
+    Slice the authenticated user's transactions by any combination of dimensions
+    (repeat `dimensions=`: day, week, month, quarter, year, weekday, piggy_bank,
+    currency, type, category) and measures (sum, count, avg, min, max).
+    With `top`, only the `top` largest members of `top_dimension` (default: the
+    last dimension) by absolute `top_by` are kept per combination of the other
+    dimensions, the rest being summed up as "Other".
+    Everything is computed in one SQL statement and returned column by column.
+    """
+    return cube_response(
+        db, request, current_user.id, dimensions, measures, piggy_bank_id,
+        start_date, end_date, top, top_dimension, top_by,
+    )
+
+@async_router.get("/cube", response_model=CubeResponse)
+async def get_cube_async(
+    request: Request,
+    dimensions: List[Dimension] = Query(default=["month"]),
+    measures: List[Measure] = Query(default=["sum", "count"]),
+    piggy_bank_id: Optional[int] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    top: Optional[int] = Query(default=None, ge=1),
+    top_dimension: Optional[Dimension] = None,
+    top_by: Literal["sum", "count"] = "sum",
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+) -> Any:
+    """
+    Slice the user's transactions by arbitrary dimensions and measures (async variant).
+    """
+    return await db.run_sync(
+        cube_response, request, current_user.id, dimensions, measures, piggy_bank_id,
+        start_date, end_date, top, top_dimension, top_by,
+    )
@@ -1,22 +1,53 @@
 from datetime import timedelta
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Response, status
 from fastapi.security import OAuth2PasswordRequestForm
+from sqlalchemy import func
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 from app.db.session import get_db
+from app.api.caching import invalidate_user
+from app.db.repositories.data_version_repo import DataVersionRepository
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate, UserResponse
 from app.schemas.token import Token
 from app.models.piggy_bank import PiggyBank
-from app.models.transaction import Transaction
-from app.models.category import Category
 from app.core import security
 from app.core.config import settings
-from app.api.deps import get_current_user
+from app.services.account_deletion import mark_user_deleting, needs_chunked_delete, purge_user
+from app.api.deps import get_current_user, invalidate_cached_user
 
 router = APIRouter()
 
+async def password_work(awaitable):
+    """
+    Await an offloaded hash/verify call, turning a full queue into a 503.
+    """
+    try:
+        return await awaitable
+    except security.PasswordHashingBusy:
+        raise HTTPException(
+            status_code=503,
+            detail="Too many concurrent password operations, please retry.",
+            headers={"Retry-After": "1"},
+        )
+
+def find_user_by_email_or_username(db: Session, email: str, username: str):
+    return db.query(User).filter((User.email == email) | (User.username == username)).first()
+
+def find_user_by_email(db: Session, email: str):
+    return db.query(User).filter(User.email == email).first()
+
+def save_user(db: Session, user: User) -> User:
+    db.add(user)
+    db.flush()
+    # Start from a fresh version, never from 0, in case the id belonged to a deleted user
+    DataVersionRepository(db).bump(user.id)
+    db.commit()
+    db.refresh(user)
+    return user
+
 @router.post("/register", response_model=UserResponse)
-def register_user(
+async def register_user(
     *,
     db: Session = Depends(get_db),
     user_in: UserCreate,
@@ -24,8 +55,9 @@ def register_user(
     """
     Register a new user account into the system.
     Validates against existing emails and usernames, hashes the password, and writes to SQLite.
+    Hashing runs in the password worker pool; DB work stays on the threadpool.
     """
-    user = db.query(User).filter((User.email == user_in.email) | (User.username == user_in.username)).first()
+    user = await run_in_threadpool(find_user_by_email_or_username, db, user_in.email, user_in.username)
     if user:
         raise HTTPException(
             status_code=400,
@@ -35,26 +67,30 @@ def register_user(
     user = User(
         username=user_in.username,
         email=user_in.email,
-        hashed_password=security.get_password_hash(user_in.password),
+        hashed_password=await password_work(security.hash_password_async(user_in.password)),
     )
-    db.add(user)
-    db.commit()
-    db.refresh(user)
-    return user
+    return await run_in_threadpool(save_user, db, user)
 
 @router.post("/login", response_model=Token)
-def login_access_token(
+async def login_access_token(
     db: Session = Depends(get_db), form_data: OAuth2PasswordRequestForm = Depends()
 ):
     """
     OAuth2 compatible token login system. 
     Returns a JWT Bearer token valid for 30 minutes to authenticate future REST requests.
+    Hashes created with a different bcrypt cost are transparently upgraded.
     """
-    user = db.query(User).filter(User.email == form_data.username).first()
-    if not user or not security.verify_password(form_data.password, user.hashed_password):
+    user = await run_in_threadpool(find_user_by_email, db, form_data.username)
+    if not user or not await password_work(
+        security.verify_password_async(form_data.password, user.hashed_password)
+    ):
         raise HTTPException(status_code=400, detail="Incorrect email or password")
     elif not user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
+
+    if security.needs_rehash(user.hashed_password):
+        user.hashed_password = await password_work(security.hash_password_async(form_data.password))
+        await run_in_threadpool(db.commit)
     
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     return {
@@ -88,6 +124,7 @@ def update_user(
         raise HTTPException(status_code=400, detail="Username already taken")
     current_user.username = user_in.username
     db.commit()
+    invalidate_cached_user(current_user.id)
     db.refresh(current_user)
     return current_user
 
@@ -96,19 +133,34 @@ def delete_user(
     *,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
+    response: Response,
+    background_tasks: BackgroundTasks,
 ):
     """
     Irreversibly delete the currently authenticated user's account.
     Cascades down and deletes all linked PiggyBanks, Transactions, and Categories.
+    Very large accounts are deactivated at once and purged in chunks after the
+    response (202 Accepted).
     """
-    piggy_banks = db.query(PiggyBank).filter(PiggyBank.user_id == current_user.id).all()
-    if piggy_banks:
-        pb_ids = [pb.id for pb in piggy_banks]
-        db.query(Transaction).filter(Transaction.piggy_bank_id.in_(pb_ids)).delete(synchronize_session=False)
-        db.query(PiggyBank).filter(PiggyBank.user_id == current_user.id).delete(synchronize_session=False)
-    
-    db.query(Category).filter(Category.user_id == current_user.id).delete(synchronize_session=False)
-    
+    user_id = current_user.id
+    transaction_count = db.query(func.coalesce(func.sum(PiggyBank.transaction_count), 0)).filter(
+        PiggyBank.user_id == user_id
+    ).scalar()
+
+    if needs_chunked_delete(transaction_count):
+        # Lock the account out now and persist the intent, so an interrupted
+        # purge can be resumed; the rows go once the purge reaches the user
+        mark_user_deleting(db, user_id)
+        db.commit()
+        invalidate_cached_user(user_id)
+        background_tasks.add_task(purge_user, user_id)
+        background_tasks.add_task(invalidate_user, user_id)
+        response.status_code = status.HTTP_202_ACCEPTED
+        return {"success": True, "status": "scheduled"}
+
+    # Piggy banks, transactions, categories and derived rows follow via ON DELETE CASCADE
     db.delete(current_user)
     db.commit()
+    invalidate_user(user_id)
+    invalidate_cached_user(user_id)
     return {"success": True}
@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 from typing import List
 
 from app.db.session import get_db
+from app.db.repositories.data_version_repo import DataVersionRepository
 from app.models.category import Category
 from app.schemas.category import CategoryCreate, CategoryRead, CategoryUpdate
 from app.api.deps import get_current_user
@@ -31,6 +32,7 @@ def add_category(
     
     category = Category(name=payload.name, user_id=current_user.id)
     db.add(category)
+    DataVersionRepository(db).bump(current_user.id)
     db.commit()
     db.refresh(category)
     return category
@@ -50,6 +52,7 @@ def update_category(
         raise HTTPException(status_code=404, detail="Category not found")
         
     category.name = payload.new_name
+    DataVersionRepository(db).bump(current_user.id)
     db.commit()
     db.refresh(category)
     return category
@@ -68,5 +71,6 @@ def delete_category(
         raise HTTPException(status_code=404, detail="Category not found")
         
     db.delete(category)
+    DataVersionRepository(db).bump(current_user.id)
     db.commit()
     return {"success": True}
@@ -0,0 +1,71 @@
+import os
+import tempfile
+from datetime import datetime
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import FileResponse, StreamingResponse
+from sqlalchemy.orm import Session
+from starlette.background import BackgroundTask
+
+from app.db.session import get_db
+from app.api.deps import get_current_user
+from app.api.v1.transactions import get_user_piggy_bank
+from app.db.repositories.transaction_repo import TransactionRepository
+from app.models.user import User
+from app.services.transaction_export import (
+    EXPORT_FORMATS, MEDIA_TYPES, iter_csv, iter_ndjson, write_parquet
+)
+
+router = APIRouter()
+
+@router.get("/transactions")
+def export_transactions(
+    format: str = Query("csv", pattern=f"^({'|'.join(EXPORT_FORMATS)})$"),
+    piggy_bank_id: Optional[int] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Export the authenticated user's transactions, optionally for one PiggyBank
+    and a date range. CSV and NDJSON are streamed straight from a server-side
+    cursor, so memory stays bounded and the first bytes go out immediately.
+    Parquet (requires `pyarrow`) is written batch by batch to a temporary file.
+    """
+    if piggy_bank_id is not None:
+        get_user_piggy_bank(db, piggy_bank_id, current_user.id)
+
+    repo = TransactionRepository(db)
+    columns = repo.EXPORT_COLUMNS
+    filename = f"transactions.{format}"
+
+    def rows():
+        # FastAPI closes the request session before streaming starts; a closed
+        # Session transparently checks out a new connection, released here.
+        try:
+            yield from repo.iter_for_export(current_user.id, piggy_bank_id, start_date, end_date)
+        finally:
+            db.close()
+
+    if format == "parquet":
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise HTTPException(status_code=501, detail="Parquet export requires the optional 'pyarrow' package")
+        fd, path = tempfile.mkstemp(suffix=".parquet")
+        os.close(fd)
+        write_parquet(path, rows())
+        return FileResponse(
+            path,
+            media_type=MEDIA_TYPES[format],
+            filename=filename,
+            background=BackgroundTask(os.remove, path),
+        )
+
+    serializer = iter_csv if format == "csv" else iter_ndjson
+    return StreamingResponse(
+        serializer(columns, rows()),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -0,0 +1,61 @@
+import csv
+import io
+import logging
+import os
+from typing import Optional
+from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
+from pydantic import ValidationError
+from sqlalchemy.orm import Session
+
+from app.db.session import get_db
+from app.api.deps import get_current_user
+from app.api.v1.transactions import get_user_piggy_bank
+from app.models.user import User
+from app.schemas.statement_import import ColumnMapping, StatementImportResult
+from app.services.statement_import import SUPPORTED_FORMATS, import_statement
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+@router.post("/piggy-banks/{pb_id}/imports", response_model=StatementImportResult)
+def import_statement_file(
+    pb_id: int,
+    file: UploadFile = File(...),
+    format: Optional[str] = Form(None),
+    mapping: Optional[str] = Form(None),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Import a CSV, OFX or QIF bank statement into a PiggyBank owned by the user.
+    The upload is parsed as a stream and inserted in bounded chunks; `mapping`
+    is an optional JSON ColumnMapping for CSV headers. Rejected rows are
+    reported without aborting the rest of the import.
+    """
+    get_user_piggy_bank(db, pb_id, current_user.id)
+
+    fmt = (format or os.path.splitext(file.filename or "")[1].lstrip(".")).lower()
+    if fmt not in SUPPORTED_FORMATS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported statement format. Use one of: {', '.join(SUPPORTED_FORMATS)}",
+        )
+    try:
+        column_mapping = ColumnMapping.model_validate_json(mapping) if mapping else ColumnMapping()
+    except ValidationError as e:
+        raise HTTPException(status_code=400, detail=e.errors(include_url=False, include_context=False))
+
+    # Starlette spools large uploads to disk, so this wrapper reads lazily from a file
+    stream = io.TextIOWrapper(file.file, encoding=column_mapping.encoding, errors="replace", newline="")
+
+    def log_progress(imported: int, rejected: int):
+        logger.info("Statement import into piggy bank %s: %s imported, %s rejected", pb_id, imported, rejected)
+
+    try:
+        return import_statement(
+            db, current_user.id, pb_id, stream, fmt, column_mapping, progress=log_progress
+        )
+    except (ValueError, csv.Error) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    finally:
+        stream.detach()
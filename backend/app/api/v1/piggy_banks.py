@@ -1,10 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, Response, status
 from sqlalchemy.orm import Session
 
 from app.db.session import get_db
+from app.api.caching import cached_json_response
+from app.db.repositories.data_version_repo import DataVersionRepository
 from app.db.repositories.piggy_bank_repo import PiggyBankRepository
-from app.domain.piggy_banks import create_piggy_bank, list_piggy_banks
-from app.schemas.piggy_bank import PiggyBankCreate, PiggyBankRead
+from app.domain.piggy_banks import create_piggy_bank, list_piggy_banks, list_piggy_bank_summaries
+from app.services.account_deletion import needs_chunked_delete, purge_piggy_bank
+from app.schemas.piggy_bank import PiggyBankCreate, PiggyBankRead, PiggyBankSummary
 from app.api.deps import get_current_user
 from app.models.user import User
 
@@ -20,6 +23,8 @@ def create(
     Create a new PiggyBank account for the currently authenticated user.
     """
     repo = PiggyBankRepository(db)
+    # Staged in the same DB transaction that the repository commits
+    DataVersionRepository(db).bump(current_user.id)
     try:
         return create_piggy_bank(
             user_id=current_user.id,
@@ -42,19 +47,49 @@ def list_all(
     repo = PiggyBankRepository(db)
     return list_piggy_banks(current_user.id, repo)
 
+@router.get("/balances", response_model=list[PiggyBankSummary])
+def list_balances(
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Fetch all PiggyBank accounts of the current user together with their balance,
+    transaction count and last activity date, in a single query.
+    """
+    repo = PiggyBankRepository(db)
+    return cached_json_response(
+        request, db, current_user.id, "piggy_bank_balances", (),
+        lambda: list_piggy_bank_summaries(current_user.id, repo),
+    )
+
 @router.delete("/{pb_id}")
 def delete_piggy_bank_api(
     pb_id: int,
+    response: Response,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """
     Delete a specific PiggyBank account, cascading deletion to all its transactions.
+    Very large accounts are purged in chunks after the response (202 Accepted).
     """
     repo = PiggyBankRepository(db)
     pb = repo.get_by_id(current_user.id, pb_id)
     if not pb:
         raise HTTPException(status_code=404, detail="Piggy bank not found")
-        
+
+    if needs_chunked_delete(pb.transaction_count):
+        # Hide the bank now and persist the intent, so an interrupted purge can be resumed
+        if not repo.mark_deleting(pb.id):
+            raise HTTPException(status_code=404, detail="Piggy bank not found")
+        DataVersionRepository(db).bump(current_user.id)
+        db.commit()
+        background_tasks.add_task(purge_piggy_bank, current_user.id, pb.id)
+        response.status_code = status.HTTP_202_ACCEPTED
+        return {"success": True, "status": "scheduled"}
+
+    DataVersionRepository(db).bump(current_user.id)
     repo.delete(pb)
     return {"success": True}
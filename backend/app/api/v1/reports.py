@@ -1,72 +1,105 @@
 """
 API Routes - Reports and Analytics
 """
-from fastapi import APIRouter, HTTPException, Query
-from typing import Optional
-from app.core.transactions import TransactionManager
-from app.core.reports import ReportGenerator
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy.orm import Session
+
+from app.db.session import get_db
+from app.api.caching import cached_json_response
+from app.api.deps import get_current_user
+from app.api.v1.transactions import get_user_piggy_bank
+from app.models.user import User
+from app.services.reporting import SQLReportGenerator
 
 router = APIRouter()
 
 
-@router.get("/accounts/{account_name}/piggy-banks/{piggy_bank_name}/reports/monthly")
-async def get_monthly_report(
-    account_name: str,
-    piggy_bank_name: str,
-    year: int,
-    month: int
+def naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Transaction dates are stored as naive UTC; bring aware bounds in line."""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def report_response(
+    db: Session,
+    request: Request,
+    user_id: int,
+    pb_id: int,
+    endpoint: str,
+    params: tuple,
+    build: Callable[[SQLReportGenerator], Any],
 ):
-    """Generate monthly financial report"""
+    def compute():
+        report = build(SQLReportGenerator(db, pb_id))
+        # Persist any checkpoints materialized for the opening balance
+        db.commit()
+        return report
+
+    # Ownership is checked before the ETag and the cache, so foreign ids get 404, never 304
+    return cached_json_response(
+        request, db, user_id, endpoint, (pb_id,) + params, compute,
+        authorize=lambda: get_user_piggy_bank(db, pb_id, user_id),
+    )
+
+
+@router.get("/piggy-banks/{pb_id}/reports/monthly")
+def get_monthly_report(
+    pb_id: int,
+    year: int,
+    month: int,
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> Any:
+    """
+    Generate monthly financial report: opening and closing balance, income,
+    expenses and the per-category breakdowns (savings transfers excluded from expenses).
+    """
     if not (1 <= month <= 12):
         raise HTTPException(status_code=400, detail="Month must be between 1 and 12")
-    
-    tm = TransactionManager(account_name, piggy_bank_name)
-    load_result = tm.load_from_csv(year)
-    
-    if not load_result["success"]:
-        raise HTTPException(status_code=404, detail=load_result["error"])
-    
-    report_gen = ReportGenerator(tm)
-    report = report_gen.generate_monthly_report(year, month)
-    
-    return report
+    return report_response(
+        db, request, current_user.id, pb_id, "report_monthly", (year, month),
+        lambda reports: reports.generate_monthly_report(year, month),
+    )
 
 
-@router.get("/accounts/{account_name}/piggy-banks/{piggy_bank_name}/reports/yearly")
-async def get_yearly_report(
-    account_name: str,
-    piggy_bank_name: str,
-    year: int
-):
-    """Generate yearly financial report"""
-    tm = TransactionManager(account_name, piggy_bank_name)
-    load_result = tm.load_from_csv(year)
-    
-    if not load_result["success"]:
-        raise HTTPException(status_code=404, detail=load_result["error"])
-    
-    report_gen = ReportGenerator(tm)
-    report = report_gen.generate_yearly_report(year)
-    
-    return report
+@router.get("/piggy-banks/{pb_id}/reports/yearly")
+def get_yearly_report(
+    pb_id: int,
+    year: int,
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> Any:
+    """Generate yearly financial report, including a summary for each of the 12 months"""
+    return report_response(
+        db, request, current_user.id, pb_id, "report_yearly", (year,),
+        lambda reports: reports.generate_yearly_report(year),
+    )
 
 
-@router.get("/accounts/{account_name}/piggy-banks/{piggy_bank_name}/reports/category-summary")
-async def get_category_summary(
-    account_name: str,
-    piggy_bank_name: str,
-    start_date: Optional[str] = Query(None),
-    end_date: Optional[str] = Query(None),
-    year: Optional[int] = Query(None)
-):
-    """Get spending summary by category"""
-    tm = TransactionManager(account_name, piggy_bank_name)
-    load_result = tm.load_from_csv(year)
-    
-    if not load_result["success"]:
-        raise HTTPException(status_code=404, detail=load_result["error"])
-    
-    report_gen = ReportGenerator(tm)
-    summary = report_gen.get_category_summary(start_date, end_date)
-    
-    return summary
+@router.get("/piggy-banks/{pb_id}/reports/category-summary")
+def get_category_summary(
+    pb_id: int,
+    request: Request,
+    start_date: Optional[datetime] = Query(None),
+    end_date: Optional[datetime] = Query(None),
+    year: Optional[int] = Query(None),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> Any:
+    """
+    Get spending summary by category. Both dates are inclusive; `year`
+    further limits the range to that calendar year.
+    """
+    start_date, end_date = naive_utc(start_date), naive_utc(end_date)
+    if year is not None:
+        start_date = max(start_date or datetime.min, datetime(year, 1, 1))
+        end_date = min(end_date or datetime.max, datetime(year, 12, 31, 23, 59, 59, 999999))
+    return report_response(
+        db, request, current_user.id, pb_id, "report_categories", (start_date, end_date),
+        lambda reports: reports.get_category_summary(start_date, end_date),
+    )
@@ -0,0 +1,52 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+
+from app.api.caching import response_cache
+from app.api.deps import get_current_user, token_cache, user_cache
+from app.core import metrics
+from app.models.user import User
+
+router = APIRouter()
+# Served at the root, where Prometheus scrapes by default
+metrics_router = APIRouter()
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+@router.get("/cache-stats")
+def get_cache_stats(current_user: User = Depends(get_current_user)):
+    """
+    Report size and hit rate of this worker's in-process caches.
+    """
+    return cache_stats()
+
+def cache_stats():
+    return {
+        "responses": response_cache.stats(),
+        "users": user_cache.stats(),
+        "tokens": token_cache.stats(),
+    }
+
+def cache_metric_lines():
+    stats = cache_stats()
+    lines = []
+    for field, kind, documentation in (
+        ("size", "gauge", "Entries held by an in-process cache."),
+        ("hits", "counter", "Cache lookups that found an entry."),
+        ("misses", "counter", "Cache lookups that found no valid entry."),
+    ):
+        lines += metrics.samples(
+            f"app_cache_{field}" if kind == "gauge" else f"app_cache_{field}_total",
+            documentation,
+            kind,
+            [({"cache": name}, values[field]) for name, values in stats.items()],
+        )
+    return lines
+
+@metrics_router.get("/metrics", include_in_schema=False)
+def get_metrics():
+    """
+    Request, SQL and cache metrics of this worker in the Prometheus text format.
+    """
+    return PlainTextResponse(
+        metrics.render(cache_metric_lines()), media_type=PROMETHEUS_CONTENT_TYPE
+    )
@@ -1,66 +1,263 @@
-from fastapi import APIRouter, Depends, HTTPException
+import base64
+import binascii
+import json
+from datetime import date, datetime, time, timedelta
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
-from app.db.session import get_db
+from app.core.config import settings
+from app.db import fts
+from app.db.session import get_async_db, get_db
+from app.api.caching import cached_json_response
+from app.db.repositories.checkpoint_repo import CheckpointRepository
+from app.db.repositories.data_version_repo import DataVersionRepository
+from app.db.repositories.transaction_repo import TransactionRepository
 from app.models.transaction import Transaction
 from app.models.piggy_bank import PiggyBank
-from app.schemas.transaction import TransactionCreate, TransactionRead
-from app.api.deps import get_current_user
+from app.schemas.transaction import (
+    TransactionCreate, TransactionRead, TransactionPage, TransactionBatchResult
+)
+from app.api.deps import get_current_user, get_current_user_async
 from app.models.user import User
 
 router = APIRouter()
+# Same endpoints served with AsyncSession, mounted instead of `router` when DB_MODE is "async"
+async_router = APIRouter()
 
 def get_user_piggy_bank(db: Session, pb_id: int, user_id: int):
     pb = db.query(PiggyBank).filter(
-        PiggyBank.id == pb_id, PiggyBank.user_id == user_id
+        PiggyBank.id == pb_id, PiggyBank.user_id == user_id, PiggyBank.deleting.is_(False)
     ).first()
     if not pb:
         raise HTTPException(status_code=404, detail="Piggy bank not found or not owned by user")
     return pb
 
-@router.post("/piggy-banks/{pb_id}/transactions", response_model=TransactionRead)
-def add_transaction(
-    pb_id: int,
-    payload: TransactionCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-):
+def encode_cursor(position) -> str:
+    raw = json.dumps(list(position)).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+def decode_cursor(cursor: str):
+    try:
+        raw_date, tx_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        if not isinstance(raw_date, str) or not isinstance(tx_id, int):
+            raise ValueError
+    except (ValueError, TypeError, binascii.Error, UnicodeEncodeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return raw_date, tx_id
+
+class TransactionFilters:
     """
-    Add a new localized financial transaction (expense, deposit, income) 
-    to a specific PiggyBank owned by the user.
+    Optional query-string filters shared by the transaction listing endpoints.
     """
-    get_user_piggy_bank(db, pb_id, current_user.id)
-    
+    def __init__(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        type: Optional[str] = None,
+        category: Optional[str] = None,
+        min_amount: Optional[float] = None,
+        max_amount: Optional[float] = None,
+    ):
+        self.start_date = start_date
+        self.end_date = end_date
+        self.type = type
+        self.category = category
+        self.min_amount = min_amount
+        self.max_amount = max_amount
+
+# ---------------------------------------------------------------------------
+# Route logic, shared by the sync routes and (through `run_sync`) the async ones
+# ---------------------------------------------------------------------------
+
+def create_transaction(db: Session, user_id: int, pb_id: int, payload: TransactionCreate) -> Transaction:
+    get_user_piggy_bank(db, pb_id, user_id)
+
     transaction = Transaction(
         piggy_bank_id=pb_id,
         amount=payload.amount,
         type=payload.type,
         category=payload.category,
         description=payload.description,
+        date=payload.date,
     )
-    if payload.date:
-        transaction.date = payload.date
 
-    db.add(transaction)
+    TransactionRepository(db).add(transaction)
+    DataVersionRepository(db).bump(user_id)
     db.commit()
     db.refresh(transaction)
     return transaction
 
+def create_transactions_batch(db: Session, user_id: int, pb_id: int, items: List[Dict[str, Any]]):
+    if len(items) > settings.TRANSACTION_BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"A batch may contain at most {settings.TRANSACTION_BATCH_MAX_ITEMS} items",
+        )
+    get_user_piggy_bank(db, pb_id, user_id)
+
+    payloads, errors = [], []
+    for index, item in enumerate(items):
+        try:
+            payloads.append(TransactionCreate.model_validate(item))
+        except ValidationError as e:
+            errors.append({"index": index, "detail": e.errors(include_url=False, include_context=False)})
+
+    created_ids = TransactionRepository(db).add_many(pb_id, payloads)
+    if created_ids:
+        DataVersionRepository(db).bump(user_id)
+        db.commit()
+
+    return {"created_ids": created_ids, "errors": errors}
+
+def list_transactions(db: Session, user_id: int, pb_id: int, filters: TransactionFilters):
+    get_user_piggy_bank(db, pb_id, user_id)
+    return TransactionRepository(db).filtered(pb_id, **vars(filters)).all()
+
+def list_transactions_page(
+    db: Session, user_id: int, pb_id: int, limit: int, cursor: Optional[str], filters: TransactionFilters
+):
+    get_user_piggy_bank(db, pb_id, user_id)
+    after = decode_cursor(cursor) if cursor else None
+
+    repo = TransactionRepository(db)
+    items, last = repo.page(repo.filtered(pb_id, **vars(filters)), limit, after)
+    return {
+        "items": items,
+        "next_cursor": encode_cursor(last) if last else None,
+    }
+
+def search_user_transactions(db: Session, user_id: int, q: str, pb_id: Optional[int], limit: int):
+    match = fts.match_query(q)
+    if match is None:
+        raise HTTPException(status_code=400, detail="Search query must contain at least one word")
+    if pb_id is not None:
+        get_user_piggy_bank(db, pb_id, user_id)
+
+    return TransactionRepository(db).search(user_id, match, pb_id, limit)
+
+def remove_transaction(db: Session, user_id: int, transaction_id: int):
+    transaction = db.query(Transaction).join(PiggyBank).filter(
+        Transaction.id == transaction_id,
+        PiggyBank.user_id == user_id,
+        PiggyBank.deleting.is_(False)
+    ).first()
+
+    if not transaction:
+        raise HTTPException(status_code=404, detail="Transaction not found")
+
+    TransactionRepository(db).delete(transaction)
+    DataVersionRepository(db).bump(user_id)
+    db.commit()
+    return {"success": True}
+
+def balance_response(db: Session, request: Request, user_id: int, pb_id: int, as_of: Optional[date]):
+    def compute():
+        if as_of is None:
+            pb = db.get(PiggyBank, pb_id)
+            return {
+                "balance": float(pb.balance or 0.0),
+                "transaction_count": pb.transaction_count or 0,
+            }
+
+        before = datetime.combine(as_of + timedelta(days=1), time.min)
+        balance, count = CheckpointRepository(db).balance_before(pb_id, before)
+        # Persist any checkpoints materialized by this lookup
+        db.commit()
+        return {
+            "as_of": as_of,
+            "balance": float(balance),
+            "transaction_count": count,
+        }
+
+    # Ownership is checked before the ETag and the cache, so foreign ids get 404, never 304
+    return cached_json_response(
+        request, db, user_id, "balance", (pb_id, as_of), compute,
+        authorize=lambda: get_user_piggy_bank(db, pb_id, user_id),
+    )
+
+
+# -----------
+# Sync routes
+# -----------
+
+@router.post("/piggy-banks/{pb_id}/transactions", response_model=TransactionRead)
+def add_transaction(
+    pb_id: int,
+    payload: TransactionCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Add a new localized financial transaction (expense, deposit, income) 
+    to a specific PiggyBank owned by the user.
+    """
+    return create_transaction(db, current_user.id, pb_id, payload)
+
+
+@router.post("/piggy-banks/{pb_id}/transactions:batch", response_model=TransactionBatchResult)
+def add_transactions_batch(
+    pb_id: int,
+    items: List[Dict[str, Any]] = Body(...),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Add many transactions to a PiggyBank in one request.
+    Ownership is checked once, every item is validated independently, and the
+    valid items are bulk inserted in a single DB transaction. Invalid items
+    are reported by index instead of failing the whole batch.
+    """
+    return create_transactions_batch(db, current_user.id, pb_id, items)
+
 
 @router.get("/piggy-banks/{pb_id}/transactions", response_model=List[TransactionRead])
 def get_transactions(
     pb_id: int,
+    filters: TransactionFilters = Depends(),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """
     Retrieve all transactions (ordered chronologically descending) 
     for a specific PiggyBank owned by the user.
+    Prefer the paginated listing for large piggy banks.
     """
-    get_user_piggy_bank(db, pb_id, current_user.id)
-    return db.query(Transaction).filter(Transaction.piggy_bank_id == pb_id).order_by(Transaction.date.desc()).all()
+    return list_transactions(db, current_user.id, pb_id, filters)
+
+
+@router.get("/piggy-banks/{pb_id}/transactions/paged", response_model=TransactionPage)
+def get_transactions_page(
+    pb_id: int,
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = None,
+    filters: TransactionFilters = Depends(),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Retrieve one page of a PiggyBank's transactions, newest first.
+    Uses keyset pagination on (date, id): pass the returned `next_cursor` back
+    to continue, which keeps every page a bounded index range scan.
+    """
+    return list_transactions_page(db, current_user.id, pb_id, limit, cursor, filters)
+
+
+@router.get("/transactions/search", response_model=List[TransactionRead])
+def search_transactions(
+    q: str = Query(..., min_length=1, max_length=200),
+    piggy_bank_id: Optional[int] = None,
+    limit: int = Query(50, ge=1, le=200),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Full-text search over the descriptions and categories of the user's transactions.
+    Every word is matched as a prefix; results are ranked by relevance (bm25).
+    """
+    return search_user_transactions(db, current_user.id, q, piggy_bank_id, limit)
 
 
 @router.delete("/transactions/{transaction_id}")
@@ -72,34 +269,120 @@ def delete_transaction(
     """
     Delete a specific transaction belonging to any nested PiggyBank owned by the User.
     """
-    transaction = db.query(Transaction).join(PiggyBank).filter(
-        Transaction.id == transaction_id,
-        PiggyBank.user_id == current_user.id
-    ).first()
-    
-    if not transaction:
-        raise HTTPException(status_code=404, detail="Transaction not found")
-        
-    db.delete(transaction)
-    db.commit()
-    return {"success": True}
+    return remove_transaction(db, current_user.id, transaction_id)
 
 
 @router.get("/piggy-banks/{pb_id}/balance")
 def get_balance(
     pb_id: int,
+    request: Request,
+    as_of: Optional[date] = Query(None, description="Closing balance at the end of this day"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
-    Dynamically calculate and return the summation of all transactions 
-    to determine the active numeric balance of a PiggyBank.
+    Return the active numeric balance of a PiggyBank.
+    The running balance and count are stored on the PiggyBank row and kept in
+    step with every ledger write, so this is a single primary-key lookup.
+    With `as_of`, the balance at the end of that day is derived from the
+    closest monthly checkpoint plus the transactions since.
     """
-    get_user_piggy_bank(db, pb_id, current_user.id)
-    total = db.query(func.sum(Transaction.amount)).filter(Transaction.piggy_bank_id == pb_id).scalar()
-    count = db.query(func.count(Transaction.id)).filter(Transaction.piggy_bank_id == pb_id).scalar()
-    
-    return {
-        "balance": float(total or 0.0),
-        "transaction_count": count or 0,
-    }
+    return balance_response(db, request, current_user.id, pb_id, as_of)
+
+
+# ------------
+# Async routes
+# ------------
+
+@async_router.post("/piggy-banks/{pb_id}/transactions", response_model=TransactionRead)
+async def add_transaction_async(
+    pb_id: int,
+    payload: TransactionCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    """
+    Add a new transaction to a PiggyBank owned by the user (async variant).
+    """
+    return await db.run_sync(create_transaction, current_user.id, pb_id, payload)
+
+
+@async_router.post("/piggy-banks/{pb_id}/transactions:batch", response_model=TransactionBatchResult)
+async def add_transactions_batch_async(
+    pb_id: int,
+    items: List[Dict[str, Any]] = Body(...),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    """
+    Add many transactions to a PiggyBank in one request (async variant).
+    """
+    return await db.run_sync(create_transactions_batch, current_user.id, pb_id, items)
+
+
+@async_router.get("/piggy-banks/{pb_id}/transactions", response_model=List[TransactionRead])
+async def get_transactions_async(
+    pb_id: int,
+    filters: TransactionFilters = Depends(),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    """
+    Retrieve all transactions of a PiggyBank, newest first (async variant).
+    """
+    return await db.run_sync(list_transactions, current_user.id, pb_id, filters)
+
+
+@async_router.get("/piggy-banks/{pb_id}/transactions/paged", response_model=TransactionPage)
+async def get_transactions_page_async(
+    pb_id: int,
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = None,
+    filters: TransactionFilters = Depends(),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    """
+    Retrieve one keyset-paginated page of a PiggyBank's transactions (async variant).
+    """
+    return await db.run_sync(list_transactions_page, current_user.id, pb_id, limit, cursor, filters)
+
+
+@async_router.get("/transactions/search", response_model=List[TransactionRead])
+async def search_transactions_async(
+    q: str = Query(..., min_length=1, max_length=200),
+    piggy_bank_id: Optional[int] = None,
+    limit: int = Query(50, ge=1, le=200),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    """
+    Full-text search over the user's transactions (async variant).
+    """
+    return await db.run_sync(search_user_transactions, current_user.id, q, piggy_bank_id, limit)
+
+
+@async_router.delete("/transactions/{transaction_id}")
+async def delete_transaction_async(
+    transaction_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    """
+    Delete a transaction owned by the user (async variant).
+    """
+    return await db.run_sync(remove_transaction, current_user.id, transaction_id)
+
+
+@async_router.get("/piggy-banks/{pb_id}/balance")
+async def get_balance_async(
+    pb_id: int,
+    request: Request,
+    as_of: Optional[date] = Query(None, description="Closing balance at the end of this day"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    """
+    Return the balance of a PiggyBank, optionally as of a day (async variant).
+    """
+    return await db.run_sync(balance_response, request, current_user.id, pb_id, as_of)
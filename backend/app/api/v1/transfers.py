@@ -1,23 +1,22 @@
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from datetime import datetime
 
-from app.db.session import get_db
+from app.db.session import get_async_db, get_db
+from app.db.repositories.data_version_repo import DataVersionRepository
+from app.db.repositories.transaction_repo import TransactionRepository
 from app.models.transaction import Transaction
 from app.models.piggy_bank import PiggyBank
 from app.schemas.transaction import TransferCreate, TransactionRead
-from app.api.deps import get_current_user
+from app.api.deps import get_current_user, get_current_user_async
 from app.models.user import User
 
 router = APIRouter()
+# Same endpoints served with AsyncSession, mounted instead of `router` when DB_MODE is "async"
+async_router = APIRouter()
 
-@router.post("", response_model=dict)
-def transfer_funds(
-    payload: TransferCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-):
-    """Transfer funds between two piggy banks"""
+def execute_transfer(db: Session, user_id: int, payload: TransferCreate):
     if payload.amount <= 0:
         raise HTTPException(status_code=400, detail="Transfer amount must be positive")
     if payload.source_piggy_bank_id == payload.target_piggy_bank_id:
@@ -25,10 +24,12 @@ def transfer_funds(
 
     # Verify ownership of both piggy banks
     source_pb = db.query(PiggyBank).filter(
-        PiggyBank.id == payload.source_piggy_bank_id, PiggyBank.user_id == current_user.id
+        PiggyBank.id == payload.source_piggy_bank_id, PiggyBank.user_id == user_id,
+        PiggyBank.deleting.is_(False)
     ).first()
     target_pb = db.query(PiggyBank).filter(
-        PiggyBank.id == payload.target_piggy_bank_id, PiggyBank.user_id == current_user.id
+        PiggyBank.id == payload.target_piggy_bank_id, PiggyBank.user_id == user_id,
+        PiggyBank.deleting.is_(False)
     ).first()
 
     if not source_pb or not target_pb:
@@ -56,8 +57,10 @@ def transfer_funds(
             date=now
         )
 
-        db.add(debit_tx)
-        db.add(credit_tx)
+        repo = TransactionRepository(db)
+        repo.add(debit_tx)
+        repo.add(credit_tx)
+        DataVersionRepository(db).bump(user_id)
         db.commit()
         
         return {
@@ -67,3 +70,23 @@ def transfer_funds(
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=500, detail=f"Transfer failed: {str(e)}")
+
+
+@router.post("", response_model=dict)
+def transfer_funds(
+    payload: TransferCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """Transfer funds between two piggy banks"""
+    return execute_transfer(db, current_user.id, payload)
+
+
+@async_router.post("", response_model=dict)
+async def transfer_funds_async(
+    payload: TransferCreate,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user_async),
+):
+    """Transfer funds between two piggy banks (async variant)"""
+    return await db.run_sync(execute_transfer, current_user.id, payload)
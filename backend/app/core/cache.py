@@ -0,0 +1,178 @@
+"""
+In-process caching primitives
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+
+class LRUCache:
+    """
+    Thread-safe, size-bounded LRU mapping with hit/miss counters.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            if key not in self._data:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return self._data[key]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def discard_where(self, predicate) -> None:
+        """Drop every entry whose key matches the predicate."""
+        with self._lock:
+            for key in [k for k in self._data if predicate(k)]:
+                del self._data[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+class VersionedCache(LRUCache):
+    """
+    LRU cache whose entries are only valid for the version they were stored with.
+    A lookup with a newer version counts as a miss and the stale entry is dropped.
+    """
+
+    def get(self, key: Hashable, version: int = 0) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] != version:
+                if entry is not None:
+                    del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any, version: int = 0) -> None:
+        super().set(key, (version, value))
+
+
+class TTLCache(LRUCache):
+    """
+    LRU cache whose entries also expire `ttl` seconds after being stored.
+    An expired lookup counts as a miss and the entry is dropped.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0, clock=time.monotonic):
+        super().__init__(maxsize)
+        self.ttl = ttl
+        self._clock = clock
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] <= self._clock():
+                if entry is not None:
+                    del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store `value` for `ttl` seconds (default: the cache-wide ttl)."""
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if ttl <= 0:
+            return
+        super().set(key, (self._clock() + ttl, value))
+
+
+class SizedLRUCache(LRUCache):
+    """
+    LRU cache bounded by the total size of its values rather than their number.
+    Entries are stored with a version like VersionedCache; values larger than
+    the whole budget are not cached at all.
+    """
+
+    def __init__(self, max_bytes: int, sizeof: Callable[[Any], int]):
+        super().__init__(maxsize=0)
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._sizeof = sizeof
+
+    def _discard(self, key: Hashable) -> None:
+        entry = self._data.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry[1]
+
+    def get(self, key: Hashable, version: Hashable = 0) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] != version:
+                self._discard(key)
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+
+    def set(self, key: Hashable, value: Any, version: Hashable = 0) -> None:
+        size = self._sizeof(value)
+        with self._lock:
+            self._discard(key)
+            if size > self.max_bytes:
+                return
+            self._data[key] = (version, size, value)
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                self._discard(next(iter(self._data)))
+
+    def pop(self, key: Hashable) -> None:
+        with self._lock:
+            self._discard(key)
+
+    def discard_where(self, predicate) -> None:
+        with self._lock:
+            for key in [k for k in self._data if predicate(k)]:
+                self._discard(key)
+
+    def clear(self) -> None:
+        super().clear()
+        self.bytes = 0
+
+    def stats(self) -> dict:
+        stats = super().stats()
+        with self._lock:
+            stats.update(maxsize=None, bytes=self.bytes, max_bytes=self.max_bytes)
+        return stats
@@ -33,6 +33,11 @@ class Settings(BaseSettings):
     BASE_DIR: Path = Path(__file__).parent.parent.parent.parent
     DATA_BASE_DIR: str = "./data"
     USER_DATA_DIR: str = "./data/user"
+    # Year-file format for TransactionManager: "parquet", "feather" or "csv"
+    # (Parquet and Feather need pyarrow; convert old trees with manage.py convert-transaction-files)
+    TRANSACTION_STORAGE: str = "parquet"
+    # Memory budget for year partitions that TransactionManager keeps loaded (per process)
+    TRANSACTION_PARTITION_CACHE_MB: int = 256
     CONFIG_FILE: str = "./config/config.yaml"
     
     # ------------
@@ -47,12 +52,60 @@ class Settings(BaseSettings):
     # Database
     # --------
     DATABASE_URL: str = "sqlite:///./data/bookkeeping.db"
+    # Refuse to start unless the schema is at the latest migration
+    DB_SCHEMA_CHECK: bool = True
+    TRANSACTION_BATCH_MAX_ITEMS: int = 10000
+    # Accounts with more transactions are deleted in the background, this many per write
+    ACCOUNT_DELETE_CHUNK_SIZE: int = 5000
+    # "sync" serves the hot routes from the threadpool with Session,
+    # "async" serves them on the event loop with AsyncSession (aiosqlite)
+    DB_MODE: str = "sync"
+    # Connection pool (ignored for in-memory SQLite)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = -1
+    # SQLite PRAGMAs applied to every new connection
+    SQLITE_JOURNAL_MODE: str = "WAL"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_CACHE_SIZE: int = -65536  # Negative values are KiB, i.e. 64 MiB
+    SQLITE_MMAP_SIZE: int = 268435456  # 256 MiB
+    SQLITE_TEMP_STORE: str = "MEMORY"
+    SQLITE_FOREIGN_KEYS: bool = True
+    
+    # -----
+    # Cache
+    # -----
+    RESPONSE_CACHE_SIZE: int = 1024
+    # Authenticated user snapshots; the TTL bounds staleness across workers
+    AUTH_USER_CACHE_SIZE: int = 1024
+    AUTH_USER_CACHE_TTL_SECONDS: float = 60.0
+    AUTH_TOKEN_CACHE_SIZE: int = 4096
+    
+    # -------------
+    # Observability
+    # -------------
+    # Per-request latency and SQL counters, scraped from /metrics
+    METRICS_ENABLED: bool = True
+    # Add a Server-Timing header (SQL time and query count) to every response
+    METRICS_SERVER_TIMING: bool = False
+    # Log statements slower than this with their query plan (0 disables)
+    SLOW_QUERY_MS: float = 200.0
+    # Include bound parameters in slow query logs; they can hold emails and password hashes
+    SLOW_QUERY_LOG_PARAMETERS: bool = False
     
     # --------
     # Security
     # --------
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    # bcrypt work factor; stored hashes with another cost are upgraded on login
+    BCRYPT_ROUNDS: int = 12
+    # Processes hashing passwords (0 hashes on the shared threadpool instead)
+    PASSWORD_HASH_WORKERS: int = 2
+    # Hash/verify calls allowed to wait for a worker before requests get a 503
+    PASSWORD_HASH_MAX_PENDING: int = 64
     
     # ------------------
     # Default Categories
@@ -100,6 +153,23 @@ if yaml_config:
     if 'defaults' in yaml_config and 'categories' in yaml_config['defaults']:
         settings.DEFAULT_CATEGORIES = yaml_config['defaults']['categories']
     
+    if 'database' in yaml_config:
+        database = yaml_config['database'] or {}
+        settings.DATABASE_URL = database.get('url', settings.DATABASE_URL)
+        settings.DB_MODE = database.get('mode', settings.DB_MODE)
+        settings.DB_POOL_SIZE = database.get('pool_size', settings.DB_POOL_SIZE)
+        settings.DB_MAX_OVERFLOW = database.get('max_overflow', settings.DB_MAX_OVERFLOW)
+        settings.DB_POOL_TIMEOUT = database.get('pool_timeout', settings.DB_POOL_TIMEOUT)
+        settings.DB_POOL_RECYCLE = database.get('pool_recycle', settings.DB_POOL_RECYCLE)
+        pragmas = database.get('sqlite', {}) or {}
+        settings.SQLITE_JOURNAL_MODE = pragmas.get('journal_mode', settings.SQLITE_JOURNAL_MODE)
+        settings.SQLITE_SYNCHRONOUS = pragmas.get('synchronous', settings.SQLITE_SYNCHRONOUS)
+        settings.SQLITE_BUSY_TIMEOUT_MS = pragmas.get('busy_timeout_ms', settings.SQLITE_BUSY_TIMEOUT_MS)
+        settings.SQLITE_CACHE_SIZE = pragmas.get('cache_size', settings.SQLITE_CACHE_SIZE)
+        settings.SQLITE_MMAP_SIZE = pragmas.get('mmap_size', settings.SQLITE_MMAP_SIZE)
+        settings.SQLITE_TEMP_STORE = pragmas.get('temp_store', settings.SQLITE_TEMP_STORE)
+        settings.SQLITE_FOREIGN_KEYS = pragmas.get('foreign_keys', settings.SQLITE_FOREIGN_KEYS)
+
     if 'paths' in yaml_config:
         paths = yaml_config['paths']
         settings.DATA_BASE_DIR = paths.get('data_base_dir', settings.DATA_BASE_DIR)
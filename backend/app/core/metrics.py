@@ -0,0 +1,154 @@
+"""
+In-process request and SQL metrics, exposed in the Prometheus text format.
+
+Every worker keeps its own counters, so a scraper sees per-process series
+(as with the caches). Request-scoped numbers live in a context variable that
+the SQL event hooks add to and the ASGI middleware reads back.
+"""
+import threading
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+Labels = Tuple[Tuple[str, str], ...]
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 250)
+
+
+@dataclass
+class RequestStats:
+    queries: int = 0
+    sql_seconds: float = 0.0
+    slow_queries: int = 0
+
+
+# Set by the middleware for the duration of one request
+current_request: ContextVar[Optional[RequestStats]] = ContextVar("current_request", default=None)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Labels, extra: Iterable[Tuple[str, str]] = ()) -> str:
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class Counter:
+    def __init__(self, name: str, documentation: str):
+        self.name = name
+        self.documentation = documentation
+        self._values: Dict[Labels, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(tuple(sorted(labels.items())), 0.0)
+
+    def collect(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for labels, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(labels)} {_format_value(value)}")
+        return lines
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class Histogram:
+    def __init__(self, name: str, documentation: str, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.buckets = tuple(sorted(buckets))
+        # labels -> (per-bucket counts, +Inf count, sum)
+        self._values: Dict[Labels, List] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._values.setdefault(key, [[0] * len(self.buckets), 0, 0.0])
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[0][index] += 1
+            series[1] += 1
+            series[2] += value
+
+    def count(self, **labels: str) -> int:
+        with self._lock:
+            series = self._values.get(tuple(sorted(labels.items())))
+            return series[1] if series else 0
+
+    def collect(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for labels, (bucket_counts, count, total) in sorted(self._values.items()):
+                for bound, bucket_count in zip(self.buckets, bucket_counts):
+                    le = _format_labels(labels, [("le", _format_value(bound))])
+                    lines.append(f"{self.name}_bucket{le} {bucket_count}")
+                lines.append(f"{self.name}_bucket{_format_labels(labels, [('le', '+Inf')])} {count}")
+                lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(total)}")
+                lines.append(f"{self.name}_count{_format_labels(labels)} {count}")
+        return lines
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+requests_total = Counter("http_requests_total", "HTTP requests by route and status code.")
+request_duration = Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route."
+)
+request_queries = Histogram(
+    "http_request_db_queries", "SQL statements executed per HTTP request.", QUERY_COUNT_BUCKETS
+)
+request_sql_duration = Histogram(
+    "http_request_db_seconds", "Time spent in SQL per HTTP request."
+)
+slow_queries_total = Counter("db_slow_queries_total", "SQL statements slower than SLOW_QUERY_MS.")
+
+METRICS = (requests_total, request_duration, request_queries, request_sql_duration, slow_queries_total)
+
+
+def record_request(method: str, route: str, status: int, seconds: float, stats: RequestStats) -> None:
+    requests_total.inc(method=method, route=route, status=str(status))
+    request_duration.observe(seconds, method=method, route=route)
+    request_queries.observe(stats.queries, method=method, route=route)
+    request_sql_duration.observe(stats.sql_seconds, method=method, route=route)
+
+
+def samples(name: str, documentation: str, kind: str, values: Iterable[Tuple[Dict[str, str], float]]) -> List[str]:
+    """Format externally owned values (e.g. cache stats) as one metric family."""
+    lines = [f"# HELP {name} {documentation}", f"# TYPE {name} {kind}"]
+    for labels, value in values:
+        lines.append(f"{name}{_format_labels(tuple(sorted(labels.items())))} {_format_value(value)}")
+    return lines
+
+
+def render(extra_lines: Iterable[str] = ()) -> str:
+    lines = []
+    for metric in METRICS:
+        lines.extend(metric.collect())
+    lines.extend(extra_lines)
+    return "\n".join(lines) + "\n"
+
+
+def reset() -> None:
+    for metric in METRICS:
+        metric.clear()
@@ -1,5 +1,8 @@
 import os
+from typing import Any, Dict, Optional
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlalchemy.orm import declarative_base
 
 from app.core.config import settings
@@ -10,14 +13,88 @@ Base = declarative_base()
 from app.models.user import User
 from app.models.piggy_bank import PiggyBank
 from app.models.transaction import Transaction
+from app.models.transaction_rollup import TransactionRollup
+from app.models.balance_checkpoint import BalanceCheckpoint
+from app.models.user_data_version import UserDataVersion
+from app.models.data_version_sequence import DataVersionSequence
 
-# Format database URL properly
-db_url = settings.DATABASE_URL
-if db_url.startswith("sqlite"):
-    # Ensure data directory exists
-    data_dir = os.path.dirname(os.path.abspath(db_url.replace("sqlite:///", "")))
-    if data_dir:
-        os.makedirs(data_dir, exist_ok=True)
-    engine = create_engine(db_url, connect_args={"check_same_thread": False})
-else:
-    engine = create_engine(db_url)
+from app.db.instrumentation import install_query_instrumentation
+from app.db.sqlite import install_pragmas, pragmas_from_settings
+
+
+def create_db_engine(db_url: str, pragmas: Optional[Dict[str, Any]] = None):
+    """
+    Create an engine with the configured pool sizing. SQLite connections get
+    `pragmas` (default: from settings) applied as soon as they are opened.
+    """
+    if not db_url.startswith("sqlite"):
+        return create_engine(
+            db_url,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+        )
+
+    options = {}
+    path = db_url.replace("sqlite:///", "")
+    if path and path != ":memory:" and db_url != "sqlite://":
+        # Ensure data directory exists
+        data_dir = os.path.dirname(os.path.abspath(path))
+        if data_dir:
+            os.makedirs(data_dir, exist_ok=True)
+        options = {
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_timeout": settings.DB_POOL_TIMEOUT,
+            "pool_recycle": settings.DB_POOL_RECYCLE,
+        }
+
+    engine = create_engine(db_url, connect_args={"check_same_thread": False}, **options)
+    install_pragmas(engine, pragmas_from_settings(settings) if pragmas is None else pragmas)
+    install_query_instrumentation(
+        engine, settings.SLOW_QUERY_MS or None, settings.SLOW_QUERY_LOG_PARAMETERS
+    )
+    return engine
+
+
+def async_url(db_url: str) -> str:
+    """Map a sync SQLite URL onto the aiosqlite driver."""
+    if db_url.startswith("sqlite:"):
+        return "sqlite+aiosqlite:" + db_url[len("sqlite:"):]
+    return db_url
+
+
+def create_async_db_engine(db_url: str, pragmas: Optional[Dict[str, Any]] = None):
+    """
+    Async counterpart of `create_db_engine` backed by aiosqlite. The PRAGMA
+    hook is installed on the underlying sync engine, which sees every new
+    aiosqlite connection through the DB-API adapter.
+    """
+    url = async_url(db_url)
+    if not url.startswith("sqlite"):
+        return create_async_engine(url, pool_size=settings.DB_POOL_SIZE, max_overflow=settings.DB_MAX_OVERFLOW)
+
+    options = {}
+    path = url.split(":///", 1)[-1]
+    if ":///" in url and path and path != ":memory:":
+        options = {
+            "poolclass": AsyncAdaptedQueuePool,
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_timeout": settings.DB_POOL_TIMEOUT,
+            "pool_recycle": settings.DB_POOL_RECYCLE,
+        }
+
+    async_engine = create_async_engine(url, **options)
+    install_pragmas(
+        async_engine.sync_engine, pragmas_from_settings(settings) if pragmas is None else pragmas
+    )
+    install_query_instrumentation(
+        async_engine.sync_engine, settings.SLOW_QUERY_MS or None, settings.SLOW_QUERY_LOG_PARAMETERS
+    )
+    return async_engine
+
+
+engine = create_db_engine(settings.DATABASE_URL)
+async_engine = create_async_db_engine(settings.DATABASE_URL)
@@ -0,0 +1,68 @@
+"""
+SQLite FTS5 index over transaction descriptions and categories.
+
+`transactions_fts` is an external-content table: it stores only the inverted
+index and reads the text back from `transactions`, kept in sync by triggers so
+every write path (ORM, bulk inserts, bulk deletes) is covered.
+"""
+import re
+from typing import Optional
+from sqlalchemy import column, table
+from sqlalchemy.engine import Connection
+
+FTS_TABLE = "transactions_fts"
+
+# Lightweight handle for joining against the index in ORM queries
+search_index = table(FTS_TABLE, column("rowid"), column("description"), column("category"))
+
+CREATE_STATEMENTS = [
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+    "description, category, content='transactions', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+    f"CREATE TRIGGER IF NOT EXISTS transactions_fts_ai AFTER INSERT ON transactions BEGIN "
+    f"INSERT INTO {FTS_TABLE}(rowid, description, category) "
+    "VALUES (new.id, new.description, new.category); END",
+    f"CREATE TRIGGER IF NOT EXISTS transactions_fts_ad AFTER DELETE ON transactions BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, description, category) "
+    "VALUES ('delete', old.id, old.description, old.category); END",
+    f"CREATE TRIGGER IF NOT EXISTS transactions_fts_au "
+    "AFTER UPDATE OF description, category ON transactions BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, description, category) "
+    "VALUES ('delete', old.id, old.description, old.category); "
+    f"INSERT INTO {FTS_TABLE}(rowid, description, category) "
+    "VALUES (new.id, new.description, new.category); END",
+]
+
+DROP_STATEMENTS = [f"DROP TABLE IF EXISTS {FTS_TABLE}"]
+
+TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def install(conn: Connection) -> None:
+    """Create the FTS table and its sync triggers if they are missing."""
+    for statement in CREATE_STATEMENTS:
+        conn.exec_driver_sql(statement)
+
+
+def uninstall(conn: Connection) -> None:
+    """Drop the sync triggers and the FTS table, leaving `transactions` untouched."""
+    for trigger in ("transactions_fts_ai", "transactions_fts_ad", "transactions_fts_au"):
+        conn.exec_driver_sql(f"DROP TRIGGER IF EXISTS {trigger}")
+    for statement in DROP_STATEMENTS:
+        conn.exec_driver_sql(statement)
+
+
+def rebuild(conn: Connection) -> None:
+    """Re-index every transaction, e.g. after the index was created on existing data."""
+    conn.exec_driver_sql(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+
+
+def match_query(text: str) -> Optional[str]:
+    """
+    Translate free user input into an FTS5 query: every word becomes a quoted
+    prefix term and all terms must match. Returns None if there are no words.
+    """
+    tokens = TOKEN_PATTERN.findall(text)
+    if not tokens:
+        return None
+    return " ".join(f'"{token}"*' for token in tokens)
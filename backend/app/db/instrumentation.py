@@ -0,0 +1,75 @@
+"""
+SQL instrumentation.
+Cursor execute events time every statement and add it to the current
+request's stats. Statements slower than the threshold are logged together
+with their EXPLAIN QUERY PLAN, so a full table scan shows up in the log
+instead of only as a slow route. Bound parameters are left out unless
+explicitly enabled, since they carry emails and password hashes.
+"""
+import logging
+import time
+from typing import Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core import metrics
+
+logger = logging.getLogger("app.db.slow_query")
+
+EXPLAINABLE = ("SELECT", "WITH", "UPDATE", "DELETE", "INSERT")
+
+
+def explain(dbapi_connection, statement: str, parameters) -> str:
+    """Return the EXPLAIN QUERY PLAN of a statement as indented text."""
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        rows = cursor.fetchall()
+    finally:
+        cursor.close()
+
+    # Rows are (id, parent, notused, detail); indent by nesting depth
+    depth = {0: -1}
+    lines = []
+    for node_id, parent, _, detail in rows:
+        depth[node_id] = depth.get(parent, -1) + 1
+        lines.append("  " * depth[node_id] + detail)
+    return "\n".join(lines)
+
+
+def install_query_instrumentation(
+    engine: Engine, slow_query_ms: Optional[float] = None, log_parameters: bool = False
+) -> None:
+    """
+    Count and time every statement `engine` runs. With `slow_query_ms`, log
+    statements that take longer along with their query plan, and with
+    `log_parameters` also their bound parameters.
+    """
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start_timer(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _record_query(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_start"].pop()
+        stats = metrics.current_request.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.sql_seconds += elapsed
+
+        if slow_query_ms is None or elapsed * 1000 < slow_query_ms:
+            return
+        metrics.slow_queries_total.inc()
+        if stats is not None:
+            stats.slow_queries += 1
+
+        plan = ""
+        if not executemany and statement.lstrip().upper().startswith(EXPLAINABLE):
+            try:
+                plan = explain(conn.connection.dbapi_connection, statement, parameters)
+            except Exception as exc:  # The plan is a diagnostic, never fail the query over it
+                plan = f"<EXPLAIN failed: {exc}>"
+        logger.warning(
+            "Slow query (%.1f ms): %s\nParameters: %s\nQuery plan:\n%s",
+            elapsed * 1000, statement, repr(parameters) if log_parameters else "<redacted>", plan,
+        )
@@ -0,0 +1,212 @@
+"""
+Versioned Schema Migrations
+Each migration module exposes VERSION, DESCRIPTION, upgrade(conn) and
+downgrade(conn). Applied versions are recorded in the `schema_version`
+table, so running the upgrade against an already migrated database is a
+no-op. A new, empty database is created from the models in one step and
+stamped with the latest version instead of replaying every migration.
+Migrations that rebuild tables set DISABLE_FOREIGN_KEYS; they run with
+enforcement off and must leave `PRAGMA foreign_key_check` clean.
+
+Migrations only run from `python manage.py migrate` / `downgrade`; the API
+merely checks the version on startup, so workers never race on DDL.
+"""
+from datetime import datetime
+from typing import Callable, List, Optional
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+from app.db.migrations import (
+    v0001_legacy_columns,
+    v0002_transaction_indexes,
+    v0003_normalize_transaction_dates,
+    v0004_piggy_bank_balances,
+    v0005_transaction_search_index,
+    v0006_cascade_foreign_keys,
+    v0007_derived_tables,
+    v0008_data_version_sequence,
+    v0009_deletion_markers,
+)
+
+MIGRATIONS = [
+    v0001_legacy_columns,
+    v0002_transaction_indexes,
+    v0003_normalize_transaction_dates,
+    v0004_piggy_bank_balances,
+    v0005_transaction_search_index,
+    v0006_cascade_foreign_keys,
+    v0007_derived_tables,
+    v0008_data_version_sequence,
+    v0009_deletion_markers,
+]
+
+LATEST_VERSION = MIGRATIONS[-1].VERSION
+
+
+class SchemaVersionError(RuntimeError):
+    """The database schema is not at the version this code expects."""
+
+
+def ensure_version_table(conn: Connection) -> None:
+    conn.exec_driver_sql(
+        "CREATE TABLE IF NOT EXISTS schema_version ("
+        "version INTEGER PRIMARY KEY, "
+        "description VARCHAR(255) NOT NULL, "
+        "applied_at DATETIME NOT NULL)"
+    )
+
+
+def current_version(conn: Connection) -> int:
+    ensure_version_table(conn)
+    return conn.exec_driver_sql("SELECT MAX(version) FROM schema_version").scalar() or 0
+
+
+def read_version(conn: Connection) -> int:
+    """Like `current_version`, but read-only: never creates the version table."""
+    exists = conn.exec_driver_sql(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'schema_version'"
+    ).scalar()
+    if not exists:
+        return 0
+    return conn.exec_driver_sql("SELECT MAX(version) FROM schema_version").scalar() or 0
+
+
+def is_empty(conn: Connection) -> bool:
+    return not conn.exec_driver_sql(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' "
+        "AND name NOT IN ('schema_version') AND name NOT LIKE 'sqlite_%'"
+    ).scalar()
+
+
+def _stamp(conn: Connection, migration) -> None:
+    conn.execute(
+        text(
+            "INSERT INTO schema_version (version, description, applied_at) "
+            "VALUES (:version, :description, :applied_at)"
+        ),
+        {
+            "version": migration.VERSION,
+            "description": migration.DESCRIPTION,
+            "applied_at": datetime.utcnow(),
+        },
+    )
+
+
+def _run(engine: Engine, migration, step: Callable[[Connection], bool]) -> bool:
+    """
+    Run one migration step in its own transaction. `step` returns False if
+    there was nothing to do.
+    """
+    disable_foreign_keys = getattr(migration, "DISABLE_FOREIGN_KEYS", False)
+    with engine.connect() as conn:
+        # PRAGMA foreign_keys is a no-op inside a transaction, so toggle it first
+        foreign_keys = conn.exec_driver_sql("PRAGMA foreign_keys").scalar()
+        if disable_foreign_keys:
+            conn.exec_driver_sql("PRAGMA foreign_keys=OFF")
+        conn.commit()
+        try:
+            with conn.begin():
+                if not step(conn):
+                    return False
+                if disable_foreign_keys:
+                    violations = conn.exec_driver_sql("PRAGMA foreign_key_check").all()
+                    if violations:
+                        raise RuntimeError(
+                            f"Migration {migration.VERSION} left foreign key violations: {violations[:5]}"
+                        )
+            return True
+        finally:
+            if disable_foreign_keys and foreign_keys:
+                conn.exec_driver_sql("PRAGMA foreign_keys=ON")
+                conn.commit()
+
+
+def create_schema(engine: Engine) -> List[int]:
+    """
+    Create every table of a new database from the models and stamp it with
+    all migration versions, in a single transaction.
+    """
+    from app.db.base import Base
+
+    with engine.begin() as conn:
+        Base.metadata.create_all(bind=conn)
+        ensure_version_table(conn)
+        for migration in MIGRATIONS:
+            _stamp(conn, migration)
+    return [migration.VERSION for migration in MIGRATIONS]
+
+
+def upgrade(engine: Engine, target: Optional[int] = None) -> List[int]:
+    """
+    Apply every pending migration up to `target` (default: latest), each in
+    its own transaction. Returns the versions that were applied. A new, empty
+    database can only be created at the latest version.
+    """
+    with engine.connect() as conn:
+        empty = is_empty(conn) and read_version(conn) == 0
+    if empty:
+        if target is not None and target < LATEST_VERSION:
+            # The early migrations alter tables a new database doesn't have, so
+            # replaying them would stamp versions onto an empty schema
+            raise SchemaVersionError(
+                f"Cannot migrate a new, empty database to version {target}; "
+                f"it can only be created at the latest version ({LATEST_VERSION})."
+            )
+        return create_schema(engine)
+
+    applied = []
+    for migration in MIGRATIONS:
+        if target is not None and migration.VERSION > target:
+            break
+
+        def step(conn: Connection, migration=migration) -> bool:
+            if migration.VERSION <= current_version(conn):
+                return False
+            migration.upgrade(conn)
+            _stamp(conn, migration)
+            return True
+
+        if _run(engine, migration, step):
+            applied.append(migration.VERSION)
+    return applied
+
+
+def downgrade(engine: Engine, target: int) -> List[int]:
+    """
+    Revert every applied migration above `target`, newest first, each in its
+    own transaction. Returns the versions that were reverted.
+    """
+    reverted = []
+    for migration in reversed(MIGRATIONS):
+        if migration.VERSION <= target:
+            break
+
+        def step(conn: Connection, migration=migration) -> bool:
+            ensure_version_table(conn)
+            applied = conn.exec_driver_sql(
+                "SELECT 1 FROM schema_version WHERE version = ?", (migration.VERSION,)
+            ).scalar()
+            if not applied:
+                return False
+            migration.downgrade(conn)
+            conn.exec_driver_sql("DELETE FROM schema_version WHERE version = ?", (migration.VERSION,))
+            return True
+
+        if _run(engine, migration, step):
+            reverted.append(migration.VERSION)
+    return reverted
+
+
+def verify(engine: Engine) -> int:
+    """
+    Check, without touching the schema, that the database is at the latest
+    version. Raises SchemaVersionError otherwise.
+    """
+    with engine.connect() as conn:
+        version = read_version(conn)
+    if version != LATEST_VERSION:
+        raise SchemaVersionError(
+            f"Database schema is at version {version}, this code expects {LATEST_VERSION}. "
+            "Run `python manage.py migrate` from the backend/ directory."
+        )
+    return version
@@ -0,0 +1,7 @@
+from typing import List
+from sqlalchemy.engine import Connection
+
+
+def table_columns(conn: Connection, table: str) -> List[str]:
+    """Return the column names of a table, or an empty list if it doesn't exist."""
+    return [row[1] for row in conn.exec_driver_sql(f"PRAGMA table_info({table})")]
@@ -0,0 +1,39 @@
+"""
+Port of the former ad-hoc `migrate_db.py` and `migrate_db_v3.py` scripts.
+"""
+from sqlalchemy.engine import Connection
+from app.db.migrations.utils import table_columns
+
+VERSION = 1
+DESCRIPTION = "Add users.username, transactions.type and piggy_banks.currency"
+
+
+def upgrade(conn: Connection) -> None:
+    users = table_columns(conn, "users")
+    if users and "username" not in users:
+        conn.exec_driver_sql("ALTER TABLE users ADD COLUMN username VARCHAR(255)")
+        conn.exec_driver_sql("UPDATE users SET username = email WHERE username IS NULL")
+        conn.exec_driver_sql("CREATE UNIQUE INDEX IF NOT EXISTS ix_users_username ON users (username)")
+
+    transactions = table_columns(conn, "transactions")
+    if transactions and "type" not in transactions:
+        conn.exec_driver_sql("ALTER TABLE transactions ADD COLUMN type VARCHAR(50) DEFAULT 'expense'")
+        conn.exec_driver_sql(
+            "UPDATE transactions SET type = 'transfer' WHERE category IN ('Transfer In', 'Transfer Out')"
+        )
+
+    piggy_banks = table_columns(conn, "piggy_banks")
+    if piggy_banks and "currency" not in piggy_banks:
+        conn.exec_driver_sql(
+            "ALTER TABLE piggy_banks ADD COLUMN currency VARCHAR(10) NOT NULL DEFAULT 'USD'"
+        )
+
+
+def downgrade(conn: Connection) -> None:
+    if "username" in table_columns(conn, "users"):
+        conn.exec_driver_sql("DROP INDEX IF EXISTS ix_users_username")
+        conn.exec_driver_sql("ALTER TABLE users DROP COLUMN username")
+    if "type" in table_columns(conn, "transactions"):
+        conn.exec_driver_sql("ALTER TABLE transactions DROP COLUMN type")
+    if "currency" in table_columns(conn, "piggy_banks"):
+        conn.exec_driver_sql("ALTER TABLE piggy_banks DROP COLUMN currency")
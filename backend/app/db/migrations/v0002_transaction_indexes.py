@@ -0,0 +1,32 @@
+"""
+Composite indexes for the transaction listing, balance and category hot paths.
+"""
+from sqlalchemy.engine import Connection
+from app.db.migrations.utils import table_columns
+
+VERSION = 2
+DESCRIPTION = "Add composite indexes on transactions and categories"
+
+
+def upgrade(conn: Connection) -> None:
+    if table_columns(conn, "transactions"):
+        conn.exec_driver_sql(
+            "CREATE INDEX IF NOT EXISTS ix_transactions_pb_date_id "
+            "ON transactions (piggy_bank_id, date, id)"
+        )
+        conn.exec_driver_sql(
+            "CREATE INDEX IF NOT EXISTS ix_transactions_pb_category "
+            "ON transactions (piggy_bank_id, category)"
+        )
+    if table_columns(conn, "categories"):
+        conn.exec_driver_sql(
+            "CREATE INDEX IF NOT EXISTS ix_categories_user_name "
+            "ON categories (user_id, name)"
+        )
+    conn.exec_driver_sql("ANALYZE")
+
+
+def downgrade(conn: Connection) -> None:
+    conn.exec_driver_sql("DROP INDEX IF EXISTS ix_transactions_pb_date_id")
+    conn.exec_driver_sql("DROP INDEX IF EXISTS ix_transactions_pb_category")
+    conn.exec_driver_sql("DROP INDEX IF EXISTS ix_categories_user_name")
@@ -0,0 +1,23 @@
+"""
+Rows created through the `CURRENT_TIMESTAMP` server default were stored as
+'YYYY-MM-DD HH:MM:SS', while SQLAlchemy writes 'YYYY-MM-DD HH:MM:SS.ffffff'.
+Mixed formats break exact comparisons on the (piggy_bank_id, date, id) index,
+so legacy values are padded to the SQLAlchemy format.
+"""
+from sqlalchemy.engine import Connection
+from app.db.migrations.utils import table_columns
+
+VERSION = 3
+DESCRIPTION = "Normalize transaction dates to the SQLAlchemy storage format"
+
+
+def upgrade(conn: Connection) -> None:
+    if table_columns(conn, "transactions"):
+        conn.exec_driver_sql(
+            "UPDATE transactions SET date = date || '.000000' WHERE length(date) = 19"
+        )
+
+
+def downgrade(conn: Connection) -> None:
+    # Padded dates read back identically, so there is nothing to undo
+    pass
@@ -0,0 +1,41 @@
+"""
+Store the running balance and transaction count on `piggy_banks` so balance
+reads no longer aggregate the ledger. Existing rows are backfilled from
+`transactions`.
+"""
+from sqlalchemy.engine import Connection
+from app.db.migrations.utils import table_columns
+
+VERSION = 4
+DESCRIPTION = "Add stored balance and transaction_count to piggy_banks"
+
+
+def upgrade(conn: Connection) -> None:
+    columns = table_columns(conn, "piggy_banks")
+    if not columns:
+        return
+
+    if "balance" not in columns:
+        conn.exec_driver_sql(
+            "ALTER TABLE piggy_banks ADD COLUMN balance FLOAT NOT NULL DEFAULT 0"
+        )
+    if "transaction_count" not in columns:
+        conn.exec_driver_sql(
+            "ALTER TABLE piggy_banks ADD COLUMN transaction_count INTEGER NOT NULL DEFAULT 0"
+        )
+
+    if table_columns(conn, "transactions"):
+        conn.exec_driver_sql(
+            "UPDATE piggy_banks SET "
+            "balance = (SELECT COALESCE(SUM(amount), 0) FROM transactions "
+            "WHERE transactions.piggy_bank_id = piggy_banks.id), "
+            "transaction_count = (SELECT COUNT(*) FROM transactions "
+            "WHERE transactions.piggy_bank_id = piggy_banks.id)"
+        )
+
+
+def downgrade(conn: Connection) -> None:
+    columns = table_columns(conn, "piggy_banks")
+    for column in ("balance", "transaction_count"):
+        if column in columns:
+            conn.exec_driver_sql(f"ALTER TABLE piggy_banks DROP COLUMN {column}")
@@ -0,0 +1,21 @@
+"""
+Full-text search over transaction descriptions and categories. Databases
+created before the index existed get the FTS5 table and triggers, and the
+existing ledger is indexed once.
+"""
+from sqlalchemy.engine import Connection
+from app.db import fts
+from app.db.migrations.utils import table_columns
+
+VERSION = 5
+DESCRIPTION = "Add FTS5 search index over transaction descriptions and categories"
+
+
+def upgrade(conn: Connection) -> None:
+    if table_columns(conn, "transactions"):
+        fts.install(conn)
+        fts.rebuild(conn)
+
+
+def downgrade(conn: Connection) -> None:
+    fts.uninstall(conn)
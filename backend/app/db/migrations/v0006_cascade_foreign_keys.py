@@ -0,0 +1,106 @@
+"""
+Add ON DELETE CASCADE to every foreign key that points at `users` or
+`piggy_banks`, so deleting an account is a single statement for the
+application and SQLite removes the dependent rows itself.
+
+SQLite cannot alter a constraint in place, so each affected table is rebuilt
+following the documented procedure: create a copy with the new definition,
+copy the rows, drop the original, rename the copy and recreate its indexes
+and triggers. Legacy tables that never declared the foreign key get it
+added. Rows whose parent no longer exists (left behind while foreign keys
+were not enforced) are deleted first, as the cascade would have done.
+"""
+import re
+from sqlalchemy.engine import Connection
+from app.db.migrations.utils import table_columns
+
+VERSION = 6
+DESCRIPTION = "Rebuild tables with ON DELETE CASCADE foreign keys"
+# The rebuild drops parent tables that children still reference
+DISABLE_FOREIGN_KEYS = True
+
+# Child table -> (foreign key column, parent table)
+CASCADES = {
+    "piggy_banks": ("user_id", "users"),
+    "categories": ("user_id", "users"),
+    "user_data_versions": ("user_id", "users"),
+    "transactions": ("piggy_bank_id", "piggy_banks"),
+    "transaction_rollups": ("piggy_bank_id", "piggy_banks"),
+    "balance_checkpoints": ("piggy_bank_id", "piggy_banks"),
+}
+
+REFERENCES = re.compile(
+    r"(REFERENCES\s+\"?(?:users|piggy_banks)\"?\s*\([^)]*\))(?!\s*ON\s+DELETE)",
+    re.IGNORECASE,
+)
+CASCADE_CLAUSE = re.compile(r"\s+ON\s+DELETE\s+CASCADE", re.IGNORECASE)
+
+
+def _foreign_key_action(conn: Connection, table: str, column: str):
+    """ON DELETE action of the foreign key on `column`, or None if it has none."""
+    # PRAGMA foreign_key_list columns: id, seq, table, from, to, on_update, on_delete, match
+    for row in conn.exec_driver_sql(f"PRAGMA foreign_key_list({table})"):
+        if row[3] == column:
+            return row[6].upper()
+    return None
+
+
+def _create_sql(conn: Connection, table: str) -> str:
+    return conn.exec_driver_sql(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+    ).scalar()
+
+
+def _rebuild(conn: Connection, table: str, new_sql: str) -> None:
+    # Indexes and triggers are dropped together with the table
+    dependents = [
+        row[0]
+        for row in conn.exec_driver_sql(
+            "SELECT sql FROM sqlite_master "
+            "WHERE type IN ('index', 'trigger') AND tbl_name = ? AND sql IS NOT NULL",
+            (table,),
+        )
+    ]
+
+    new_table = f"{table}__rebuild"
+    new_sql = re.sub(
+        rf"^CREATE TABLE\s+\"?{table}\"?", f'CREATE TABLE "{new_table}"', new_sql, count=1
+    )
+    columns = ", ".join(f'"{name}"' for name in table_columns(conn, table))
+
+    conn.exec_driver_sql(f'DROP TABLE IF EXISTS "{new_table}"')
+    conn.exec_driver_sql(new_sql)
+    conn.exec_driver_sql(f'INSERT INTO "{new_table}" ({columns}) SELECT {columns} FROM "{table}"')
+    conn.exec_driver_sql(f'DROP TABLE "{table}"')
+    conn.exec_driver_sql(f'ALTER TABLE "{new_table}" RENAME TO "{table}"')
+    for statement in dependents:
+        conn.exec_driver_sql(statement)
+
+
+def upgrade(conn: Connection) -> None:
+    # piggy_banks comes first, so transactions orphaned by its cleanup are caught below
+    for table, (column, parent) in CASCADES.items():
+        if not table_columns(conn, table) or not table_columns(conn, parent):
+            continue
+        conn.exec_driver_sql(
+            f"DELETE FROM {table} WHERE {column} NOT IN (SELECT id FROM {parent})"
+        )
+        action = _foreign_key_action(conn, table, column)
+        if action == "CASCADE":
+            continue
+        create_sql = _create_sql(conn, table)
+        if action is None:
+            # Legacy tables were created without the constraint at all
+            new_sql = create_sql.rstrip()[:-1] + (
+                f", FOREIGN KEY({column}) REFERENCES {parent} (id) ON DELETE CASCADE)"
+            )
+        else:
+            new_sql = REFERENCES.sub(r"\1 ON DELETE CASCADE", create_sql)
+        _rebuild(conn, table, new_sql)
+
+
+def downgrade(conn: Connection) -> None:
+    for table, (column, parent) in CASCADES.items():
+        if _foreign_key_action(conn, table, column) == "CASCADE":
+            new_sql = CASCADE_CLAUSE.sub("", _create_sql(conn, table))
+            _rebuild(conn, table, new_sql)
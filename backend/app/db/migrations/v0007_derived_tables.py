@@ -0,0 +1,58 @@
+"""
+Create the tables that were so far only ever created by `create_all`:
+monthly rollups, per-user data versions and balance checkpoints. The rollup
+is backfilled from the ledger; versions and checkpoints start empty and fill
+up on demand.
+"""
+from sqlalchemy.engine import Connection
+from app.db.migrations.utils import table_columns
+
+VERSION = 7
+DESCRIPTION = "Add transaction_rollups, user_data_versions and balance_checkpoints"
+
+CREATE_STATEMENTS = [
+    "CREATE TABLE IF NOT EXISTS transaction_rollups ("
+    "piggy_bank_id INTEGER NOT NULL, "
+    "month VARCHAR(7) NOT NULL, "
+    "type VARCHAR(50) NOT NULL, "
+    "category VARCHAR(100) NOT NULL, "
+    "credit_total FLOAT NOT NULL, "
+    "debit_total FLOAT NOT NULL, "
+    "tx_count INTEGER NOT NULL, "
+    "PRIMARY KEY (piggy_bank_id, month, type, category), "
+    "FOREIGN KEY(piggy_bank_id) REFERENCES piggy_banks (id) ON DELETE CASCADE)",
+    "CREATE TABLE IF NOT EXISTS user_data_versions ("
+    "user_id INTEGER NOT NULL, "
+    "version INTEGER NOT NULL, "
+    "PRIMARY KEY (user_id), "
+    "FOREIGN KEY(user_id) REFERENCES users (id) ON DELETE CASCADE)",
+    "CREATE TABLE IF NOT EXISTS balance_checkpoints ("
+    "piggy_bank_id INTEGER NOT NULL, "
+    "month VARCHAR(7) NOT NULL, "
+    "closing_balance FLOAT NOT NULL, "
+    "tx_count INTEGER NOT NULL, "
+    "PRIMARY KEY (piggy_bank_id, month), "
+    "FOREIGN KEY(piggy_bank_id) REFERENCES piggy_banks (id) ON DELETE CASCADE)",
+]
+
+
+def upgrade(conn: Connection) -> None:
+    backfill = not table_columns(conn, "transaction_rollups")
+    for statement in CREATE_STATEMENTS:
+        conn.exec_driver_sql(statement)
+
+    if backfill and table_columns(conn, "transactions"):
+        conn.exec_driver_sql(
+            "INSERT INTO transaction_rollups "
+            "(piggy_bank_id, month, type, category, credit_total, debit_total, tx_count) "
+            "SELECT piggy_bank_id, strftime('%Y-%m', date), type, COALESCE(category, ''), "
+            "SUM(CASE WHEN amount > 0 THEN amount ELSE 0.0 END), "
+            "SUM(CASE WHEN amount < 0 THEN amount ELSE 0.0 END), "
+            "COUNT(id) "
+            "FROM transactions GROUP BY 1, 2, 3, 4"
+        )
+
+
+def downgrade(conn: Connection) -> None:
+    for table in ("balance_checkpoints", "user_data_versions", "transaction_rollups"):
+        conn.exec_driver_sql(f"DROP TABLE IF EXISTS {table}")
@@ -0,0 +1,32 @@
+"""
+Draw data versions from one global sequence instead of per-user counters.
+A per-user counter restarted at 0 when SQLite reused the id of a deleted
+user, so the new account could match cache entries other workers still held
+for the old one. The sequence starts above every existing version, and every
+user without a version row gets one, so no user is left at the implicit 0.
+"""
+from sqlalchemy.engine import Connection
+
+VERSION = 8
+DESCRIPTION = "Add data_version_sequence and seed every user's data version from it"
+
+
+def upgrade(conn: Connection) -> None:
+    conn.exec_driver_sql(
+        "CREATE TABLE IF NOT EXISTS data_version_sequence ("
+        "id INTEGER NOT NULL, "
+        "value INTEGER NOT NULL, "
+        "PRIMARY KEY (id))"
+    )
+    conn.exec_driver_sql(
+        "INSERT OR IGNORE INTO data_version_sequence (id, value) "
+        "SELECT 1, COALESCE(MAX(version), 0) + 1 FROM user_data_versions"
+    )
+    conn.exec_driver_sql(
+        "INSERT OR IGNORE INTO user_data_versions (user_id, version) "
+        "SELECT id, (SELECT value FROM data_version_sequence WHERE id = 1) FROM users"
+    )
+
+
+def downgrade(conn: Connection) -> None:
+    conn.exec_driver_sql("DROP TABLE IF EXISTS data_version_sequence")
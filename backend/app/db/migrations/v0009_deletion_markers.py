@@ -0,0 +1,28 @@
+"""
+Persist the chunked purge of a user or piggy bank as a `deleting` flag, so a
+purge cut short by a restart can be found and finished by
+`python manage.py purge-deleted`, and the half-deleted rows stay hidden
+until then.
+"""
+from sqlalchemy.engine import Connection
+from app.db.migrations.utils import table_columns
+
+VERSION = 9
+DESCRIPTION = "Add deleting markers to users and piggy_banks"
+
+TABLES = ("users", "piggy_banks")
+
+
+def upgrade(conn: Connection) -> None:
+    for table in TABLES:
+        columns = table_columns(conn, table)
+        if columns and "deleting" not in columns:
+            conn.exec_driver_sql(
+                f"ALTER TABLE {table} ADD COLUMN deleting BOOLEAN NOT NULL DEFAULT 0"
+            )
+
+
+def downgrade(conn: Connection) -> None:
+    for table in TABLES:
+        if "deleting" in table_columns(conn, table):
+            conn.exec_driver_sql(f"ALTER TABLE {table} DROP COLUMN deleting")
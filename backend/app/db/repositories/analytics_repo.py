@@ -0,0 +1,111 @@
+from datetime import datetime
+from typing import List, Optional, Sequence
+from sqlalchemy import Integer, String, case, cast, func, literal, select
+from sqlalchemy.orm import Session
+from app.models.piggy_bank import PiggyBank
+from app.models.transaction import Transaction
+
+OTHER = "Other"
+
+# Dimension name -> SQL expression over transactions joined with piggy_banks
+DIMENSIONS = {
+    "day": lambda: func.strftime("%Y-%m-%d", Transaction.date),
+    # Monday of the ISO week, e.g. '2024-01-01'
+    "week": lambda: func.date(Transaction.date, "-6 days", "weekday 1"),
+    "month": lambda: func.strftime("%Y-%m", Transaction.date),
+    "quarter": lambda: func.strftime("%Y", Transaction.date).concat("-Q").concat(
+        cast((cast(func.strftime("%m", Transaction.date), Integer) + 2) // 3, String)
+    ),
+    "year": lambda: func.strftime("%Y", Transaction.date),
+    # 0 = Sunday ... 6 = Saturday
+    "weekday": lambda: cast(func.strftime("%w", Transaction.date), Integer),
+    "piggy_bank": lambda: PiggyBank.name,
+    "currency": lambda: PiggyBank.currency,
+    "type": lambda: Transaction.type,
+    # Empty strings are treated like missing categories
+    "category": lambda: case((Transaction.category != "", Transaction.category), else_=None),
+}
+
+MEASURES = {
+    "sum": lambda: func.sum(Transaction.amount),
+    "count": lambda: func.count(Transaction.id),
+    "avg": lambda: func.avg(Transaction.amount),
+    "min": lambda: func.min(Transaction.amount),
+    "max": lambda: func.max(Transaction.amount),
+}
+
+# How the measures of grouped cells combine when cells are merged (top-N)
+REGROUP = {"sum": func.sum, "count": func.sum, "min": func.min, "max": func.max}
+
+class AnalyticsRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def cube(
+        self,
+        user_id: int,
+        dimensions: Sequence[str],
+        measures: Sequence[str],
+        piggy_bank_id: Optional[int] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        top_n: Optional[int] = None,
+        top_dimension: Optional[str] = None,
+        top_by: str = "sum",
+    ) -> List:
+        """
+        Aggregate a user's transactions by any combination of `dimensions` in a
+        single statement. With `top_n`, only the `top_n` largest members of
+        `top_dimension` (by absolute `top_by`) are kept within each combination
+        of the other dimensions; the rest are folded into an "Other" row, using
+        a window function over the grouped cells.
+        Returns rows with one column per dimension and per measure.
+        """
+        dimension_columns = [DIMENSIONS[name]().label(name) for name in dimensions]
+        # Without top-N the cells are the answer; with it they are re-grouped
+        cell_measures = measures if top_n is None else ("sum", "count", "min", "max")
+        cells = (
+            select(*dimension_columns, *[MEASURES[name]().label(name) for name in cell_measures])
+            .join(PiggyBank, Transaction.piggy_bank_id == PiggyBank.id)
+            .where(PiggyBank.user_id == user_id, PiggyBank.deleting.is_(False))
+            .group_by(*dimension_columns)
+        )
+        if piggy_bank_id is not None:
+            cells = cells.where(Transaction.piggy_bank_id == piggy_bank_id)
+        if start_date is not None:
+            cells = cells.where(Transaction.date >= start_date)
+        if end_date is not None:
+            cells = cells.where(Transaction.date <= end_date)
+
+        if top_n is None:
+            return self.db.execute(cells.order_by(*dimension_columns)).all()
+
+        cells = cells.subquery("cells")
+        partition = [cells.c[name] for name in dimensions if name != top_dimension]
+        rank = func.row_number().over(
+            partition_by=partition or None,
+            order_by=(func.abs(cells.c[top_by]).desc(), cells.c[top_dimension]),
+        )
+        ranked = select(cells, rank.label("rank")).subquery("ranked")
+
+        bucket = case(
+            (ranked.c.rank <= top_n, ranked.c[top_dimension]), else_=literal(OTHER)
+        ).label(top_dimension)
+        group_by = [ranked.c[name] for name in dimensions if name != top_dimension] + [bucket]
+        merged = {
+            name: (
+                func.sum(ranked.c["sum"]) / func.sum(ranked.c["count"])
+                if name == "avg" else REGROUP[name](ranked.c[name])
+            ).label(name)
+            for name in measures
+        }
+        stmt = (
+            select(
+                *[bucket if name == top_dimension else ranked.c[name] for name in dimensions],
+                *merged.values(),
+            )
+            .group_by(*group_by)
+            # Top members in rank order, the "Other" bucket last
+            .order_by(*group_by[:-1], func.min(ranked.c.rank))
+        )
+        return self.db.execute(stmt).all()
@@ -0,0 +1,115 @@
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import and_, delete, func, or_, select
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+from app.models.balance_checkpoint import BalanceCheckpoint
+from app.models.transaction import Transaction
+from app.models.transaction_rollup import TransactionRollup
+from app.db.repositories.rollup_repo import month_key
+
+class CheckpointRepository:
+    """
+    Maintains monthly closing-balance checkpoints for point-in-time balance queries.
+    Writes only invalidate checkpoints from the earliest affected month onwards;
+    reads materialize missing checkpoints from the monthly rollup. Nothing is
+    committed here.
+    """
+    def __init__(self, db: Session):
+        self.db = db
+
+    def invalidate(self, transactions: Iterable[Transaction]) -> None:
+        """
+        Drop the checkpoints that include any of the given transactions,
+        i.e. those of their month and every later month.
+        """
+        earliest: Dict[int, str] = {}
+        for tx in transactions:
+            month = month_key(tx.date)
+            if tx.piggy_bank_id not in earliest or month < earliest[tx.piggy_bank_id]:
+                earliest[tx.piggy_bank_id] = month
+
+        if not earliest:
+            return
+
+        self.db.execute(
+            delete(BalanceCheckpoint).where(or_(*(
+                and_(BalanceCheckpoint.piggy_bank_id == pb_id, BalanceCheckpoint.month >= month)
+                for pb_id, month in earliest.items()
+            )))
+        )
+
+    def delete_by_piggy_banks(self, pb_ids: Optional[List[int]] = None) -> None:
+        query = self.db.query(BalanceCheckpoint)
+        if pb_ids is not None:
+            query = query.filter(BalanceCheckpoint.piggy_bank_id.in_(pb_ids))
+        query.delete(synchronize_session=False)
+
+    def _closing_before(self, pb_id: int, month: str) -> Tuple[float, int]:
+        """
+        Closing balance and count at the end of the month preceding `month`.
+        Starts from the latest stored checkpoint and stores checkpoints for any
+        later months that have activity in the rollup.
+        """
+        checkpoint = self.db.execute(
+            select(BalanceCheckpoint.month, BalanceCheckpoint.closing_balance, BalanceCheckpoint.tx_count)
+            .where(BalanceCheckpoint.piggy_bank_id == pb_id, BalanceCheckpoint.month < month)
+            .order_by(BalanceCheckpoint.month.desc())
+            .limit(1)
+        ).first()
+        start, balance, count = checkpoint if checkpoint else ("", 0.0, 0)
+
+        months = self.db.execute(
+            select(
+                TransactionRollup.month,
+                func.sum(TransactionRollup.credit_total + TransactionRollup.debit_total),
+                func.sum(TransactionRollup.tx_count),
+            )
+            .where(
+                TransactionRollup.piggy_bank_id == pb_id,
+                TransactionRollup.month > start,
+                TransactionRollup.month < month,
+            )
+            .group_by(TransactionRollup.month)
+            .order_by(TransactionRollup.month)
+        ).all()
+
+        rows = []
+        for rollup_month, total, tx_count in months:
+            balance += total
+            count += tx_count
+            rows.append({
+                "piggy_bank_id": pb_id,
+                "month": rollup_month,
+                "closing_balance": balance,
+                "tx_count": count,
+            })
+
+        if rows:
+            stmt = insert(BalanceCheckpoint)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["piggy_bank_id", "month"],
+                set_={
+                    "closing_balance": stmt.excluded.closing_balance,
+                    "tx_count": stmt.excluded.tx_count,
+                },
+            )
+            self.db.execute(stmt, rows)
+        return balance, count
+
+    def balance_before(self, pb_id: int, before: datetime) -> Tuple[float, int]:
+        """
+        Balance and transaction count over all transactions dated strictly
+        before `before`: one checkpoint lookup plus a range sum within its month.
+        """
+        month_start = before.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        balance, count = self._closing_before(pb_id, month_key(before))
+
+        total, tx_count = self.db.query(
+            func.sum(Transaction.amount), func.count(Transaction.id)
+        ).filter(
+            Transaction.piggy_bank_id == pb_id,
+            Transaction.date >= month_start,
+            Transaction.date < before,
+        ).one()
+        return balance + (total or 0.0), count + tx_count
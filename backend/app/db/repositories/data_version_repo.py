@@ -0,0 +1,35 @@
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+from app.models.data_version_sequence import DataVersionSequence
+from app.models.user_data_version import UserDataVersion
+
+class DataVersionRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get(self, user_id: int) -> int:
+        version = self.db.query(UserDataVersion.version).filter(
+            UserDataVersion.user_id == user_id
+        ).scalar()
+        return version or 0
+
+    def bump(self, user_id: int) -> None:
+        """
+        Stage a version change; it becomes visible when the caller commits
+        the write it belongs to. The new version comes from the global
+        sequence, so it is never reused by another user, not even one that
+        later gets this user's id.
+        """
+        next_value = insert(DataVersionSequence).values(id=1, value=1)
+        next_value = next_value.on_conflict_do_update(
+            index_elements=["id"],
+            set_={"value": DataVersionSequence.value + 1},
+        ).returning(DataVersionSequence.value)
+        version = self.db.execute(next_value).scalar_one()
+
+        stmt = insert(UserDataVersion).values(user_id=user_id, version=version)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["user_id"],
+            set_={"version": version},
+        )
+        self.db.execute(stmt)
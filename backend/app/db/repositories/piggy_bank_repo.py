@@ -1,5 +1,8 @@
+from typing import List, Optional
+from sqlalchemy import func, or_, select
 from sqlalchemy.orm import Session
 from app.models.piggy_bank import PiggyBank
+from app.models.transaction import Transaction
 
 class PiggyBankRepository:
     def __init__(self, db: Session):
@@ -13,18 +16,106 @@ class PiggyBankRepository:
         return piggy_bank
 
     def list_by_user(self, user_id: int):
-        return self.db.query(PiggyBank).filter(PiggyBank.user_id == user_id).all()
+        return self.db.query(PiggyBank).filter(
+            PiggyBank.user_id == user_id, PiggyBank.deleting.is_(False)
+        ).all()
+
+    def list_with_activity(self, user_id: int):
+        """
+        Return (PiggyBank, last transaction date) pairs for all of a user's banks
+        in one grouped query; balances come from the stored running totals.
+        """
+        return (
+            self.db.query(PiggyBank, func.max(Transaction.date))
+            .outerjoin(Transaction, Transaction.piggy_bank_id == PiggyBank.id)
+            .filter(PiggyBank.user_id == user_id, PiggyBank.deleting.is_(False))
+            .group_by(PiggyBank.id)
+            .order_by(PiggyBank.id)
+            .all()
+        )
 
     def get_by_name(self, user_id: int, name: str):
         return self.db.query(PiggyBank).filter(
-            PiggyBank.user_id == user_id, PiggyBank.name == name
+            PiggyBank.user_id == user_id, PiggyBank.name == name, PiggyBank.deleting.is_(False)
         ).first()
 
     def get_by_id(self, user_id: int, pb_id: int):
         return self.db.query(PiggyBank).filter(
-            PiggyBank.user_id == user_id, PiggyBank.id == pb_id
+            PiggyBank.user_id == user_id, PiggyBank.id == pb_id, PiggyBank.deleting.is_(False)
         ).first()
 
+    def _ledger_totals(self):
+        return (
+            select(
+                Transaction.piggy_bank_id.label("piggy_bank_id"),
+                func.sum(Transaction.amount).label("balance"),
+                func.count(Transaction.id).label("transaction_count"),
+            )
+            .group_by(Transaction.piggy_bank_id)
+            .subquery()
+        )
+
+    def find_balance_drift(self, tolerance: float = 1e-6):
+        """
+        Compare the stored running balances with the ledger.
+        Returns (id, stored balance, ledger balance, stored count, ledger count)
+        for every piggy bank that disagrees. Banks being purged are skipped,
+        their totals are expected to lag.
+        """
+        ledger = self._ledger_totals()
+        ledger_balance = func.coalesce(ledger.c.balance, 0.0)
+        ledger_count = func.coalesce(ledger.c.transaction_count, 0)
+        return (
+            self.db.query(
+                PiggyBank.id,
+                PiggyBank.balance,
+                ledger_balance,
+                PiggyBank.transaction_count,
+                ledger_count,
+            )
+            .outerjoin(ledger, ledger.c.piggy_bank_id == PiggyBank.id)
+            .filter(PiggyBank.deleting.is_(False), or_(
+                func.abs(PiggyBank.balance - ledger_balance) > tolerance,
+                PiggyBank.transaction_count != ledger_count,
+            ))
+            .order_by(PiggyBank.id)
+            .all()
+        )
+
+    def recompute_balances(self, pb_ids: Optional[List[int]] = None) -> int:
+        """
+        Overwrite stored balances and counts with values recomputed from the ledger.
+        Returns the number of piggy banks updated; the caller commits.
+        """
+        balance = select(func.coalesce(func.sum(Transaction.amount), 0.0)).where(
+            Transaction.piggy_bank_id == PiggyBank.id
+        ).scalar_subquery()
+        count = select(func.count(Transaction.id)).where(
+            Transaction.piggy_bank_id == PiggyBank.id
+        ).scalar_subquery()
+
+        query = self.db.query(PiggyBank)
+        if pb_ids is not None:
+            query = query.filter(PiggyBank.id.in_(pb_ids))
+        return query.update(
+            {PiggyBank.balance: balance, PiggyBank.transaction_count: count},
+            synchronize_session=False,
+        )
+
+    def mark_deleting(self, pb_id: int) -> bool:
+        """
+        Flag a piggy bank for a chunked purge, hiding it from every lookup.
+        The name is freed for reuse: real names match NAME_PATTERN, this one
+        can't. Returns False if it was already flagged; the caller commits.
+        """
+        return self.db.query(PiggyBank).filter(
+            PiggyBank.id == pb_id, PiggyBank.deleting.is_(False)
+        ).update(
+            {PiggyBank.deleting: True, PiggyBank.name: f"#deleting-{pb_id}"},
+            synchronize_session=False,
+        ) == 1
+
     def delete(self, piggy_bank: PiggyBank):
+        # Transactions, rollups and checkpoints go with it via ON DELETE CASCADE
         self.db.delete(piggy_bank)
         self.db.commit()
@@ -0,0 +1,102 @@
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
+from sqlalchemy import and_, case, func
+from sqlalchemy.orm import Session
+from app.models.transaction import Transaction
+from app.models.transaction_rollup import TransactionRollup
+
+INCOME = case((Transaction.amount > 0, Transaction.amount), else_=0.0)
+EXPENSES = case((Transaction.amount < 0, Transaction.amount), else_=0.0)
+
+class ReportRepository:
+    """
+    Aggregate queries behind the piggy bank reports. Income is the sum of the
+    positive amounts and expenses the (negative) sum of the negative ones,
+    matching the CSV-era ReportGenerator. Whole-month ranges are read from the
+    monthly rollups; arbitrary date ranges fall back to the transactions table.
+    """
+    def __init__(self, db: Session):
+        self.db = db
+
+    def month_totals(self, pb_id: int, first_month: str, last_month: str) -> List:
+        """Return (month key, income, expenses, count) rows for the `YYYY-MM` range, inclusive."""
+        return (
+            self.db.query(
+                TransactionRollup.month,
+                func.sum(TransactionRollup.credit_total),
+                func.sum(TransactionRollup.debit_total),
+                func.sum(TransactionRollup.tx_count),
+            )
+            .filter(
+                TransactionRollup.piggy_bank_id == pb_id,
+                TransactionRollup.month.between(first_month, last_month),
+            )
+            .group_by(TransactionRollup.month)
+            .all()
+        )
+
+    def month_category_totals(
+        self,
+        pb_id: int,
+        first_month: str,
+        last_month: str,
+        exclude_expense_categories: Iterable[str] = (),
+    ) -> List:
+        """
+        Return (category, income, expenses) rows for the `YYYY-MM` range.
+        Uncategorized transactions are left out, and expenses in
+        `exclude_expense_categories` (case-insensitive) are not counted.
+        """
+        expenses = TransactionRollup.debit_total
+        excluded = [name.lower() for name in exclude_expense_categories]
+        if excluded:
+            expenses = case(
+                (func.lower(TransactionRollup.category).in_(excluded), 0.0), else_=expenses
+            )
+        return (
+            self.db.query(
+                TransactionRollup.category,
+                func.sum(TransactionRollup.credit_total),
+                func.sum(expenses),
+            )
+            .filter(
+                TransactionRollup.piggy_bank_id == pb_id,
+                TransactionRollup.month.between(first_month, last_month),
+                TransactionRollup.category != "",
+            )
+            .group_by(TransactionRollup.category)
+            .all()
+        )
+
+    def _range(self, pb_id: int, start: Optional[datetime], end: Optional[datetime]):
+        conditions = [Transaction.piggy_bank_id == pb_id]
+        if start is not None:
+            conditions.append(Transaction.date >= start)
+        if end is not None:
+            conditions.append(Transaction.date <= end)
+        return and_(*conditions)
+
+    def totals(
+        self, pb_id: int, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> Tuple[float, float]:
+        """Return (income, expenses) between two dates, both inclusive."""
+        income, expenses = self.db.query(
+            func.coalesce(func.sum(INCOME), 0.0),
+            func.coalesce(func.sum(EXPENSES), 0.0),
+        ).filter(self._range(pb_id, start, end)).one()
+        return income, expenses
+
+    def category_totals(
+        self, pb_id: int, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> List:
+        """Return (category, income, expenses) rows between two dates, both inclusive."""
+        return (
+            self.db.query(Transaction.category, func.sum(INCOME), func.sum(EXPENSES))
+            .filter(
+                self._range(pb_id, start, end),
+                Transaction.category.isnot(None),
+                Transaction.category != "",
+            )
+            .group_by(Transaction.category)
+            .all()
+        )
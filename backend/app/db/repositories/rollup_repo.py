@@ -0,0 +1,127 @@
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import bindparam, case, delete, func, select
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+from app.models.transaction import Transaction
+from app.models.transaction_rollup import TransactionRollup
+
+RollupKey = Tuple[int, str, str, str]
+
+def month_key(date: datetime) -> str:
+    """Return the `YYYY-MM` rollup bucket of a transaction date."""
+    return date.strftime("%Y-%m")
+
+def rollup_key(transaction: Transaction) -> RollupKey:
+    return (
+        transaction.piggy_bank_id,
+        month_key(transaction.date),
+        transaction.type,
+        transaction.category or "",
+    )
+
+class RollupRepository:
+    """
+    Keeps `transaction_rollups` in step with the `transactions` table.
+    Every method only stages SQL on the session; the caller commits so the
+    rollup changes land in the same DB transaction as the ledger write.
+    """
+    def __init__(self, db: Session):
+        self.db = db
+
+    def apply(self, transactions: Iterable[Transaction], sign: int = 1) -> None:
+        """
+        Add (`sign=1`) or retract (`sign=-1`) transactions from their monthly buckets.
+        """
+        deltas: Dict[RollupKey, List[float]] = {}
+        for tx in transactions:
+            delta = deltas.setdefault(rollup_key(tx), [0.0, 0.0, 0])
+            if tx.amount > 0:
+                delta[0] += tx.amount
+            elif tx.amount < 0:
+                delta[1] += tx.amount
+            delta[2] += 1
+
+        if not deltas:
+            return
+
+        rows = [
+            {
+                "piggy_bank_id": key[0],
+                "month": key[1],
+                "type": key[2],
+                "category": key[3],
+                "credit_total": sign * credit,
+                "debit_total": sign * debit,
+                "tx_count": sign * count,
+            }
+            for key, (credit, debit, count) in deltas.items()
+        ]
+        stmt = insert(TransactionRollup)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["piggy_bank_id", "month", "type", "category"],
+            set_={
+                "credit_total": TransactionRollup.credit_total + stmt.excluded.credit_total,
+                "debit_total": TransactionRollup.debit_total + stmt.excluded.debit_total,
+                "tx_count": TransactionRollup.tx_count + stmt.excluded.tx_count,
+            },
+        )
+        self.db.execute(stmt, rows)
+
+        if sign < 0:
+            # Drop emptied buckets so they don't surface as empty periods. Only
+            # the touched keys can have emptied, each one a primary key lookup
+            table = TransactionRollup.__table__
+            self.db.execute(
+                delete(table).where(
+                    table.c.piggy_bank_id == bindparam("key_piggy_bank_id"),
+                    table.c.month == bindparam("key_month"),
+                    table.c.type == bindparam("key_type"),
+                    table.c.category == bindparam("key_category"),
+                    table.c.tx_count <= 0,
+                ),
+                [
+                    {
+                        "key_piggy_bank_id": key[0],
+                        "key_month": key[1],
+                        "key_type": key[2],
+                        "key_category": key[3],
+                    }
+                    for key in deltas
+                ],
+            )
+
+    def rebuild(self, pb_ids: Optional[List[int]] = None) -> int:
+        """
+        Recompute the rollup from the raw ledger, either for every piggy bank
+        or for the given ids. Returns the number of buckets written.
+        """
+        query = self.db.query(TransactionRollup)
+        if pb_ids is not None:
+            query = query.filter(TransactionRollup.piggy_bank_id.in_(pb_ids))
+        query.delete(synchronize_session=False)
+
+        month = func.strftime("%Y-%m", Transaction.date)
+        category = func.coalesce(Transaction.category, "")
+        source = select(
+            Transaction.piggy_bank_id,
+            month,
+            Transaction.type,
+            category,
+            func.sum(case((Transaction.amount > 0, Transaction.amount), else_=0.0)),
+            func.sum(case((Transaction.amount < 0, Transaction.amount), else_=0.0)),
+            func.count(Transaction.id),
+        ).group_by(Transaction.piggy_bank_id, month, Transaction.type, category)
+        if pb_ids is not None:
+            source = source.where(Transaction.piggy_bank_id.in_(pb_ids))
+
+        result = self.db.execute(
+            insert(TransactionRollup).from_select(
+                [
+                    "piggy_bank_id", "month", "type", "category",
+                    "credit_total", "debit_total", "tx_count",
+                ],
+                source,
+            )
+        )
+        return result.rowcount
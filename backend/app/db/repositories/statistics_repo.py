@@ -0,0 +1,53 @@
+from sqlalchemy import case, func, literal
+from sqlalchemy.orm import Session
+from app.models.piggy_bank import PiggyBank
+from app.models.transaction_rollup import TransactionRollup
+
+INCOME_TYPES = ("income", "deposit")
+EXPENSE_TYPES = ("expense", "withdrawal", "transfer")
+
+class StatisticsRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def period_totals(self, user_id: int, timeframe: str):
+        """
+        Aggregate a user's monthly rollups inside SQLite.
+        Returns one row per (period, currency, bucket, category) holding the signed
+        and absolute amount totals, so the cost grows with the number of months
+        and categories rather than with the number of transactions.
+        """
+        if timeframe == "monthly":
+            period = TransactionRollup.month
+        elif timeframe == "yearly":
+            period = func.substr(TransactionRollup.month, 1, 4)
+        else:
+            period = literal("all")
+
+        bucket = case(
+            (TransactionRollup.type.in_(INCOME_TYPES), "income"),
+            (TransactionRollup.type.in_(EXPENSE_TYPES), "expense"),
+            else_="other",
+        )
+        # Empty strings are treated like missing categories
+        category = case((TransactionRollup.category != "", TransactionRollup.category), else_=None)
+
+        group_by = [PiggyBank.currency, bucket, category]
+        if timeframe in ("monthly", "yearly"):
+            group_by.insert(0, period)
+
+        return (
+            self.db.query(
+                period.label("period"),
+                PiggyBank.currency.label("currency"),
+                bucket.label("bucket"),
+                category.label("category"),
+                func.sum(TransactionRollup.credit_total + TransactionRollup.debit_total).label("total"),
+                func.sum(TransactionRollup.credit_total - TransactionRollup.debit_total).label("abs_total"),
+            )
+            .join(PiggyBank, TransactionRollup.piggy_bank_id == PiggyBank.id)
+            .filter(PiggyBank.user_id == user_id, PiggyBank.deleting.is_(False))
+            .group_by(*group_by)
+            .order_by(*group_by)
+            .all()
+        )
@@ -0,0 +1,216 @@
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Iterable, Iterator, List, Optional, Tuple
+from sqlalchemy import String, delete, func, insert, literal, literal_column, select, tuple_, type_coerce
+from sqlalchemy.orm import Session
+from app.models.piggy_bank import PiggyBank
+from app.models.transaction import Transaction
+from app.db import fts
+from app.db.repositories.checkpoint_repo import CheckpointRepository
+from app.db.repositories.rollup_repo import RollupRepository
+
+class TransactionRepository:
+    """
+    Single entry point for ledger writes.
+    Keeps derived tables (monthly rollups, balance checkpoints) consistent with the `transactions` table.
+    Nothing is committed here; callers commit once per unit of work.
+    """
+    def __init__(self, db: Session):
+        self.db = db
+        self.rollups = RollupRepository(db)
+        self.checkpoints = CheckpointRepository(db)
+
+    def _adjust_balance(self, pb_id: int, amount: float, count: int) -> None:
+        # Increment in SQL so concurrent writers can't lose updates
+        self.db.query(PiggyBank).filter(PiggyBank.id == pb_id).update(
+            {
+                PiggyBank.balance: PiggyBank.balance + amount,
+                PiggyBank.transaction_count: PiggyBank.transaction_count + count,
+            },
+            synchronize_session=False,
+        )
+
+    def add(self, transaction: Transaction) -> Transaction:
+        if transaction.date is None:
+            # Resolve the default date here so it is known to the rollup
+            transaction.date = datetime.utcnow()
+        self.db.add(transaction)
+        self.rollups.apply([transaction])
+        self.checkpoints.invalidate([transaction])
+        self._adjust_balance(transaction.piggy_bank_id, transaction.amount, 1)
+        return transaction
+
+    def add_many(self, pb_id: int, payloads: Iterable) -> List[int]:
+        """
+        Bulk insert validated `TransactionCreate` payloads into one piggy bank
+        with a single executemany INSERT. Returns the new ids in payload order.
+        """
+        now = datetime.utcnow()
+        rows = [
+            {
+                "piggy_bank_id": pb_id,
+                "amount": payload.amount,
+                "type": payload.type,
+                "category": payload.category,
+                "description": payload.description,
+                "date": payload.date or now,
+            }
+            for payload in payloads
+        ]
+        if not rows:
+            return []
+
+        result = self.db.execute(
+            insert(Transaction).returning(Transaction.id, sort_by_parameter_order=True),
+            rows,
+        )
+        ids = list(result.scalars())
+        written = [SimpleNamespace(**row) for row in rows]
+        self.rollups.apply(written)
+        self.checkpoints.invalidate(written)
+        self._adjust_balance(pb_id, sum(row["amount"] for row in rows), len(rows))
+        return ids
+
+    def delete(self, transaction: Transaction) -> None:
+        self.rollups.apply([transaction], sign=-1)
+        self.checkpoints.invalidate([transaction])
+        self._adjust_balance(transaction.piggy_bank_id, -transaction.amount, -1)
+        self.db.delete(transaction)
+
+    def filtered(
+        self,
+        pb_id: int,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        type: Optional[str] = None,
+        category: Optional[str] = None,
+        min_amount: Optional[float] = None,
+        max_amount: Optional[float] = None,
+    ):
+        """
+        Build the newest-first transaction query of a piggy bank with every
+        optional filter pushed into SQL.
+        """
+        query = self.db.query(Transaction).filter(Transaction.piggy_bank_id == pb_id)
+        if start_date is not None:
+            query = query.filter(Transaction.date >= start_date)
+        if end_date is not None:
+            query = query.filter(Transaction.date <= end_date)
+        if type is not None:
+            query = query.filter(Transaction.type == type)
+        if category is not None:
+            query = query.filter(Transaction.category == category)
+        if min_amount is not None:
+            query = query.filter(Transaction.amount >= min_amount)
+        if max_amount is not None:
+            query = query.filter(Transaction.amount <= max_amount)
+        return query.order_by(Transaction.date.desc(), Transaction.id.desc())
+
+    def search(self, user_id: int, match: str, pb_id: Optional[int] = None, limit: int = 50):
+        """
+        Rank the user's transactions against an FTS5 `match` expression by bm25,
+        newest first among equally relevant rows.
+        """
+        index = literal_column(fts.FTS_TABLE)
+        query = (
+            self.db.query(Transaction)
+            .join(fts.search_index, fts.search_index.c.rowid == Transaction.id)
+            .join(PiggyBank, PiggyBank.id == Transaction.piggy_bank_id)
+            .filter(index.op("MATCH")(match), PiggyBank.user_id == user_id, PiggyBank.deleting.is_(False))
+        )
+        if pb_id is not None:
+            query = query.filter(Transaction.piggy_bank_id == pb_id)
+        return (
+            query.order_by(func.bm25(index), Transaction.date.desc(), Transaction.id.desc())
+            .limit(limit)
+            .all()
+        )
+
+    def page(
+        self,
+        query,
+        limit: int,
+        after: Optional[Tuple[str, int]] = None,
+    ) -> Tuple[List[Transaction], Optional[Tuple[str, int]]]:
+        """
+        Fetch one keyset page of a `filtered()` query.
+        `after` is the (raw stored date, id) of the last row already seen; the
+        same pair is returned for the last row of this page when more rows exist.
+        """
+        # Compare against the stored text so legacy rows without fractional
+        # seconds still sort and match exactly
+        raw_date = type_coerce(Transaction.date, String)
+        query = query.add_columns(raw_date)
+        if after is not None:
+            query = query.filter(
+                tuple_(raw_date, Transaction.id) < tuple_(literal(after[0], String), after[1])
+            )
+
+        rows = query.limit(limit + 1).all()
+        items = [tx for tx, _ in rows[:limit]]
+        if len(rows) <= limit:
+            return items, None
+        last_tx, last_date = rows[limit - 1]
+        return items, (last_date, last_tx.id)
+
+    EXPORT_COLUMNS = (
+        "id", "piggy_bank_id", "piggy_bank", "currency",
+        "date", "type", "category", "description", "amount",
+    )
+
+    def iter_for_export(
+        self,
+        user_id: int,
+        pb_id: Optional[int] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[tuple]:
+        """
+        Stream a user's transactions as plain row tuples (see EXPORT_COLUMNS),
+        fetched from the cursor `batch_size` rows at a time without building
+        ORM objects.
+        """
+        stmt = (
+            select(
+                Transaction.id,
+                Transaction.piggy_bank_id,
+                PiggyBank.name,
+                PiggyBank.currency,
+                Transaction.date,
+                Transaction.type,
+                Transaction.category,
+                Transaction.description,
+                Transaction.amount,
+            )
+            .join(PiggyBank, Transaction.piggy_bank_id == PiggyBank.id)
+            .where(PiggyBank.user_id == user_id, PiggyBank.deleting.is_(False))
+            .order_by(Transaction.piggy_bank_id, Transaction.date, Transaction.id)
+            .execution_options(yield_per=batch_size)
+        )
+        if pb_id is not None:
+            stmt = stmt.where(Transaction.piggy_bank_id == pb_id)
+        if start_date is not None:
+            stmt = stmt.where(Transaction.date >= start_date)
+        if end_date is not None:
+            stmt = stmt.where(Transaction.date <= end_date)
+
+        for row in self.db.execute(stmt):
+            yield tuple(row)
+
+    def delete_chunk(self, pb_ids: List[int], limit: int) -> int:
+        """
+        Delete up to `limit` transactions of the given piggy banks and return how
+        many went. Derived tables are left alone: this only serves purges that
+        end by deleting the banks themselves, which cascades to them.
+        """
+        ids = (
+            select(Transaction.id)
+            .where(Transaction.piggy_bank_id.in_(pb_ids))
+            .limit(limit)
+            .scalar_subquery()
+        )
+        return self.db.execute(
+            delete(Transaction).where(Transaction.id.in_(ids)),
+            execution_options={"synchronize_session": False},
+        ).rowcount
@@ -0,0 +1,44 @@
+"""
+SQLite connection tuning.
+PRAGMAs are per-connection in SQLite, so they are applied from a `connect`
+event on every new DB-API connection the pool opens.
+"""
+from typing import Any, Dict
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import Settings
+
+
+def pragmas_from_settings(settings: Settings) -> Dict[str, Any]:
+    """
+    Build the ordered PRAGMA mapping for new connections.
+    journal_mode goes first since it decides how the others behave.
+    """
+    return {
+        "journal_mode": settings.SQLITE_JOURNAL_MODE,
+        "synchronous": settings.SQLITE_SYNCHRONOUS,
+        "busy_timeout": settings.SQLITE_BUSY_TIMEOUT_MS,
+        "cache_size": settings.SQLITE_CACHE_SIZE,
+        "mmap_size": settings.SQLITE_MMAP_SIZE,
+        "temp_store": settings.SQLITE_TEMP_STORE,
+        "foreign_keys": "ON" if settings.SQLITE_FOREIGN_KEYS else "OFF",
+    }
+
+
+def apply_pragmas(dbapi_connection, pragmas: Dict[str, Any]) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in pragmas.items():
+            if value is None:
+                continue
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+
+def install_pragmas(engine: Engine, pragmas: Dict[str, Any]) -> None:
+    """Apply `pragmas` to every connection `engine` opens from now on."""
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        apply_pragmas(dbapi_connection, pragmas)
@@ -0,0 +1,18 @@
+from typing import Dict, List, Sequence
+
+def build_cube(rows, dimensions: Sequence[str], measures: Sequence[str]) -> Dict:
+    """
+    Transpose cube rows into the columnar CubeResponse payload: one array per
+    dimension and measure, index-aligned across arrays.
+    """
+    names = list(dimensions) + list(measures)
+    columns: Dict[str, List] = {name: [] for name in names}
+    for row in rows:
+        for name, value in zip(names, row):
+            columns[name].append(value)
+    return {
+        "dimensions": list(dimensions),
+        "measures": list(measures),
+        "columns": columns,
+        "row_count": len(rows),
+    }
@@ -22,3 +22,17 @@ def create_piggy_bank(
 
 def list_piggy_banks(user_id: int, repo: PiggyBankRepository):
     return repo.list_by_user(user_id)
+
+def list_piggy_bank_summaries(user_id: int, repo: PiggyBankRepository):
+    return [
+        {
+            "id": pb.id,
+            "name": pb.name,
+            "currency": pb.currency,
+            "user_id": pb.user_id,
+            "balance": pb.balance,
+            "transaction_count": pb.transaction_count,
+            "last_activity": last_activity,
+        }
+        for pb, last_activity in repo.list_with_activity(user_id)
+    ]
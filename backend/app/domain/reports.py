@@ -1,10 +1,11 @@
 """
 Core Business Logic - Report Generation
 """
+import numpy as np
 import pandas as pd
 from datetime import datetime
 from typing import Dict, List
-from app.core.transactions import TransactionManager
+from app.domain.transactions import TransactionManager
 
 
 class ReportGenerator:
@@ -22,16 +23,11 @@ class ReportGenerator:
         start = datetime(year, month, 1)
         end = datetime(year, month + 1, 1) if month < 12 else datetime(year + 1, 1, 1)
         
-        # Filter transactions for the month
-        month_df = self.tm.transactions_df[
-            (self.tm.transactions_df['Date'] >= start) &
-            (self.tm.transactions_df['Date'] < end)
-        ]
+        # Transactions of the month, from whichever year partition holds them
+        month_df = self.tm.transactions_between(start, end)
         
-        # Calculate balance before month
-        balance_before = self.tm.transactions_df[
-            self.tm.transactions_df['Date'] < start
-        ]['Amount'].sum()
+        # Balance before month, carried over from the earlier years
+        balance_before = self.tm.balance_before(start)
         
         # Calculate income and expenses
         income = month_df[month_df['Amount'] > 0]['Amount'].sum()
@@ -81,72 +77,53 @@ class ReportGenerator:
         }
     
     def generate_yearly_report(self, year: int) -> Dict:
-        """Generate yearly financial report"""
+        """
+        Generate yearly financial report.
+        Rows are bucketed once by month index and category code with
+        np.bincount, which yields the totals, both category breakdowns and the
+        monthly summary without re-filtering the year per month or per breakdown.
+        """
         start = datetime(year, 1, 1)
         end = datetime(year + 1, 1, 1)
-        
-        # Filter transactions for the year
-        year_df = self.tm.transactions_df[
-            (self.tm.transactions_df['Date'] >= start) &
-            (self.tm.transactions_df['Date'] < end)
-        ]
-        
-        # Calculate balance before year
-        balance_before = self.tm.transactions_df[
-            self.tm.transactions_df['Date'] < start
-        ]['Amount'].sum()
-        
-        # Calculate income and expenses
-        income = year_df[year_df['Amount'] > 0]['Amount'].sum()
-        expenses = year_df[year_df['Amount'] < 0]['Amount'].sum()
+
+        year_df = self.tm.transactions_between(start, end)
+        balance_before = self.tm.balance_before(start)
+
+        amounts = year_df['Amount'].to_numpy(dtype=float)
+        credits = np.where(amounts > 0, amounts, 0.0)
+        debits = np.where(amounts < 0, amounts, 0.0)
+
+        # Monthly summary: bucket 0 is unused, months are 1..12
+        months = year_df['Date'].to_numpy(dtype='datetime64[ns]').astype('datetime64[M]').astype(np.int64) % 12 + 1
+        monthly_income = np.bincount(months, weights=credits, minlength=13)
+        monthly_expenses = np.bincount(months, weights=debits, minlength=13)
+
+        income = monthly_income.sum()
+        expenses = monthly_expenses.sum()
         net = income + expenses
         balance_after = balance_before + net
-        
-        # Expense breakdown by category
-        expense_by_category = {}
-        if not year_df.empty:
-            expense_df = year_df[year_df['Amount'] < 0]
-            if not expense_df.empty:
-                expense_by_category = (
-                    expense_df.groupby('Category')['Amount']
-                    .sum()
-                    .sort_values()
-                    .to_dict()
-                )
-        
-        # Income breakdown by category
-        income_by_category = {}
-        if not year_df.empty:
-            income_df = year_df[year_df['Amount'] > 0]
-            if not income_df.empty:
-                income_by_category = (
-                    income_df.groupby('Category')['Amount']
-                    .sum()
-                    .sort_values(ascending=False)
-                    .to_dict()
-                )
-        
-        # Monthly summary
-        monthly_summary = []
-        for month in range(1, 13):
-            month_start = datetime(year, month, 1)
-            month_end = datetime(year, month + 1, 1) if month < 12 else datetime(year + 1, 1, 1)
-            
-            month_df = year_df[
-                (year_df['Date'] >= month_start) &
-                (year_df['Date'] < month_end)
-            ]
-            
-            monthly_income = month_df[month_df['Amount'] > 0]['Amount'].sum()
-            monthly_expenses = month_df[month_df['Amount'] < 0]['Amount'].sum()
-            
-            monthly_summary.append({
+
+        # Category breakdowns; NaN categories get code -1 and are dropped, as groupby does
+        codes, categories = pd.factorize(year_df['Category'], sort=True)
+        known = codes >= 0
+        size = len(categories)
+        expense_by_category = self._category_totals(
+            categories, codes[known], debits[known], amounts[known] < 0, size
+        ).sort_values().to_dict()
+        income_by_category = self._category_totals(
+            categories, codes[known], credits[known], amounts[known] > 0, size
+        ).sort_values(ascending=False).to_dict()
+
+        monthly_summary = [
+            {
                 "month": month,
-                "income": float(monthly_income),
-                "expenses": float(monthly_expenses),
-                "net": float(monthly_income + monthly_expenses)
-            })
-        
+                "income": float(monthly_income[month]),
+                "expenses": float(monthly_expenses[month]),
+                "net": float(monthly_income[month] + monthly_expenses[month])
+            }
+            for month in range(1, 13)
+        ]
+
         return {
             "year": year,
             "balance_before": float(balance_before),
@@ -159,18 +136,25 @@ class ReportGenerator:
             "income_by_category": {k: float(v) for k, v in income_by_category.items()},
             "monthly_summary": monthly_summary
         }
+
+    @staticmethod
+    def _category_totals(categories, codes, weights, mask, size) -> pd.Series:
+        """Per-category sums, keeping only the categories with at least one row in `mask`"""
+        totals = np.bincount(codes, weights=weights, minlength=size)
+        present = np.bincount(codes[mask], minlength=size) > 0
+        return pd.Series(totals[present], index=categories[present], dtype=float)
     
     def get_category_summary(self, start_date: str = None, end_date: str = None) -> Dict:
         """
         Get spending summary by category for a date range
         """
-        df = self.tm.transactions_df.copy()
-        
-        if start_date:
-            df = df[df['Date'] >= pd.to_datetime(start_date)]
+        start = pd.to_datetime(start_date) if start_date else None
+        end = pd.to_datetime(end_date) if end_date else None
         
-        if end_date:
-            df = df[df['Date'] <= pd.to_datetime(end_date)]
+        # Load only the years the range touches, then apply the inclusive end
+        df = self.tm.transactions_between(start, datetime(end.year + 1, 1, 1) if end is not None else None)
+        if end is not None:
+            df = df[df['Date'] <= end]
         
         # Separate income and expenses
         expense_df = df[df['Amount'] < 0]
@@ -0,0 +1,39 @@
+from typing import Dict, List
+
+def build_stat_records(rows) -> List[Dict]:
+    """
+    Fold pre-aggregated (period, currency, bucket, category) rows into the
+    StatRecord payload consumed by the frontend charts.
+    """
+    stats_map = {}
+
+    for row in rows:
+        map_key = (row.period, row.currency)
+
+        if map_key not in stats_map:
+            stats_map[map_key] = {
+                "period": row.period,
+                "currency": row.currency,
+                "income": 0.0,
+                "expense": 0.0,
+                "category_expenses": {},
+                "category_incomes": {},
+            }
+        record = stats_map[map_key]
+
+        # Map types to income/expense for charting purposes
+        if row.bucket == "income":
+            record["income"] += row.total
+            if row.category:
+                record["category_incomes"][row.category] = record["category_incomes"].get(row.category, 0) + row.total
+        elif row.bucket == "expense":
+            # Transfers are generally treated as expenses from the source piggy bank.
+            # Negative amounts are charted as positive expenses.
+            record["expense"] += row.abs_total
+            if row.category:
+                record["category_expenses"][row.category] = record["category_expenses"].get(row.category, 0) + row.abs_total
+
+    stats_list = list(stats_map.values())
+    stats_list.sort(key=lambda x: x["period"])
+
+    return stats_list
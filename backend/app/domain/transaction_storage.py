@@ -0,0 +1,197 @@
+"""
+Core Business Logic - Transaction File Storage
+Pluggable on-disk formats for the per-year ledgers kept by TransactionManager.
+
+Every backend stores the same typed columns and reads a date range with only
+the requested columns. CSV has to parse the whole file and filter afterwards;
+Parquet pushes the date predicate down to row-group statistics and decodes
+only the projected columns; Arrow IPC (Feather) is memory-mapped, so
+untouched columns are never paged in. Parquet and Feather need the optional
+`pyarrow` package.
+"""
+import glob
+import os
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence
+
+import pandas as pd
+
+COLUMNS = ['Transaction ID', 'Date', 'Amount', 'Category', 'Description', 'Balance']
+
+# Rows per Parquet row group; ledgers are written in date order, so each
+# group covers a contiguous date range that the reader can skip as a whole
+ROW_GROUP_SIZE = 16384
+
+
+def arrow_schema():
+    import pyarrow as pa
+
+    return pa.schema([
+        ('Transaction ID', pa.int64()),
+        ('Date', pa.timestamp('us')),
+        ('Amount', pa.float64()),
+        ('Category', pa.string()),
+        ('Description', pa.string()),
+        ('Balance', pa.float64()),
+    ])
+
+
+def typed_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Return the ledger columns with their storage types, in date order."""
+    frame = df.reindex(columns=COLUMNS).copy()
+    frame['Transaction ID'] = pd.to_numeric(frame['Transaction ID']).astype('int64')
+    frame['Date'] = pd.to_datetime(frame['Date']).astype('datetime64[us]')
+    frame['Amount'] = pd.to_numeric(frame['Amount']).astype('float64')
+    frame['Balance'] = pd.to_numeric(frame['Balance']).astype('float64')
+    for column in ('Category', 'Description'):
+        frame[column] = frame[column].astype(object).where(frame[column].notna(), None)
+    return frame.sort_values(by=['Date', 'Transaction ID'], ignore_index=True)
+
+
+def _read_columns(columns: Optional[Sequence[str]]) -> List[str]:
+    return list(columns) if columns else list(COLUMNS)
+
+
+class TransactionStore(ABC):
+    """
+    One on-disk format for a year of transactions.
+    `read` returns the rows with `start <= Date < end` (either bound optional),
+    restricted to `columns` when given.
+    """
+    name = ""
+    extension = ""
+
+    @abstractmethod
+    def read(
+        self,
+        path: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> pd.DataFrame:
+        ...
+
+    @abstractmethod
+    def write(self, path: str, df: pd.DataFrame) -> None:
+        ...
+
+
+class CSVStore(TransactionStore):
+    """The original format: parsed in full on every read, filtered afterwards."""
+    name = "csv"
+    extension = "csv"
+
+    def read(self, path, start=None, end=None, columns=None):
+        wanted = _read_columns(columns)
+        usecols = wanted if 'Date' in wanted or (start is None and end is None) else wanted + ['Date']
+        df = pd.read_csv(
+            path,
+            parse_dates=['Date'] if 'Date' in usecols else False,
+            usecols=lambda name: name in usecols,
+        )
+        if start is not None:
+            df = df[df['Date'] >= start]
+        if end is not None:
+            df = df[df['Date'] < end]
+        return df.reindex(columns=[c for c in wanted if c in df.columns]).reset_index(drop=True)
+
+    def write(self, path, df):
+        df.to_csv(path, index=False, encoding='utf-8-sig')
+
+
+class ParquetStore(TransactionStore):
+    """Typed, zstd-compressed columns with date predicate pushdown."""
+    name = "parquet"
+    extension = "parquet"
+
+    def read(self, path, start=None, end=None, columns=None):
+        import pyarrow.parquet as pq
+
+        filters = []
+        if start is not None:
+            filters.append(('Date', '>=', pd.Timestamp(start)))
+        if end is not None:
+            filters.append(('Date', '<', pd.Timestamp(end)))
+        table = pq.read_table(path, columns=_read_columns(columns), filters=filters or None)
+        return table.to_pandas()
+
+    def write(self, path, df):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pa.Table.from_pandas(typed_frame(df), schema=arrow_schema(), preserve_index=False)
+        pq.write_table(table, path, compression='zstd', row_group_size=ROW_GROUP_SIZE)
+
+
+class FeatherStore(TransactionStore):
+    """Uncompressed Arrow IPC, memory-mapped so reads are zero-copy."""
+    name = "feather"
+    extension = "feather"
+
+    def read(self, path, start=None, end=None, columns=None):
+        import pyarrow.compute as pc
+        import pyarrow.feather as feather
+
+        wanted = _read_columns(columns)
+        filtered = start is not None or end is not None
+        table = feather.read_table(
+            path, columns=wanted if not filtered or 'Date' in wanted else wanted + ['Date'], memory_map=True
+        )
+        if filtered:
+            mask = None
+            if start is not None:
+                mask = pc.greater_equal(table['Date'], pd.Timestamp(start))
+            if end is not None:
+                upper = pc.less(table['Date'], pd.Timestamp(end))
+                mask = upper if mask is None else pc.and_(mask, upper)
+            table = table.filter(mask).select(wanted)
+        return table.to_pandas()
+
+    def write(self, path, df):
+        import pyarrow as pa
+        import pyarrow.feather as feather
+
+        table = pa.Table.from_pandas(typed_frame(df), schema=arrow_schema(), preserve_index=False)
+        feather.write_feather(table, path, compression='uncompressed')
+
+
+STORES: Dict[str, TransactionStore] = {
+    store.name: store for store in (CSVStore(), ParquetStore(), FeatherStore())
+}
+
+
+def get_store(name: str) -> TransactionStore:
+    try:
+        return STORES[name]
+    except KeyError:
+        raise ValueError(f"Unknown transaction storage '{name}', expected one of {sorted(STORES)}")
+
+
+def convert_csv_tree(root: str, storage: str = "parquet", remove_csv: bool = False) -> List[str]:
+    """
+    Convert every `<account>/piggy_banks/<name>/csv/<year>_transactions.csv`
+    under `root` into the given storage format, next to the CSV folder.
+    Re-running overwrites earlier conversions. Returns the written paths.
+    """
+    store = get_store(storage)
+    source = STORES["csv"]
+    pattern = os.path.join(root, "*", "piggy_banks", "*", "csv", "*_transactions.csv")
+
+    written = []
+    for csv_path in sorted(glob.glob(pattern)):
+        piggy_bank_dir = os.path.dirname(os.path.dirname(csv_path))
+        year = os.path.basename(csv_path).split("_", 1)[0]
+        folder = os.path.join(piggy_bank_dir, store.extension)
+        os.makedirs(folder, exist_ok=True)
+        target = os.path.join(folder, f"{year}_transactions.{store.extension}")
+
+        df = source.read(csv_path)
+        if 'Balance' not in df.columns:
+            df = df.sort_values(by=['Date', 'Transaction ID'], ignore_index=True)
+            df['Balance'] = df['Amount'].cumsum()
+        store.write(target, df)
+        written.append(target)
+        if remove_csv:
+            os.remove(csv_path)
+    return written
@@ -3,21 +3,60 @@ Core Business Logic - Transaction Management
 """
 import os
 import glob
+import json
 import re
+import tempfile
+import numpy as np
 import pandas as pd
-from typing import Dict
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 from datetime import datetime
-from backend.app.config.config import settings
+from app.core.cache import SizedLRUCache, VersionedCache
+from app.core.config import settings
+from app.domain.transaction_storage import COLUMNS, TransactionStore, get_store
+
+# Per-year amount totals are kept next to the year files, so opening balances
+# never need earlier years to be read again
+CLOSING_BALANCES_FILE = "closing_balances.json"
+
+
+def _frame_size(df: pd.DataFrame) -> int:
+    return int(df.memory_usage(deep=True).sum())
+
+
+def _file_version(path: str) -> Tuple[int, int]:
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def sort_by_date(df: pd.DataFrame) -> pd.DataFrame:
+    """Sort by Date then Transaction ID; year files are stored in that order, so usually a no-op"""
+    if len(df) > 1:
+        dates = df['Date'].to_numpy(dtype='datetime64[ns]')
+        ids = df['Transaction ID'].to_numpy()
+        in_order = (dates[1:] > dates[:-1]) | ((dates[1:] == dates[:-1]) & (ids[1:] >= ids[:-1]))
+        if not in_order.all():
+            return df.sort_values(by=['Date', 'Transaction ID'], ignore_index=True)
+    return df
+
+
+# Year partitions read from disk, shared by every TransactionManager in the
+# process and keyed by file, so the memory cap holds process-wide
+partition_cache = SizedLRUCache(settings.TRANSACTION_PARTITION_CACHE_MB * 2**20, _frame_size)
+# (total, count) per year file, valid until the file changes
+year_total_cache = VersionedCache(maxsize=4096)
 
 
 class TransactionManager:
     """
-    Manages financial transactions
+    Manages financial transactions, one file per year in the configured
+    storage format (see app.domain.transaction_storage). One year at a time
+    is loaded for editing; reads spanning several years go through the lazy
+    partition view (`transactions_between`, `balance_before`).
     """
     
-    COLUMNS = ['Transaction ID', 'Date', 'Amount', 'Category', 'Description', 'Balance']
+    COLUMNS = COLUMNS
     
-    def __init__(self, account_name: str, piggy_bank_name: str):
+    def __init__(self, account_name: str, piggy_bank_name: str, storage: Optional[str] = None):
         self.account_name = account_name
         self.piggy_bank_name = piggy_bank_name
         self.base_path = os.path.join(
@@ -26,17 +65,33 @@ class TransactionManager:
             "piggy_banks",
             piggy_bank_name
         )
+        self.store = get_store(storage or settings.TRANSACTION_STORAGE)
+        # Column chunks of rows appended in date order, merged on the next read
+        self._pending: List[Dict[str, np.ndarray]] = []
         self.transactions_df = pd.DataFrame(columns=self.COLUMNS)
         self.transaction_counter = 1
         self.current_balance = 0.0
         self.loaded_year = None
     
-    def get_file_path(self, year: int = None, extension: str = 'csv') -> str:
+    @property
+    def transactions_df(self) -> pd.DataFrame:
+        """The working DataFrame in (Date, Transaction ID) order, including buffered appends"""
+        if self._pending:
+            self._flush()
+        return self._df
+    
+    @transactions_df.setter
+    def transactions_df(self, df: pd.DataFrame) -> None:
+        self._pending = []
+        self._df = df
+    
+    def get_file_path(self, year: int = None, extension: str = None) -> str:
         """
         Get file path for a specific year
         """
         if year is None:
             year = datetime.now().year
+        extension = extension or self.store.extension
         
         folder = os.path.join(self.base_path, extension)
         os.makedirs(folder, exist_ok=True)
@@ -44,10 +99,11 @@ class TransactionManager:
         filename = f"{year}_transactions.{extension}"
         return os.path.join(folder, filename)
     
-    def list_transaction_files(self, extension: str = 'csv') -> Dict[int, str]:
+    def list_transaction_files(self, extension: str = None) -> Dict[int, str]:
         """
         List all transaction files and return year -> filepath mapping
         """
+        extension = extension or self.store.extension
         folder = os.path.join(self.base_path, extension)
         pattern = os.path.join(folder, f"*_transactions.{extension}")
         files = glob.glob(pattern)
@@ -61,42 +117,65 @@ class TransactionManager:
         
         return year_map
     
-    def load_from_csv(self, year: int = None) -> dict:
-        """Load transactions from CSV file"""
-        files = self.list_transaction_files('csv')
+    def _year_sources(self) -> Dict[int, Tuple[TransactionStore, str]]:
+        """
+        Year -> (store, path). Years not yet converted from CSV are still
+        read from their CSV file.
+        """
+        sources = {}
+        if self.store.name != "csv":
+            legacy = get_store("csv")
+            sources = {year: (legacy, path) for year, path in self.list_transaction_files("csv").items()}
+        sources.update({year: (self.store, path) for year, path in self.list_transaction_files().items()})
+        return sources
+    
+    def read(
+        self,
+        year: int,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        Read part of a year without loading it: rows with
+        `start_date <= Date < end_date`, only the given columns.
+        """
+        source = self._year_sources().get(year)
+        if source is None:
+            return pd.DataFrame(columns=list(columns or self.COLUMNS))
+        store, path = source
+        return store.read(path, start_date, end_date, columns)
+    
+    def load(self, year: int = None) -> dict:
+        """Load a year of transactions as the working DataFrame"""
+        sources = self._year_sources()
         
-        if not files:
+        if not sources:
             return {
                 "success": False,
-                "error": "No CSV files available."
+                "error": "No transaction files available."
             }
         
         if year is None:
-            year = max(files.keys())
+            year = max(sources.keys())
         
         self.loaded_year = year
-        filepath = self.get_file_path(year, 'csv')
-        
-        try:
-            self.transactions_df = pd.read_csv(filepath, parse_dates=['Date'])
-        except FileNotFoundError:
+        if year not in sources:
             self.transactions_df = pd.DataFrame(columns=self.COLUMNS)
             self.current_balance = 0.0
             return {
                 "success": False,
-                "error": f"File not found: {filepath}"
+                "error": f"File not found: {self.get_file_path(year)}"
             }
         
+        store, path = sources[year]
+        self.transactions_df = store.read(path)
+        self._sort_transactions()
+        
         # Ensure Balance column exists
         if 'Balance' not in self.transactions_df.columns:
             self._recalculate_balance()
         
-        self.transactions_df.sort_values(
-            by=['Date', 'Transaction ID'],
-            inplace=True,
-            ignore_index=True
-        )
-        
         self.transaction_counter = (
             self.transactions_df['Transaction ID'].max() + 1
             if not self.transactions_df.empty else 1
@@ -114,16 +193,12 @@ class TransactionManager:
             "balance": self.current_balance
         }
     
-    def save_to_csv(self, year: int = None) -> dict:
-        """Save transactions to CSV file"""
-        self.transactions_df.sort_values(
-            by=['Date', 'Transaction ID'],
-            inplace=True,
-            ignore_index=True
-        )
+    def save(self, year: int = None) -> dict:
+        """Save the working DataFrame as a year file in the configured storage"""
+        self._sort_transactions()
         
-        filepath = self.get_file_path(year, 'csv')
-        self.transactions_df.to_csv(filepath, index=False, encoding='utf-8-sig')
+        filepath = self.get_file_path(year)
+        self.store.write(filepath, self.transactions_df)
         
         return {
             "success": True,
@@ -131,6 +206,203 @@ class TransactionManager:
             "count": len(self.transactions_df)
         }
     
+    def load_from_csv(self, year: int = None) -> dict:
+        """Compatibility wrapper for load(); reads the configured storage, falling back to CSV"""
+        return self.load(year)
+    
+    def save_to_csv(self, year: int = None) -> dict:
+        """Compatibility wrapper for save(); writes the configured storage"""
+        return self.save(year)
+    
+    # --------------------------
+    # Multi-year partitioned view
+    # --------------------------
+    
+    def years(self) -> List[int]:
+        """Years with a file, plus the loaded year"""
+        years = set(self._year_sources())
+        if self.loaded_year is not None:
+            years.add(self.loaded_year)
+        return sorted(years)
+    
+    def partition(self, year: int, sources: Dict = None) -> pd.DataFrame:
+        """
+        All transactions of one year in date order. The loaded year is the
+        working DataFrame, so unsaved changes are visible; other years are read
+        on first use and kept in the shared partition LRU. Treat as read-only.
+        """
+        if year == self.loaded_year:
+            return self.transactions_df
+        source = (self._year_sources() if sources is None else sources).get(year)
+        if source is None:
+            return pd.DataFrame(columns=self.COLUMNS)
+        
+        store, path = source
+        version = _file_version(path)
+        df = partition_cache.get(path, version)
+        if df is None:
+            df = sort_by_date(store.read(path))
+            partition_cache.set(path, df, version)
+        return df
+    
+    def transactions_between(self, start: datetime = None, end: datetime = None) -> pd.DataFrame:
+        """
+        Transactions with `start <= Date < end` across year files. Only the
+        partitions the range touches are loaded.
+        """
+        sources = self._year_sources()
+        years = self.years()
+        if start is not None:
+            years = [year for year in years if year >= start.year]
+        if end is not None:
+            years = [year for year in years if datetime(year, 1, 1) < end]
+        
+        frames = []
+        for year in years:
+            df = self.partition(year, sources)
+            if df.empty:
+                continue
+            # Partitions entirely inside the range are used as they are
+            mask = None
+            if start is not None and df['Date'].min() < start:
+                mask = df['Date'] >= start
+            if end is not None and df['Date'].max() >= end:
+                mask = (df['Date'] < end) if mask is None else mask & (df['Date'] < end)
+            frames.append(df if mask is None else df[mask])
+        
+        if not frames:
+            return pd.DataFrame(columns=self.COLUMNS)
+        return frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+    
+    def year_total(self, year: int, sources: Dict = None) -> Tuple[float, int]:
+        """Sum and count of one year's amounts"""
+        if year == self.loaded_year:
+            return float(self.transactions_df['Amount'].sum()), len(self.transactions_df)
+        source = (self._year_sources() if sources is None else sources).get(year)
+        if source is None:
+            return 0.0, 0
+        
+        store, path = source
+        version = _file_version(path)
+        totals = year_total_cache.get(path, version)
+        if totals is None:
+            totals = self._stored_year_total(path, version)
+        if totals is None:
+            cached = partition_cache.get(path, version)
+            amounts = (cached if cached is not None else store.read(path, columns=['Amount']))['Amount']
+            totals = (float(amounts.sum()), len(amounts))
+            self._store_year_total(path, version, totals)
+        year_total_cache.set(path, totals, version)
+        return totals
+    
+    def closing_balance(self, year: int) -> float:
+        """Balance after the last transaction of `year`, carried over all earlier years"""
+        sources = self._year_sources()
+        return float(sum(
+            self.year_total(y, sources)[0] for y in self.years() if y <= year
+        ))
+    
+    def balance_before(self, date: datetime) -> float:
+        """Balance over every transaction dated strictly before `date`"""
+        balance = self.closing_balance(date.year - 1)
+        if date > datetime(date.year, 1, 1):
+            df = self.partition(date.year)
+            balance += float(df.loc[df['Date'] < date, 'Amount'].sum())
+        return balance
+    
+    def _closing_balances_path(self) -> str:
+        return os.path.join(self.base_path, CLOSING_BALANCES_FILE)
+    
+    def _read_closing_balances(self) -> dict:
+        try:
+            with open(self._closing_balances_path(), encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+    
+    def _stored_year_total(self, path: str, version: Tuple[int, int]) -> Optional[Tuple[float, int]]:
+        entry = self._read_closing_balances().get(os.path.basename(path))
+        if entry is None or tuple(entry["version"]) != version:
+            return None
+        return entry["total"], entry["count"]
+    
+    def _store_year_total(self, path: str, version: Tuple[int, int], totals: Tuple[float, int]) -> None:
+        entries = self._read_closing_balances()
+        entries[os.path.basename(path)] = {"version": list(version), "total": totals[0], "count": totals[1]}
+        target = self._closing_balances_path()
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        # Write then rename, so concurrent readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(target), suffix=".tmp")
+        with os.fdopen(fd, "w", encoding='utf-8') as f:
+            json.dump(entries, f)
+        os.replace(tmp_path, target)
+    
+    def add_transactions(self, transactions: Iterable) -> dict:
+        """
+        Add many transactions at once. Items are dicts with `date`, `amount`,
+        `category` and optionally `description`, or tuples in that order.
+        Nothing is added if any date is invalid.
+        
+        Rows dated on or after the last transaction are buffered and merged on
+        the next read, so in-order appends cost O(1) amortized. Backdated rows
+        are merged right away, recomputing balances from the earliest affected
+        date only.
+        """
+        columns = {'Date': [], 'Amount': [], 'Category': [], 'Description': []}
+        for item in transactions:
+            if not isinstance(item, dict):
+                item = dict(zip(('date', 'amount', 'category', 'description'), item))
+            columns['Date'].append(item['date'])
+            columns['Amount'].append(item['amount'])
+            columns['Category'].append(item.get('category'))
+            columns['Description'].append(item.get('description', ""))
+        
+        count = len(columns['Amount'])
+        if not count:
+            return {"success": True, "count": 0, "balance": self.current_balance}
+        
+        try:
+            # Offsets are converted to UTC and dropped, so aware and naive dates can mix
+            dates = pd.to_datetime(columns['Date'], format='mixed', utc=True)
+            dates = dates.tz_localize(None).to_numpy(dtype='datetime64[ns]')
+        except Exception as batch_error:
+            for index, date in enumerate(columns['Date']):
+                try:
+                    pd.to_datetime(date, utc=True)
+                except Exception as e:
+                    return {
+                        "success": False,
+                        "index": index,
+                        "error": f"Invalid date format: {str(e)}"
+                    }
+            return {
+                "success": False,
+                "index": None,
+                "error": f"Invalid date format: {str(batch_error)}"
+            }
+        
+        ids = np.arange(self.transaction_counter, self.transaction_counter + count, dtype=np.int64)
+        # Stable, so rows sharing a date keep their ID order
+        order = np.argsort(dates, kind='stable')
+        chunk = {
+            'Transaction ID': ids[order],
+            'Date': dates[order],
+            'Amount': np.asarray(columns['Amount'], dtype=float)[order],
+            'Category': np.asarray(columns['Category'], dtype=object)[order],
+            'Description': np.asarray(columns['Description'], dtype=object)[order],
+        }
+        self.transaction_counter += count
+        
+        last_date, last_balance = self._last_row()
+        if last_date is None or chunk['Date'][0] >= last_date:
+            chunk['Balance'] = last_balance + np.cumsum(chunk['Amount'])
+            self._pending.append(chunk)
+        else:
+            self._merge(chunk)
+        
+        self.current_balance = self._last_row()[1]
+        return {"success": True, "count": count, "balance": self.current_balance}
+    
     def add_transaction(
         self,
         date: str,
@@ -139,31 +411,26 @@ class TransactionManager:
         description: str = ""
     ) -> dict:
         """Add a new transaction"""
-        try:
-            date_obj = pd.to_datetime(date)
-        except Exception as e:
-            return {
-                "success": False,
-                "error": f"Invalid date format: {str(e)}"
-            }
+        result = self.add_transactions([(date, amount, category, description)])
+        if not result["success"]:
+            return {"success": False, "error": result["error"]}
         
-        balance = self.current_balance + amount
+        transaction_id = self.transaction_counter - 1
+        if self._pending and self._pending[-1]['Transaction ID'][-1] == transaction_id:
+            row = {column: values[-1] for column, values in self._pending[-1].items()}
+        else:
+            df = self._df
+            row = df.loc[df['Transaction ID'] == transaction_id].iloc[0].to_dict()
         
         new_transaction = {
-            'Transaction ID': self.transaction_counter,
-            'Date': date_obj,
-            'Amount': amount,
-            'Category': category,
-            'Description': description,
-            'Balance': balance
+            'Transaction ID': int(row['Transaction ID']),
+            'Date': pd.Timestamp(row['Date']),
+            'Amount': float(row['Amount']),
+            'Category': row['Category'],
+            'Description': row['Description'],
+            'Balance': float(row['Balance'])
         }
         
-        self.transactions_df.loc[len(self.transactions_df)] = new_transaction
-        self.current_balance = balance
-        self.transaction_counter += 1
-        
-        self._refresh_balance()
-        
         return {
             "success": True,
             "transaction": new_transaction,
@@ -221,33 +488,51 @@ class TransactionManager:
             "balance": self.current_balance
         }
     
-    def _refresh_balance(self) -> None:
-        """Refresh balance for all transactions"""
-        if self.transactions_df.empty:
-            return
-        
-        self.transactions_df.sort_values(
-            by=['Date', 'Transaction ID'],
-            inplace=True,
-            ignore_index=True
-        )
-        
-        balance = 0
-        balances = []
-        for amount in self.transactions_df['Amount']:
-            balance += amount
-            balances.append(balance)
-        
-        self.transactions_df['Balance'] = balances
-        self.transaction_counter = self.transactions_df['Transaction ID'].max() + 1
-        self.current_balance = balances[-1] if balances else 0.0
+    def _last_row(self) -> Tuple[Optional[np.datetime64], float]:
+        """Date and running balance of the latest transaction"""
+        if self._pending:
+            chunk = self._pending[-1]
+            return chunk['Date'][-1], float(chunk['Balance'][-1])
+        if self._df.empty:
+            return None, 0.0
+        return np.datetime64(self._df['Date'].iloc[-1], 'ns'), float(self._df['Balance'].iloc[-1])
+    
+    def _chunk_frame(self, chunks: List[Dict[str, np.ndarray]]) -> pd.DataFrame:
+        return pd.DataFrame({
+            column: np.concatenate([chunk[column] for chunk in chunks]) for column in self.COLUMNS
+        })
+    
+    def _flush(self) -> None:
+        """Merge the buffered in-order appends into the working DataFrame in one concat"""
+        appended = self._chunk_frame(self._pending)
+        self._pending = []
+        self._df = appended if self._df.empty else pd.concat([self._df, appended], ignore_index=True)
+    
+    def _merge(self, chunk: Dict[str, np.ndarray]) -> None:
+        """
+        Insert backdated rows. Rows dated up to the earliest new date keep
+        their place and balance; only the rest is re-sorted and re-summed.
+        """
+        if self._pending:
+            self._flush()
+        new_rows = self._chunk_frame([{**chunk, 'Balance': np.zeros(len(chunk['Amount']))}])
+        df = self._df
+        
+        # New IDs are the largest, so existing rows on the earliest new date stay before them
+        dates = df['Date'].to_numpy(dtype='datetime64[ns]')
+        split = int(np.searchsorted(dates, chunk['Date'][0], side='right'))
+        # Both parts are already in (Date, Transaction ID) order and every new ID is
+        # larger, so a stable sort on the date alone restores the full order
+        order = np.argsort(np.concatenate([dates[split:], chunk['Date']]), kind='stable')
+        tail = pd.concat([df.iloc[split:], new_rows], ignore_index=True).take(order).reset_index(drop=True)
+        
+        opening = float(df['Balance'].iloc[split - 1]) if split else 0.0
+        tail['Balance'] = opening + tail['Amount'].to_numpy(dtype=float).cumsum()
+        self._df = pd.concat([df.iloc[:split], tail], ignore_index=True) if split else tail
+    
+    def _sort_transactions(self) -> None:
+        self.transactions_df = sort_by_date(self.transactions_df)
     
     def _recalculate_balance(self) -> None:
         """Recalculate balance column"""
-        balance = 0
-        balances = []
-        for amount in self.transactions_df['Amount']:
-            balance += amount
-            balances.append(balance)
-        
-        self.transactions_df['Balance'] = balances
+        self.transactions_df['Balance'] = self.transactions_df['Amount'].to_numpy(dtype=float).cumsum()
@@ -1,16 +1,27 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.api.v1 import auth, piggy_banks, transactions, transfers, categories, statistics
+from app.api.v1 import auth, piggy_banks, transactions, transfers, categories, statistics, analytics, reports, imports, exports, system
+from app.api.middleware import MetricsMiddleware
+from app.core import security
 from app.core.config import settings
-from app.db.base import Base, engine
+from app.db import migrations
+from app.db.base import engine
 
-# Create the DB tables (Note: in production use Alembic migrations instead)
-Base.metadata.create_all(bind=engine)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Schema changes are applied by `python manage.py migrate`; workers only check the version
+    if settings.DB_SCHEMA_CHECK:
+        migrations.verify(engine)
+    yield
+    # Stop the bcrypt worker processes with the app rather than at interpreter exit
+    security.shutdown_password_hashing()
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
     openapi_url=f"{settings.API_V1_PREFIX}/openapi.json",
+    lifespan=lifespan,
 )
 
 # Set up CORS
@@ -23,6 +34,12 @@ if settings.ALLOWED_ORIGINS:
         allow_headers=["*"],
     )
 
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware, server_timing=settings.METRICS_SERVER_TIMING)
+
+# Hot routes are served with AsyncSession on the event loop in async mode
+async_mode = settings.DB_MODE == "async"
+
 # Routers
 app.include_router(
     auth.router, 
@@ -35,12 +52,17 @@ app.include_router(
     tags=["Piggy Banks (Subaccounts)"]
 )
 app.include_router(
-    transactions.router, 
+    transactions.async_router if async_mode else transactions.router,
     prefix=f"{settings.API_V1_PREFIX}", 
     tags=["Transactions"]
 )
 app.include_router(
-    transfers.router, 
+    imports.router,
+    prefix=f"{settings.API_V1_PREFIX}",
+    tags=["Imports"]
+)
+app.include_router(
+    transfers.async_router if async_mode else transfers.router,
     prefix=f"{settings.API_V1_PREFIX}/transfers", 
     tags=["Transfers"]
 )
@@ -50,10 +72,34 @@ app.include_router(
     tags=["Categories"]
 )
 app.include_router(
-    statistics.router,
+    exports.router,
+    prefix=f"{settings.API_V1_PREFIX}/export",
+    tags=["Exports"]
+)
+app.include_router(
+    statistics.async_router if async_mode else statistics.router,
     prefix=f"{settings.API_V1_PREFIX}/statistics",
     tags=["Statistics"]
 )
+app.include_router(
+    analytics.async_router if async_mode else analytics.router,
+    prefix=f"{settings.API_V1_PREFIX}/analytics",
+    tags=["Analytics"]
+)
+app.include_router(
+    reports.router,
+    prefix=f"{settings.API_V1_PREFIX}",
+    tags=["Reports"]
+)
+
+app.include_router(
+    system.router,
+    prefix=f"{settings.API_V1_PREFIX}/system",
+    tags=["System"]
+)
+
+if settings.METRICS_ENABLED:
+    app.include_router(system.metrics_router, tags=["System"])
 
 @app.get("/")
 def read_root():
@@ -0,0 +1,22 @@
+from sqlalchemy import Column, Integer, String, Float, ForeignKey
+from app.db.base import Base
+
+class BalanceCheckpoint(Base):
+    """
+    SQLAlchemy Model caching the closing balance of a PiggyBank at the end of a month.
+    Checkpoints are materialized lazily by point-in-time balance queries and
+    removed from the affected month onwards whenever that part of the ledger changes.
+
+    Attributes:
+        piggy_bank_id (int): Foreign key linking to the PiggyBank.
+        month (str): The `YYYY-MM` month the checkpoint closes.
+        closing_balance (float): Sum of all amounts dated up to the end of the month.
+        tx_count (int): Number of transactions dated up to the end of the month.
+    """
+    __tablename__ = "balance_checkpoints"
+
+    piggy_bank_id = Column(Integer, ForeignKey("piggy_banks.id", ondelete="CASCADE"), primary_key=True)
+    month = Column(String(7), primary_key=True)
+
+    closing_balance = Column(Float, nullable=False, default=0.0)
+    tx_count = Column(Integer, nullable=False, default=0)
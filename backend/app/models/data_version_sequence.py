@@ -0,0 +1,18 @@
+from sqlalchemy import Column, Integer
+from app.db.base import Base
+
+class DataVersionSequence(Base):
+    """
+    SQLAlchemy Model holding the single, global source of data versions.
+    Unlike the per-user rows it has no foreign key, so it survives account
+    deletions: a version number is never handed out twice, even when SQLite
+    reuses the id of a deleted user.
+    
+    Attributes:
+        id (int): Primary key, always 1.
+        value (int): The last version handed out.
+    """
+    __tablename__ = "data_version_sequence"
+
+    id = Column(Integer, primary_key=True)
+    value = Column(Integer, nullable=False, default=0)
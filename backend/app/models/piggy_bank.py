@@ -1,5 +1,5 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, UniqueConstraint
-from sqlalchemy.orm import relationship
+from sqlalchemy import Boolean, Column, Integer, String, Float, ForeignKey, UniqueConstraint
+from sqlalchemy.orm import backref, relationship
 from app.db.base import Base
 
 class PiggyBank(Base):
@@ -11,18 +11,26 @@ class PiggyBank(Base):
         user_id (int): Foreign key linking to the User who owns this PiggyBank.
         name (str): The display name of the PiggyBank.
         currency (str): The currency identifier (default 'USD').
+        balance (float): Running sum of all transaction amounts, kept in step with every ledger write.
+        transaction_count (int): Running number of transactions.
+        deleting (bool): Set while a chunked purge removes the PiggyBank; it is hidden from then on.
     """
     __tablename__ = "piggy_banks"
 
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     name = Column(String(50), nullable=False)
     currency = Column(String(10), nullable=False, default="USD")
+    balance = Column(Float, nullable=False, default=0.0, server_default="0")
+    transaction_count = Column(Integer, nullable=False, default=0, server_default="0")
+    deleting = Column(Boolean, nullable=False, default=False, server_default="0")
 
     __table_args__ = (
         UniqueConstraint("user_id", "name", name="uq_user_piggy_bank"),
     )
 
-    # Relationships
-    user = relationship("User", backref="piggy_banks")
-    transactions = relationship("Transaction", back_populates="piggy_bank", cascade="all, delete-orphan")
+    # Relationships; child rows are removed by ON DELETE CASCADE, never loaded for deletion
+    user = relationship("User", backref=backref("piggy_banks", cascade="all, delete-orphan", passive_deletes=True))
+    transactions = relationship(
+        "Transaction", back_populates="piggy_bank", cascade="all, delete-orphan", passive_deletes=True
+    )
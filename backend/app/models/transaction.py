@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Index, DDL, event
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.base import Base
+from app.db import fts
 
 class Transaction(Base):
     """
@@ -19,7 +20,7 @@ class Transaction(Base):
     __tablename__ = "transactions"
 
     id = Column(Integer, primary_key=True, index=True)
-    piggy_bank_id = Column(Integer, ForeignKey("piggy_banks.id"), nullable=False)
+    piggy_bank_id = Column(Integer, ForeignKey("piggy_banks.id", ondelete="CASCADE"), nullable=False)
     
     amount = Column(Float, nullable=False)
     type = Column(String(50), nullable=False, default='expense')
@@ -29,5 +30,18 @@ class Transaction(Base):
     date = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    __table_args__ = (
+        # Listing, keyset pagination and per-bank date scans
+        Index("ix_transactions_pb_date_id", "piggy_bank_id", "date", "id"),
+        # Category filters and breakdowns within a piggy bank
+        Index("ix_transactions_pb_category", "piggy_bank_id", "category"),
+    )
+
     # Relationships
     piggy_bank = relationship("PiggyBank", back_populates="transactions")
+
+# Full-text search index over description/category, kept in sync by triggers
+for statement in fts.CREATE_STATEMENTS:
+    event.listen(Transaction.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+for statement in fts.DROP_STATEMENTS:
+    event.listen(Transaction.__table__, "before_drop", DDL(statement).execute_if(dialect="sqlite"))
@@ -0,0 +1,28 @@
+from sqlalchemy import Column, Integer, String, Float, ForeignKey
+from app.db.base import Base
+
+class TransactionRollup(Base):
+    """
+    SQLAlchemy Model holding monthly pre-aggregated transaction totals.
+    Maintained alongside every transaction write so analytics scale with the
+    number of months instead of the number of transactions.
+    
+    Attributes:
+        piggy_bank_id (int): Foreign key linking to the aggregated PiggyBank.
+        month (str): The `YYYY-MM` bucket of the transaction dates.
+        type (str): The transaction classification shared by the bucket.
+        category (str): The category shared by the bucket ('' when missing).
+        credit_total (float): Sum of the positive amounts in the bucket.
+        debit_total (float): Sum of the negative amounts in the bucket.
+        tx_count (int): Number of transactions in the bucket.
+    """
+    __tablename__ = "transaction_rollups"
+
+    piggy_bank_id = Column(Integer, ForeignKey("piggy_banks.id", ondelete="CASCADE"), primary_key=True)
+    month = Column(String(7), primary_key=True)
+    type = Column(String(50), primary_key=True)
+    category = Column(String(100), primary_key=True, default="")
+
+    credit_total = Column(Float, nullable=False, default=0.0)
+    debit_total = Column(Float, nullable=False, default=0.0)
+    tx_count = Column(Integer, nullable=False, default=0)
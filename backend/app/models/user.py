@@ -11,6 +11,7 @@ class User(Base):
         username (str): The chosen display name for the user.
         email (str): The user's secure contact email.
         hashed_password (str): Bcrypt encrypted password payload.
+        deleting (bool): Set while a chunked purge removes the account; it is also deactivated.
     """
     __tablename__ = "users"
 
@@ -19,4 +20,5 @@ class User(Base):
     email = Column(String(255), unique=True, index=True, nullable=False)
     hashed_password = Column(String(255), nullable=False)
     is_active = Column(Boolean, default=True)
+    deleting = Column(Boolean, nullable=False, default=False, server_default="0")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -0,0 +1,17 @@
+from sqlalchemy import Column, Integer, ForeignKey
+from app.db.base import Base
+
+class UserDataVersion(Base):
+    """
+    SQLAlchemy Model holding a per-user data version counter.
+    Every write path bumps it inside its own DB transaction, which lets read
+    caches and ETags detect changes across processes.
+    
+    Attributes:
+        user_id (int): Primary key and foreign key linking to the User.
+        version (int): Last value drawn from the global DataVersionSequence.
+    """
+    __tablename__ = "user_data_versions"
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
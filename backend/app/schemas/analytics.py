@@ -0,0 +1,18 @@
+from typing import Dict, List, Literal, Optional, Union
+from pydantic import BaseModel
+
+Dimension = Literal[
+    "day", "week", "month", "quarter", "year", "weekday",
+    "piggy_bank", "currency", "type", "category",
+]
+Measure = Literal["sum", "count", "avg", "min", "max"]
+
+class CubeResponse(BaseModel):
+    """
+    Schema for a columnar analytics cube: one array per dimension and measure,
+    all of the same length, so charts can bind series without reshaping rows.
+    """
+    dimensions: List[Dimension]
+    measures: List[Measure]
+    columns: Dict[str, List[Optional[Union[int, float, str]]]]
+    row_count: int
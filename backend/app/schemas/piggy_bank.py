@@ -1,3 +1,5 @@
+from datetime import datetime
+from typing import Optional
 from pydantic import BaseModel
 
 class PiggyBankCreate(BaseModel):
@@ -18,3 +20,11 @@ class PiggyBankRead(BaseModel):
 
     class Config:
         from_attributes = True
+
+class PiggyBankSummary(PiggyBankRead):
+    """
+    Schema for a PiggyBank together with its balance and latest activity.
+    """
+    balance: float
+    transaction_count: int
+    last_activity: Optional[datetime] = None
@@ -0,0 +1,32 @@
+from pydantic import BaseModel
+from typing import List, Optional
+
+class ColumnMapping(BaseModel):
+    """
+    Schema mapping the columns of a CSV bank statement onto transaction fields.
+    Values are CSV header names; unmapped optional fields are left empty.
+    """
+    date: str = "date"
+    amount: str = "amount"
+    type: Optional[str] = None
+    category: Optional[str] = None
+    description: Optional[str] = None
+    date_format: Optional[str] = None
+    delimiter: str = ","
+    encoding: str = "utf-8-sig"
+
+class StatementImportError(BaseModel):
+    """
+    Schema describing a rejected statement row.
+    """
+    line: int
+    detail: str
+
+class StatementImportResult(BaseModel):
+    """
+    Schema for the outcome of a statement import.
+    `errors` is capped; `rejected` always holds the full count.
+    """
+    imported: int
+    rejected: int
+    errors: List[StatementImportError]
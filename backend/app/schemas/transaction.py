@@ -1,6 +1,6 @@
 from pydantic import BaseModel
 from datetime import datetime
-from typing import Optional
+from typing import Any, List, Optional
 
 class TransactionCreate(BaseModel):
     """
@@ -28,6 +28,29 @@ class TransactionRead(BaseModel):
     class Config:
         from_attributes = True
 
+class TransactionBatchError(BaseModel):
+    """
+    Schema describing why a single item of a batch was rejected.
+    """
+    index: int
+    detail: Any
+
+class TransactionBatchResult(BaseModel):
+    """
+    Schema for the outcome of a batch insert: ids of the created rows (in
+    request order) and the rejected items.
+    """
+    created_ids: List[int]
+    errors: List[TransactionBatchError]
+
+class TransactionPage(BaseModel):
+    """
+    Schema for one keyset page of transactions.
+    `next_cursor` is opaque and must be passed back verbatim to fetch the next page.
+    """
+    items: List[TransactionRead]
+    next_cursor: Optional[str] = None
+
 class TransferCreate(BaseModel):
     """
     Schema for validating incoming data when transferring funds between two PiggyBanks.
@@ -1,5 +1,4 @@
 from pydantic import BaseModel, EmailStr
-from typing import Optional
 
 class UserBase(BaseModel):
     username: str
@@ -17,6 +16,3 @@ class UserResponse(UserBase):
 
     class Config:
         from_attributes = True
-
-class UserUpdate(BaseModel):
-    password: Optional[str] = None
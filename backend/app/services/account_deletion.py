@@ -0,0 +1,120 @@
+"""
+Application Service - Chunked Account Deletion
+Deleting a piggy bank or user is one statement thanks to ON DELETE CASCADE,
+but for accounts with a very large ledger that statement holds the SQLite
+write lock for the whole cascade. These purges remove transactions in
+bounded chunks, committing after each so other writers get the lock in
+between, and only delete the parent rows once little is left to cascade.
+They run as background tasks after the request's session is closed, so they
+take ids and open a session of their own.
+
+Before a purge is scheduled the user or piggy bank is flagged `deleting`, which
+hides it right away and survives a restart: `resume_purges` (run by
+`python manage.py purge-deleted`) finishes every purge that was cut short.
+"""
+import time
+from typing import List, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.repositories.data_version_repo import DataVersionRepository
+from app.db.repositories.transaction_repo import TransactionRepository
+from app.db.session import SessionLocal
+from app.models.piggy_bank import PiggyBank
+from app.models.user import User
+
+# Breathing room for writers waiting on busy_timeout between two chunks
+PAUSE_SECONDS = 0.01
+
+
+def needs_chunked_delete(transaction_count: int) -> bool:
+    return transaction_count > settings.ACCOUNT_DELETE_CHUNK_SIZE
+
+
+def mark_user_deleting(db: Session, user_id: int) -> bool:
+    """
+    Deactivate the account and flag it for a chunked purge. Returns False if
+    it was already flagged; the caller commits.
+    """
+    return db.query(User).filter(User.id == user_id, User.deleting.is_(False)).update(
+        {User.is_active: False, User.deleting: True}, synchronize_session=False
+    ) == 1
+
+
+def purge_transactions(
+    db: Session,
+    user_id: int,
+    pb_ids: List[int],
+    chunk_size: int = None,
+    pause: float = PAUSE_SECONDS,
+) -> int:
+    """
+    Delete every transaction of the given piggy banks, one short write
+    transaction per chunk. Returns the number of deleted transactions.
+    """
+    chunk_size = chunk_size or settings.ACCOUNT_DELETE_CHUNK_SIZE
+    repo = TransactionRepository(db)
+    versions = DataVersionRepository(db)
+    total = 0
+    while pb_ids:
+        deleted = repo.delete_chunk(pb_ids, chunk_size)
+        # Cached reads must not outlive the rows they were computed from
+        versions.bump(user_id)
+        db.commit()
+        total += deleted
+        if deleted < chunk_size:
+            break
+        time.sleep(pause)
+    return total
+
+
+def purge_piggy_bank(user_id: int, pb_id: int, chunk_size: int = None) -> int:
+    db = SessionLocal()
+    try:
+        deleted = purge_transactions(db, user_id, [pb_id], chunk_size)
+        db.query(PiggyBank).filter(PiggyBank.id == pb_id).delete(synchronize_session=False)
+        DataVersionRepository(db).bump(user_id)
+        db.commit()
+        return deleted
+    finally:
+        db.close()
+
+
+def purge_user(user_id: int, chunk_size: int = None) -> int:
+    db = SessionLocal()
+    try:
+        pb_ids = [
+            pb_id for (pb_id,) in db.query(PiggyBank.id).filter(PiggyBank.user_id == user_id)
+        ]
+        deleted = purge_transactions(db, user_id, pb_ids, chunk_size)
+        # Piggy banks, categories and the data version follow via the cascade
+        db.query(User).filter(User.id == user_id).delete(synchronize_session=False)
+        db.commit()
+        return deleted
+    finally:
+        db.close()
+
+
+def resume_purges(chunk_size: int = None) -> Tuple[int, int]:
+    """
+    Finish every purge that was flagged but never completed, e.g. because the
+    worker restarted mid-way. Returns the number of users and piggy banks purged.
+    """
+    db = SessionLocal()
+    try:
+        user_ids = [user_id for (user_id,) in db.query(User.id).filter(User.deleting.is_(True))]
+    finally:
+        db.close()
+    for user_id in user_ids:
+        purge_user(user_id, chunk_size)
+
+    # Banks of purged users are gone by now; what's left belongs to active accounts
+    db = SessionLocal()
+    try:
+        banks = db.query(PiggyBank.user_id, PiggyBank.id).filter(PiggyBank.deleting.is_(True)).all()
+    finally:
+        db.close()
+    for user_id, pb_id in banks:
+        purge_piggy_bank(user_id, pb_id, chunk_size)
+    return len(user_ids), len(banks)
@@ -0,0 +1,104 @@
+"""
+Application Service - Piggy Bank Reports
+SQL implementation of the reports the CSV-era `ReportGenerator` builds with
+pandas. The method names and payloads are the same, but every figure comes
+from an aggregate query over one piggy bank's ledger, so nothing is loaded
+into memory and the opening balance covers the full history rather than a
+single year file. Monthly and yearly reports only touch the monthly rollups
+and balance checkpoints, so their cost does not grow with the ledger.
+"""
+from datetime import datetime
+from typing import Dict, Optional
+
+from sqlalchemy.orm import Session
+
+from app.db.repositories.checkpoint_repo import CheckpointRepository
+from app.db.repositories.report_repo import ReportRepository
+
+# Moving money into savings is not spending; left out of the monthly breakdown
+SAVINGS_CATEGORY = "savings"
+
+
+def _breakdowns(rows) -> Dict[str, Dict[str, float]]:
+    """Expenses most negative first and income largest first, ties by name."""
+    expenses = sorted(
+        ((category, float(total)) for category, _, total in rows if total < 0),
+        key=lambda item: (item[1], item[0]),
+    )
+    income = sorted(
+        ((category, float(total)) for category, total, _ in rows if total > 0),
+        key=lambda item: (-item[1], item[0]),
+    )
+    return {"expense_by_category": dict(expenses), "income_by_category": dict(income)}
+
+
+class SQLReportGenerator:
+    """
+    Generates financial reports for one piggy bank. Opening balances are read
+    through the balance checkpoints, so callers should commit afterwards to
+    keep any checkpoints materialized along the way.
+    """
+
+    def __init__(self, db: Session, piggy_bank_id: int):
+        self.pb_id = piggy_bank_id
+        self.reports = ReportRepository(db)
+        self.checkpoints = CheckpointRepository(db)
+
+    def _months(self, year: int, first: int, last: int, exclude_expense_categories=()):
+        """Return the report fields for months `first`..`last` of `year`, plus the per-month rows."""
+        first_month, last_month = f"{year}-{first:02d}", f"{year}-{last:02d}"
+        months = self.reports.month_totals(self.pb_id, first_month, last_month)
+        categories = self.reports.month_category_totals(
+            self.pb_id, first_month, last_month, exclude_expense_categories
+        )
+        balance_before, _ = self.checkpoints.balance_before(self.pb_id, datetime(year, first, 1))
+        income = sum(row[1] for row in months)
+        expenses = sum(row[2] for row in months)
+        net = income + expenses
+        report = {
+            "balance_before": float(balance_before),
+            "income": float(income),
+            "expenses": float(expenses),
+            "net": float(net),
+            "balance_after": float(balance_before + net),
+            "transaction_count": sum(row[3] for row in months),
+            **_breakdowns(categories),
+        }
+        return report, months
+
+    def generate_monthly_report(self, year: int, month: int) -> Dict:
+        """
+        Generate monthly financial report
+        """
+        report, _ = self._months(year, month, month, exclude_expense_categories=(SAVINGS_CATEGORY,))
+        return {"year": year, "month": month, "period": f"{year}-{month:02d}", **report}
+
+    def generate_yearly_report(self, year: int) -> Dict:
+        """Generate yearly financial report"""
+        report, months = self._months(year, 1, 12)
+        totals = {month: (income, expenses) for month, income, expenses, _ in months}
+
+        monthly_summary = []
+        for month in range(1, 13):
+            income, expenses = totals.get(f"{year}-{month:02d}", (0.0, 0.0))
+            monthly_summary.append({
+                "month": month,
+                "income": float(income),
+                "expenses": float(expenses),
+                "net": float(income + expenses),
+            })
+        return {"year": year, **report, "monthly_summary": monthly_summary}
+
+    def get_category_summary(
+        self, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None
+    ) -> Dict:
+        """
+        Get spending summary by category for a date range (both ends inclusive)
+        """
+        income, expenses = self.reports.totals(self.pb_id, start_date, end_date)
+        categories = self.reports.category_totals(self.pb_id, start_date, end_date)
+        return {
+            "total_income": float(income),
+            "total_expenses": float(expenses),
+            **_breakdowns(categories),
+        }
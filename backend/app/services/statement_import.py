@@ -0,0 +1,224 @@
+"""
+Application Service - Streaming Bank Statement Import
+Parses CSV, OFX and QIF statements row by row and inserts them in bounded
+chunks, so memory use does not depend on the size of the file.
+"""
+import csv
+import re
+from datetime import datetime
+from typing import Callable, Dict, Iterator, Optional, TextIO, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy.orm import Session
+
+from app.db.repositories.data_version_repo import DataVersionRepository
+from app.db.repositories.transaction_repo import TransactionRepository
+from app.schemas.statement_import import ColumnMapping
+from app.schemas.transaction import TransactionCreate
+
+SUPPORTED_FORMATS = ("csv", "ofx", "qif")
+DEFAULT_CHUNK_SIZE = 1000
+MAX_REPORTED_ERRORS = 1000
+
+# A parsed statement record: source line number + raw field values
+Record = Tuple[int, Dict[str, Optional[str]]]
+
+
+def parse_amount(value: Optional[str]) -> float:
+    """
+    Parse statement amounts such as '1,234.50', '$-12', '(12.00)' or '12.00-'.
+    """
+    if value is None or not value.strip():
+        raise ValueError("Missing amount")
+    text = re.sub(r"[^\d.,()+-]", "", value)
+    negative = text.startswith("(") and text.endswith(")") or text.endswith("-")
+    text = text.strip("()").rstrip("-").replace(",", "")
+    amount = float(text)
+    return -abs(amount) if negative else amount
+
+
+def parse_date(value: Optional[str], date_format: Optional[str] = None) -> datetime:
+    if value is None or not value.strip():
+        raise ValueError("Missing date")
+    value = value.strip()
+    if date_format:
+        return datetime.strptime(value, date_format)
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        pass
+    for fmt in ("%Y/%m/%d", "%Y%m%d"):
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    raise ValueError(f"Unrecognized date '{value}'; pass a date_format")
+
+
+def parse_qif_date(value: Optional[str], date_format: Optional[str] = None) -> datetime:
+    """QIF dates are US-style and may use an apostrophe before the year (1/ 5'24)."""
+    if date_format or value is None:
+        return parse_date(value, date_format)
+    parts = re.split(r"[/'\-.]", value.replace(" ", ""))
+    if len(parts) != 3:
+        return parse_date(value)
+    month, day, year = (int(p) for p in parts)
+    if year < 100:
+        year += 2000 if year < 70 else 1900
+    return datetime(year, month, day)
+
+
+def parse_ofx_date(value: Optional[str]) -> datetime:
+    """OFX dates look like YYYYMMDD[HHMMSS[.XXX]][offset:TZ]; only the digits matter."""
+    digits = re.match(r"\d+", value or "")
+    if not digits or len(digits.group()) < 8:
+        raise ValueError(f"Invalid OFX date '{value}'")
+    text = digits.group()[:14]
+    return datetime.strptime(text, "%Y%m%d%H%M%S" if len(text) == 14 else "%Y%m%d")
+
+
+def iter_csv_records(stream: TextIO, mapping: ColumnMapping) -> Iterator[Record]:
+    reader = csv.DictReader(stream, delimiter=mapping.delimiter)
+    header = reader.fieldnames or []
+    missing = [c for c in (mapping.date, mapping.amount) if c not in header]
+    if missing:
+        raise ValueError(f"CSV header is missing mapped columns: {', '.join(missing)}")
+
+    for row in reader:
+        yield reader.line_num, {
+            "date": row.get(mapping.date),
+            "amount": row.get(mapping.amount),
+            "type": row.get(mapping.type) if mapping.type else None,
+            "category": row.get(mapping.category) if mapping.category else None,
+            "description": row.get(mapping.description) if mapping.description else None,
+        }
+
+
+QIF_FIELDS = {"D": "date", "T": "amount", "U": "amount", "P": "description", "M": "memo", "L": "category"}
+
+def iter_qif_records(stream: TextIO) -> Iterator[Record]:
+    record, start = {}, None
+    for line_no, line in enumerate(stream, 1):
+        line = line.rstrip("\r\n")
+        if not line or line.startswith("!"):
+            continue
+        code, value = line[0], line[1:].strip()
+        if code == "^":
+            if record:
+                yield start, record
+            record, start = {}, None
+        elif code in QIF_FIELDS:
+            start = start or line_no
+            record.setdefault(QIF_FIELDS[code], value)
+    if record:
+        yield start, record
+
+
+OFX_TOKEN = re.compile(r"<(/?)([A-Za-z0-9.]+)>([^<]*)")
+OFX_FIELDS = {"DTPOSTED": "date", "TRNAMT": "amount", "NAME": "description", "MEMO": "memo", "TRNTYPE": "ofx_type"}
+
+def iter_ofx_records(stream: TextIO, read_size: int = 64 * 1024) -> Iterator[Record]:
+    """
+    Tokenize SGML or XML OFX in fixed-size reads, so even single-line files
+    are processed without loading them whole.
+    """
+    buffer, record, index = "", None, 0
+    while True:
+        chunk = stream.read(read_size)
+        buffer += chunk
+        # Keep a possibly incomplete trailing tag for the next read
+        cut = buffer.rfind("<") if chunk else len(buffer)
+        if cut <= 0 and chunk:
+            continue
+        for closing, tag, value in OFX_TOKEN.findall(buffer[:cut]):
+            tag = tag.upper()
+            if tag == "STMTTRN":
+                if closing and record is not None:
+                    index += 1
+                    yield index, record
+                    record = None
+                elif not closing:
+                    record = {}
+            elif record is not None and not closing and tag in OFX_FIELDS:
+                record[OFX_FIELDS[tag]] = value.strip()
+        buffer = buffer[cut:]
+        if not chunk:
+            break
+
+
+def iter_records(stream: TextIO, fmt: str, mapping: ColumnMapping) -> Iterator[Record]:
+    if fmt == "csv":
+        return iter_csv_records(stream, mapping)
+    if fmt == "qif":
+        return iter_qif_records(stream)
+    if fmt == "ofx":
+        return iter_ofx_records(stream)
+    raise ValueError(f"Unsupported statement format '{fmt}'. Use one of: {', '.join(SUPPORTED_FORMATS)}")
+
+
+def to_payload(record: Dict[str, Optional[str]], fmt: str, mapping: ColumnMapping) -> TransactionCreate:
+    if fmt == "ofx":
+        date = parse_ofx_date(record.get("date"))
+    elif fmt == "qif":
+        date = parse_qif_date(record.get("date"), mapping.date_format)
+    else:
+        date = parse_date(record.get("date"), mapping.date_format)
+    amount = parse_amount(record.get("amount"))
+
+    # Statements rarely carry our types; fall back to the sign of the amount
+    tx_type = (record.get("type") or "").strip().lower() or ("income" if amount > 0 else "expense")
+    return TransactionCreate(
+        amount=amount,
+        type=tx_type,
+        category=(record.get("category") or "").strip() or None,
+        description=(record.get("description") or record.get("memo") or "").strip() or None,
+        date=date,
+    )
+
+
+def import_statement(
+    db: Session,
+    user_id: int,
+    pb_id: int,
+    stream: TextIO,
+    fmt: str,
+    mapping: Optional[ColumnMapping] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> dict:
+    """
+    Stream a statement into a piggy bank the caller has already authorized.
+    Valid rows are bulk inserted and committed every `chunk_size` rows;
+    invalid rows are counted and reported without aborting the import.
+    `progress(imported, rejected)` is called after every committed chunk.
+    """
+    mapping = mapping or ColumnMapping()
+    repo = TransactionRepository(db)
+    versions = DataVersionRepository(db)
+    result = {"imported": 0, "rejected": 0, "errors": []}
+    chunk = []
+
+    def flush():
+        if not chunk:
+            return
+        repo.add_many(pb_id, chunk)
+        versions.bump(user_id)
+        db.commit()
+        result["imported"] += len(chunk)
+        chunk.clear()
+        if progress:
+            progress(result["imported"], result["rejected"])
+
+    for line, record in iter_records(stream, fmt, mapping):
+        try:
+            chunk.append(to_payload(record, fmt, mapping))
+        except (ValueError, ValidationError) as e:
+            result["rejected"] += 1
+            if len(result["errors"]) < MAX_REPORTED_ERRORS:
+                result["errors"].append({"line": line, "detail": str(e)})
+            continue
+        if len(chunk) >= chunk_size:
+            flush()
+    flush()
+
+    return result
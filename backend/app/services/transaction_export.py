@@ -0,0 +1,85 @@
+"""
+Application Service - Streaming Transaction Export
+Serializes rows from TransactionRepository.iter_for_export as CSV, NDJSON
+or Parquet without holding the full result set in memory.
+"""
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Iterable, Iterator, Sequence
+
+EXPORT_FORMATS = ("csv", "ndjson", "parquet")
+MEDIA_TYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+def iter_csv(columns: Sequence[str], rows: Iterable[tuple], flush_every: int = 500) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for count, row in enumerate(rows, 1):
+        writer.writerow(row)
+        if count % flush_every == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def iter_ndjson(columns: Sequence[str], rows: Iterable[tuple], flush_every: int = 500) -> Iterator[str]:
+    lines = []
+    for row in rows:
+        record = {
+            column: value.isoformat() if isinstance(value, datetime) else value
+            for column, value in zip(columns, row)
+        }
+        lines.append(json.dumps(record) + "\n")
+        if len(lines) >= flush_every:
+            yield "".join(lines)
+            lines.clear()
+    if lines:
+        yield "".join(lines)
+
+
+def write_parquet(path: str, rows: Iterable[tuple], batch_size: int = 10000) -> int:
+    """
+    Write export rows to a Parquet file one record batch at a time.
+    Requires the optional `pyarrow` dependency. Returns the number of rows written.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    # Same order as TransactionRepository.EXPORT_COLUMNS
+    schema = pa.schema([
+        ("id", pa.int64()),
+        ("piggy_bank_id", pa.int64()),
+        ("piggy_bank", pa.string()),
+        ("currency", pa.string()),
+        ("date", pa.timestamp("us")),
+        ("type", pa.string()),
+        ("category", pa.string()),
+        ("description", pa.string()),
+        ("amount", pa.float64()),
+    ])
+
+    def to_record_batch(batch):
+        arrays = [pa.array(values, type=field.type) for values, field in zip(zip(*batch), schema)]
+        return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+    written = 0
+    with pq.ParquetWriter(path, schema, compression="zstd") as writer:
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= batch_size:
+                writer.write_batch(to_record_batch(batch))
+                written += len(batch)
+                batch.clear()
+        if batch:
+            writer.write_batch(to_record_batch(batch))
+            written += len(batch)
+    return written
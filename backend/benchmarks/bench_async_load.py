@@ -0,0 +1,136 @@
+"""
+Load test - sync vs async request path
+
+Starts the API under uvicorn twice on a fresh file-backed database, once with
+DB_MODE=sync (threadpool + Session) and once with DB_MODE=async (event loop +
+AsyncSession over aiosqlite), and drives both with the same concurrent mix of
+keyset-paginated listings, balance lookups and transaction inserts.
+
+Target at 64 concurrent clients:
+    - async throughput >= sync throughput, with a lower p99 latency
+
+Run from the backend/ directory:
+    python -m benchmarks.bench_async_load [--concurrency 64] [--seconds 10]
+"""
+import argparse
+import asyncio
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(mode, db_path, port):
+    env = dict(os.environ, DB_MODE=mode, DATABASE_URL=f"sqlite:///{db_path}")
+    subprocess.run([sys.executable, "manage.py", "migrate"], env=env, check=True, stdout=subprocess.DEVNULL)
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        env=env,
+    )
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/", timeout=1)
+            return process
+        except httpx.TransportError:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError(f"uvicorn did not start in {mode} mode")
+
+
+async def seed(client, rows):
+    await client.post("/api/v1/auth/register", json={
+        "username": "load", "email": "load@example.com", "password": "password"
+    })
+    token = (await client.post("/api/v1/auth/login", data={
+        "username": "load@example.com", "password": "password"
+    })).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    pb_id = (await client.post("/api/v1/piggy-banks", headers=headers, json={"name": "Load"})).json()["id"]
+    await client.post(
+        f"/api/v1/piggy-banks/{pb_id}/transactions:batch",
+        headers=headers,
+        json=[{"amount": -(i % 40) - 1.0, "category": f"Category {i % 6}", "description": f"Row {i}"}
+              for i in range(rows)],
+    )
+    return headers, pb_id
+
+
+async def drive(base_url, concurrency, seconds, rows):
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+        headers, pb_id = await seed(client, rows)
+        latencies, failures = [], 0
+        deadline = time.perf_counter() + seconds
+
+        async def worker(seed_value):
+            nonlocal failures
+            rng = random.Random(seed_value)
+            while time.perf_counter() < deadline:
+                roll = rng.random()
+                started = time.perf_counter()
+                if roll < 0.6:
+                    response = await client.get(
+                        f"/api/v1/piggy-banks/{pb_id}/transactions/paged", params={"limit": 50}, headers=headers
+                    )
+                elif roll < 0.9:
+                    response = await client.get(f"/api/v1/piggy-banks/{pb_id}/balance", headers=headers)
+                else:
+                    response = await client.post(
+                        f"/api/v1/piggy-banks/{pb_id}/transactions", headers=headers, json={"amount": -1.0}
+                    )
+                latencies.append(time.perf_counter() - started)
+                if response.status_code >= 400:
+                    failures += 1
+
+        await asyncio.gather(*(worker(i) for i in range(concurrency)))
+
+    latencies.sort()
+    return {
+        "rps": len(latencies) / seconds,
+        "p50": statistics.median(latencies) * 1000,
+        "p99": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        "failures": failures,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--rows", type=int, default=5000)
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode in ("sync", "async"):
+            port = free_port()
+            process = start_server(mode, os.path.join(tmp, f"{mode}.db"), port)
+            try:
+                results[mode] = asyncio.run(
+                    drive(f"http://127.0.0.1:{port}", args.concurrency, args.seconds, args.rows)
+                )
+            finally:
+                process.terminate()
+                process.wait()
+
+    print(f"{args.concurrency} clients, {args.seconds:g}s per mode")
+    print(f"{'mode':<8}{'req/s':>10}{'p50':>10}{'p99':>10}{'failures':>10}")
+    for mode, result in results.items():
+        print(f"{mode:<8}{result['rps']:>10.0f}{result['p50']:>8.1f}ms{result['p99']:>8.1f}ms{result['failures']:>10}")
+
+
+if __name__ == "__main__":
+    main()
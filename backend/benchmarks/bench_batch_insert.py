@@ -0,0 +1,101 @@
+"""
+Benchmark - Batch vs per-row transaction inserts
+
+Compares the per-row write path used by `POST /piggy-banks/{pb_id}/transactions`
+(one INSERT + rollup upsert + commit per transaction) with the batch path used by
+`POST /piggy-banks/{pb_id}/transactions:batch` (one executemany + one commit).
+
+Throughput targets on a file-backed SQLite database:
+    - batch path: >= 20,000 rows/s for a 5,000-item batch
+    - batch path: >= 50x faster than committing one row at a time
+
+Run from the backend/ directory:
+    python -m benchmarks.bench_batch_insert [--rows 5000]
+"""
+import argparse
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db.base import Base
+from app.db.repositories.transaction_repo import TransactionRepository
+from app.models.piggy_bank import PiggyBank
+from app.models.transaction import Transaction
+from app.models.user import User
+from app.schemas.transaction import TransactionCreate
+
+
+def make_session(path):
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine)
+    db = Session()
+    user = User(username="bench", email="bench@example.com", hashed_password="x")
+    db.add(user)
+    db.flush()
+    pb = PiggyBank(user_id=user.id, name="Bench", currency="USD")
+    db.add(pb)
+    db.commit()
+    return engine, db, pb.id
+
+
+def make_payloads(rows):
+    start = datetime(2020, 1, 1)
+    return [
+        TransactionCreate(
+            amount=(-1) ** i * (i % 97 + 0.5),
+            type="expense" if i % 2 else "income",
+            category=f"Category {i % 12}",
+            description=f"Row {i}",
+            date=start + timedelta(hours=i),
+        )
+        for i in range(rows)
+    ]
+
+
+def bench_per_row(path, payloads):
+    engine, db, pb_id = make_session(path)
+    repo = TransactionRepository(db)
+    started = time.perf_counter()
+    for payload in payloads:
+        repo.add(Transaction(piggy_bank_id=pb_id, **payload.model_dump()))
+        db.commit()
+    elapsed = time.perf_counter() - started
+    db.close()
+    engine.dispose()
+    return elapsed
+
+
+def bench_batch(path, payloads):
+    engine, db, pb_id = make_session(path)
+    started = time.perf_counter()
+    TransactionRepository(db).add_many(pb_id, payloads)
+    db.commit()
+    elapsed = time.perf_counter() - started
+    db.close()
+    engine.dispose()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=5000)
+    args = parser.parse_args()
+
+    payloads = make_payloads(args.rows)
+    with tempfile.TemporaryDirectory() as tmp:
+        per_row = bench_per_row(os.path.join(tmp, "per_row.db"), payloads)
+        batch = bench_batch(os.path.join(tmp, "batch.db"), payloads)
+
+    print(f"rows:    {args.rows}")
+    print(f"per-row: {per_row:8.3f}s  {args.rows / per_row:10.0f} rows/s")
+    print(f"batch:   {batch:8.3f}s  {args.rows / batch:10.0f} rows/s")
+    print(f"speedup: {per_row / batch:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Benchmark - login latency with offloaded bcrypt
+
+Starts the API under uvicorn twice on a fresh database: once hashing on the
+shared threadpool (PASSWORD_HASH_WORKERS=0, the previous behaviour) and once
+with the bounded bcrypt process pool. Concurrent clients hammer
+`POST /auth/login` while probe clients keep paging transactions, so the run
+shows both login latency and how much a login burst slows other routes.
+
+Targets with 32 login clients and 8 probe clients:
+    - probe p99 with the pool: <= 1/2 of the threadpool run (needs spare cores)
+    - no login errors other than 503 back-pressure
+
+Run from the backend/ directory:
+    python -m benchmarks.bench_login [--logins 32] [--probes 8] [--seconds 10]
+"""
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(db_path, port, workers):
+    env = dict(os.environ, DATABASE_URL=f"sqlite:///{db_path}", PASSWORD_HASH_WORKERS=str(workers))
+    subprocess.run([sys.executable, "manage.py", "migrate"], env=env, check=True, stdout=subprocess.DEVNULL)
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        env=env,
+    )
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/", timeout=1)
+            return process
+        except httpx.TransportError:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError("uvicorn did not start")
+
+
+def summarize(latencies):
+    if not latencies:
+        return {"count": 0, "p50": 0.0, "p99": 0.0}
+    latencies = sorted(latencies)
+    return {
+        "count": len(latencies),
+        "p50": statistics.median(latencies) * 1000,
+        "p99": latencies[max(int(len(latencies) * 0.99) - 1, 0)] * 1000,
+    }
+
+
+async def drive(base_url, logins, probes, seconds):
+    limits = httpx.Limits(max_connections=logins + probes)
+    credentials = {"username": "login@example.com", "password": "password"}
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        await client.post("/api/v1/auth/register", json={
+            "username": "login", "email": credentials["username"], "password": credentials["password"]
+        })
+        token = (await client.post("/api/v1/auth/login", data=credentials)).json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+        pb_id = (await client.post("/api/v1/piggy-banks", headers=headers, json={"name": "Probe"})).json()["id"]
+
+        login_latencies, probe_latencies = [], []
+        rejected = failed = 0
+        deadline = time.perf_counter() + seconds
+
+        async def login_worker():
+            nonlocal rejected, failed
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                response = await client.post("/api/v1/auth/login", data=credentials)
+                if response.status_code == 503:
+                    rejected += 1
+                    await asyncio.sleep(0.05)
+                elif response.status_code != 200:
+                    failed += 1
+                else:
+                    login_latencies.append(time.perf_counter() - started)
+
+        async def probe_worker():
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                await client.get(f"/api/v1/piggy-banks/{pb_id}/transactions/paged", headers=headers)
+                probe_latencies.append(time.perf_counter() - started)
+
+        await asyncio.gather(
+            *(login_worker() for _ in range(logins)), *(probe_worker() for _ in range(probes))
+        )
+    return summarize(login_latencies), summarize(probe_latencies), rejected, failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--logins", type=int, default=32)
+    parser.add_argument("--probes", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--workers", type=int, default=2, help="bcrypt processes for the pool run")
+    args = parser.parse_args()
+
+    runs = (("threadpool", 0), (f"pool[{args.workers}]", args.workers))
+    print(f"{args.logins} login clients, {args.probes} probe clients, {args.seconds:g}s per run")
+    print(f"{'hashing':<12}{'logins/s':>10}{'login p50':>12}{'login p99':>12}"
+          f"{'probe p50':>12}{'probe p99':>12}{'503s':>8}{'errors':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, workers in runs:
+            port = free_port()
+            process = start_server(os.path.join(tmp, f"{workers}.db"), port, workers)
+            try:
+                login, probe, rejected, failed = asyncio.run(
+                    drive(f"http://127.0.0.1:{port}", args.logins, args.probes, args.seconds)
+                )
+            finally:
+                process.terminate()
+                process.wait()
+            print(f"{name:<12}{login['count'] / args.seconds:>10.1f}{login['p50']:>10.0f}ms{login['p99']:>10.0f}ms"
+                  f"{probe['p50']:>10.0f}ms{probe['p99']:>10.0f}ms{rejected:>8}{failed:>8}")
+
+
+if __name__ == "__main__":
+    main()
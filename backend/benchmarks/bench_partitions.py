@@ -0,0 +1,104 @@
+"""
+Benchmark - multi-year opening balances and lazy partitions
+
+Times the opening balance of the last year and a one-month query through
+TransactionManager's partition view, against loading every year file and
+filtering one concatenated DataFrame (what a correct multi-year report needed
+before the view existed):
+    - load all: read every year file, concat, sum the rows before the date
+    - cold:     per-year totals computed with projected reads (first request)
+    - warm:     totals from closing_balances.json in a fresh process
+
+Target with 10 years x 100,000 transactions in Parquet:
+    - warm opening balance: >= 100x faster than loading all years
+    - one-month query: only the touched partition is loaded
+
+Requires pandas and pyarrow (neither is an API dependency).
+
+Run from the backend/ directory:
+    python -m benchmarks.bench_partitions [--years 10] [--rows-per-year 100000]
+"""
+import argparse
+import tempfile
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from app.core.config import settings
+from app.domain import transactions
+from app.domain.transactions import TransactionManager
+
+FIRST_YEAR = 2015
+
+
+def populate(years, rows_per_year):
+    rng = np.random.default_rng(42)
+    total = 0.0
+    for year in range(FIRST_YEAR, FIRST_YEAR + years):
+        seconds = np.sort(rng.integers(0, 365 * 86400, rows_per_year))
+        amounts = np.round(rng.uniform(-200, 250, rows_per_year), 2)
+        tm = TransactionManager("bench", "Bench")
+        tm.transactions_df = pd.DataFrame({
+            "Transaction ID": np.arange(1, rows_per_year + 1),
+            "Date": pd.Timestamp(year, 1, 1) + pd.to_timedelta(seconds, unit="s"),
+            "Amount": amounts,
+            "Category": "Food",
+            "Description": "Bench",
+            "Balance": amounts.cumsum(),
+        })
+        tm.save(year)
+        total += amounts.sum()
+    return total
+
+
+def load_all(before):
+    tm = TransactionManager("bench", "Bench")
+    frames = [tm.store.read(path) for _, path in sorted(tm.list_transaction_files().items())]
+    df = pd.concat(frames, ignore_index=True)
+    return df.loc[df["Date"] < before, "Amount"].sum()
+
+
+def timed(fn):
+    started = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - started, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--years", type=int, default=10)
+    parser.add_argument("--rows-per-year", type=int, default=100_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        settings.USER_DATA_DIR = tmp
+        settings.TRANSACTION_STORAGE = "parquet"
+        populate(args.years, args.rows_per_year)
+        last = FIRST_YEAR + args.years - 1
+        before = datetime(last, 1, 1)
+        print(f"rows: {args.years * args.rows_per_year} over {args.years} years")
+
+        baseline, expected = timed(lambda: load_all(before))
+        cold, cold_balance = timed(lambda: TransactionManager("bench", "Bench").balance_before(before))
+        # A fresh process: nothing in memory, totals come from closing_balances.json
+        transactions.year_total_cache.clear()
+        warm, warm_balance = timed(lambda: TransactionManager("bench", "Bench").balance_before(before))
+        assert np.isclose(expected, cold_balance) and np.isclose(expected, warm_balance)
+
+        print(f"{'opening balance':<18}{'load all':>10}{'cold':>10}{'warm':>10}")
+        print(f"{'':<18}{baseline * 1000:>8.1f}ms{cold * 1000:>8.1f}ms{warm * 1000:>8.1f}ms"
+              f"   ({baseline / warm:.0f}x warm)")
+
+        transactions.partition_cache.clear()
+        query, df = timed(lambda: TransactionManager("bench", "Bench").transactions_between(
+            datetime(last, 6, 1), datetime(last, 7, 1)
+        ))
+        stats = transactions.partition_cache.stats()
+        print(f"one-month query: {query * 1000:.1f}ms, {len(df)} rows, "
+              f"{stats['size']} partition(s) cached, {stats['bytes'] / 1e6:.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+Benchmark - SQL reports vs the pandas ReportGenerator
+
+Compares `SQLReportGenerator` (aggregate queries over the transactions table,
+opening balance via the balance checkpoints) with the CSV-era path: load the
+year file with `TransactionManager.load_from_csv(year)` and run the pandas
+`ReportGenerator` over the DataFrame. Both sides get the same multi-year
+ledger; the pandas timing includes the CSV load, since that is what every
+request paid.
+
+Target on a file-backed SQLite database with 10 years x 50,000 transactions:
+    - monthly and yearly reports: >= 20x faster than the pandas path (they
+      read only the monthly rollups and balance checkpoints)
+    - category summary over an arbitrary date range: >= 2x faster
+
+Requires pandas for the comparison side (it is not an API dependency).
+
+Run from the backend/ directory:
+    python -m benchmarks.bench_reports [--years 10] [--rows-per-year 50000] [--repeat 5]
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+from datetime import datetime
+
+import pandas as pd
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.db.base import Base
+from app.db.repositories.rollup_repo import RollupRepository
+from app.domain.reports import ReportGenerator
+from app.domain.transactions import TransactionManager
+from app.models.piggy_bank import PiggyBank
+from app.models.user import User
+from app.services.reporting import SQLReportGenerator
+
+CATEGORIES = ["Food", "Transport", "Shopping", "Entertainment", "Health", "Travel", "Home", "Savings"]
+INCOME_CATEGORIES = ["Salary", "Gift", "Interest"]
+FIRST_YEAR = 2015
+
+
+def generate(years, rows_per_year):
+    rng = random.Random(42)
+    rows = []
+    for year in range(FIRST_YEAR, FIRST_YEAR + years):
+        start = datetime(year, 1, 1)
+        step = (datetime(year + 1, 1, 1) - start) / rows_per_year
+        for i in range(rows_per_year):
+            if rng.random() < 0.1:
+                amount, category = round(rng.uniform(100, 3000), 2), rng.choice(INCOME_CATEGORIES)
+            else:
+                amount, category = -round(rng.uniform(1, 200), 2), rng.choice(CATEGORIES)
+            rows.append((start + step * i, amount, category, f"Bench {i}"))
+    return rows
+
+
+def populate_sql(path, rows):
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine)
+    db = Session()
+    user = User(username="bench", email="bench@example.com", hashed_password="x")
+    db.add(user)
+    db.flush()
+    pb = PiggyBank(user_id=user.id, name="Bench", currency="USD")
+    db.add(pb)
+    db.commit()
+
+    with engine.begin() as conn:
+        conn.exec_driver_sql(
+            "INSERT INTO transactions (piggy_bank_id, amount, type, category, description, date) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (pb.id, amount, "income" if amount > 0 else "expense", category, description,
+                 date.strftime("%Y-%m-%d %H:%M:%S.%f"))
+                for date, amount, category, description in rows
+            ],
+        )
+        conn.exec_driver_sql("ANALYZE")
+    # Raw inserts bypass the repository, so derive the rollups afterwards
+    RollupRepository(db).rebuild()
+    db.commit()
+    return engine, db, pb.id
+
+
+def populate_csv(rows):
+    tm = TransactionManager("bench", "Bench", storage="csv")
+    df = pd.DataFrame(rows, columns=["Date", "Amount", "Category", "Description"])
+    df.insert(0, "Transaction ID", range(1, len(df) + 1))
+    df["Balance"] = df["Amount"].cumsum()
+    for year, year_df in df.groupby(df["Date"].dt.year):
+        year_df.to_csv(tm.get_file_path(year, "csv"), index=False, encoding="utf-8-sig")
+
+
+def pandas_report(year, build):
+    tm = TransactionManager("bench", "Bench", storage="csv")
+    tm.load_from_csv(year)
+    return build(ReportGenerator(tm))
+
+
+def timed(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--years", type=int, default=10)
+    parser.add_argument("--rows-per-year", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        settings.USER_DATA_DIR = os.path.join(tmp, "user")
+        started = time.perf_counter()
+        rows = generate(args.years, args.rows_per_year)
+        engine, db, pb_id = populate_sql(os.path.join(tmp, "reports.db"), rows)
+        populate_csv(rows)
+        print(f"rows: {len(rows)} over {args.years} years (populated in {time.perf_counter() - started:.1f}s)")
+
+        year = FIRST_YEAR + args.years - 1
+        cases = [
+            ("monthly", lambda reports: reports.generate_monthly_report(year, 6)),
+            ("yearly", lambda reports: reports.generate_yearly_report(year)),
+            ("categories", lambda reports: reports.get_category_summary(datetime(year, 3, 1), datetime(year, 9, 30))),
+        ]
+        print(f"{'report':<12}{'pandas':>10}{'SQL':>10}{'speedup':>10}")
+        for name, build in cases:
+            pandas_time, _ = timed(lambda: pandas_report(year, build), args.repeat)
+            # Warm the checkpoints once, as the first API request would
+            build(SQLReportGenerator(db, pb_id))
+            db.commit()
+            sql_time, _ = timed(lambda: build(SQLReportGenerator(db, pb_id)), args.repeat)
+            print(f"{name:<12}{pandas_time * 1000:>8.1f}ms{sql_time * 1000:>8.1f}ms{pandas_time / sql_time:>9.1f}x")
+
+        db.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Benchmark - FTS5 search vs LIKE scan
+
+Compares `GET /transactions/search` (FTS5 MATCH ranked by bm25, via
+`TransactionRepository.search`) with the equivalent substring filter
+`description LIKE '%term%' OR category LIKE '%term%'`, which has to read
+every transaction of the user.
+
+Target on a file-backed SQLite database with 1,000,000 transactions:
+    - FTS search: >= 20x faster than the LIKE scan for selective terms
+
+Very common terms are the LIKE scan's best case: walking the date index newest
+first, it stops after `--limit` hits, while FTS ranks every match by bm25.
+
+Run from the backend/ directory:
+    python -m benchmarks.bench_search [--rows 1000000] [--repeat 5]
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, or_
+from sqlalchemy.orm import sessionmaker
+
+from app.db import fts
+from app.db.base import Base
+from app.db.repositories.transaction_repo import TransactionRepository
+from app.models.piggy_bank import PiggyBank
+from app.models.transaction import Transaction
+from app.models.user import User
+
+MERCHANTS = [
+    "Starbucks", "Shell Station", "Amazon Marketplace", "Netflix", "Whole Foods",
+    "Uber Trip", "Apple Store", "IKEA", "Spotify", "Delta Airlines", "Costco Wholesale",
+    "Home Depot", "Chipotle", "Lyft Ride", "Walgreens Pharmacy", "Trader Joes",
+]
+CATEGORIES = ["Food", "Transport", "Shopping", "Entertainment", "Health", "Travel", "Home"]
+TERMS = ["starbucks", "netfl", "pharmacy", "4242", "1234"]
+
+
+def populate(path, rows):
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine)
+    db = Session()
+    user = User(username="bench", email="bench@example.com", hashed_password="x")
+    db.add(user)
+    db.flush()
+    pb = PiggyBank(user_id=user.id, name="Bench", currency="USD")
+    db.add(pb)
+    db.commit()
+
+    rng = random.Random(42)
+    start = datetime(2015, 1, 1)
+    chunk = 50_000
+    with engine.begin() as conn:
+        for offset in range(0, rows, chunk):
+            conn.exec_driver_sql(
+                "INSERT INTO transactions (piggy_bank_id, amount, type, category, description, date) "
+                "VALUES (?, ?, 'expense', ?, ?, ?)",
+                [
+                    (
+                        pb.id,
+                        -round(rng.uniform(1, 200), 2),
+                        rng.choice(CATEGORIES),
+                        f"{rng.choice(MERCHANTS)} #{rng.randint(1, 9999)}",
+                        (start + timedelta(minutes=7 * i)).strftime("%Y-%m-%d %H:%M:%S.%f"),
+                    )
+                    for i in range(offset, min(offset + chunk, rows))
+                ],
+            )
+        conn.exec_driver_sql("ANALYZE")
+    return engine, db, user.id
+
+
+def timed(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def like_scan(db, user_id, term, limit):
+    pattern = f"%{term}%"
+    return (
+        db.query(Transaction)
+        .join(PiggyBank, PiggyBank.id == Transaction.piggy_bank_id)
+        .filter(
+            PiggyBank.user_id == user_id,
+            or_(Transaction.description.like(pattern), Transaction.category.like(pattern)),
+        )
+        .order_by(Transaction.date.desc(), Transaction.id.desc())
+        .limit(limit)
+        .all()
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--limit", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        started = time.perf_counter()
+        engine, db, user_id = populate(os.path.join(tmp, "search.db"), args.rows)
+        print(f"rows: {args.rows} (populated and indexed in {time.perf_counter() - started:.1f}s)")
+
+        repo = TransactionRepository(db)
+        print(f"{'term':<12}{'LIKE':>10}{'FTS':>10}{'speedup':>10}")
+        for term in TERMS:
+            like, _ = timed(lambda: like_scan(db, user_id, term, args.limit), args.repeat)
+            match = fts.match_query(term)
+            search, _ = timed(lambda: repo.search(user_id, match, limit=args.limit), args.repeat)
+            print(f"{term:<12}{like * 1000:>8.1f}ms{search * 1000:>8.1f}ms{like / search:>9.1f}x")
+
+        db.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
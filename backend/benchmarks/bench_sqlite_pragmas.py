@@ -0,0 +1,133 @@
+"""
+Benchmark - SQLite PRAGMA tuning under concurrent reads and writes
+
+Runs the same mixed workload against a file-backed database twice: once with
+SQLite's defaults (rollback journal, synchronous=FULL) and once with the
+PRAGMAs applied by `app.db.base.create_db_engine` from Settings (WAL,
+synchronous=NORMAL, mmap, larger page cache, busy_timeout). Reader threads
+page through a piggy bank's transactions while writer threads append
+transactions through `TransactionRepository`, committing each one.
+
+Targets with 4 readers and 1 writer:
+    - tuned reads/s:  >= 1.5x the default journal (readers no longer wait on commits)
+    - tuned writes/s: >= 2x the default journal
+
+Run from the backend/ directory:
+    python -m benchmarks.bench_sqlite_pragmas [--seconds 5] [--readers 4] [--writers 1]
+"""
+import argparse
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.db.base import Base, create_db_engine
+from app.db.repositories.transaction_repo import TransactionRepository
+from app.db.sqlite import pragmas_from_settings
+from app.models.piggy_bank import PiggyBank
+from app.models.transaction import Transaction
+from app.models.user import User
+
+DEFAULT_PRAGMAS = {"journal_mode": "DELETE", "synchronous": "FULL", "busy_timeout": 5000}
+
+
+def populate(engine, rows):
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    user = User(username="bench", email="bench@example.com", hashed_password="x")
+    db.add(user)
+    db.flush()
+    pb = PiggyBank(user_id=user.id, name="Bench", currency="USD")
+    db.add(pb)
+    db.flush()
+    start = datetime(2020, 1, 1)
+    TransactionRepository(db).add_many(pb.id, [
+        Transaction(amount=-(i % 50) - 1.0, type="expense", category=f"Category {i % 8}",
+                    description=f"Row {i}", date=start + timedelta(minutes=i))
+        for i in range(rows)
+    ])
+    db.commit()
+    pb_id = pb.id
+    db.close()
+    return pb_id
+
+
+def run(path, pragmas, args):
+    engine = create_db_engine(f"sqlite:///{path}", pragmas)
+    pb_id = populate(engine, args.rows)
+    Session = sessionmaker(bind=engine)
+    stop = threading.Event()
+    counts = {"reads": 0, "writes": 0, "errors": 0}
+    lock = threading.Lock()
+
+    def count(key):
+        with lock:
+            counts[key] += 1
+
+    def reader():
+        db = Session()
+        repo = TransactionRepository(db)
+        while not stop.is_set():
+            try:
+                repo.page(repo.filtered(pb_id), 50, None)
+                db.query(PiggyBank.balance).filter(PiggyBank.id == pb_id).scalar()
+                db.rollback()
+                count("reads")
+            except OperationalError:
+                db.rollback()
+                count("errors")
+        db.close()
+
+    def writer():
+        db = Session()
+        repo = TransactionRepository(db)
+        while not stop.is_set():
+            try:
+                repo.add(Transaction(piggy_bank_id=pb_id, amount=-1.0, type="expense", category="Bench"))
+                db.commit()
+                count("writes")
+            except OperationalError:
+                db.rollback()
+                count("errors")
+        db.close()
+
+    threads = [threading.Thread(target=reader) for _ in range(args.readers)]
+    threads += [threading.Thread(target=writer) for _ in range(args.writers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(args.seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    engine.dispose()
+    return {key: value / args.seconds for key, value in counts.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--writers", type=int, default=1)
+    parser.add_argument("--rows", type=int, default=20000)
+    args = parser.parse_args()
+
+    tuned_pragmas = pragmas_from_settings(settings)
+    with tempfile.TemporaryDirectory() as tmp:
+        default = run(os.path.join(tmp, "default.db"), DEFAULT_PRAGMAS, args)
+        tuned = run(os.path.join(tmp, "tuned.db"), tuned_pragmas, args)
+
+    print(f"{args.readers} readers, {args.writers} writers, {args.seconds:g}s each")
+    print(f"{'':<10}{'reads/s':>10}{'writes/s':>10}{'errors/s':>10}")
+    for name, result in (("default", default), ("tuned", tuned)):
+        print(f"{name:<10}{result['reads']:>10.0f}{result['writes']:>10.0f}{result['errors']:>10.1f}")
+    print(f"{'speedup':<10}{tuned['reads'] / max(default['reads'], 1):>9.1f}x"
+          f"{tuned['writes'] / max(default['writes'], 1):>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
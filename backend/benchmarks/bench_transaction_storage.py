@@ -0,0 +1,92 @@
+"""
+Benchmark - TransactionManager storage backends
+
+Writes the same year of transactions as CSV, Parquet and Arrow IPC
+(Feather) and times three reads through `TransactionManager`:
+    - load:  the full year as the working DataFrame (`load(year)`)
+    - month: one month with only Date and Amount (`read(year, start, end, columns)`)
+    - size:  the file size on disk
+
+Target with 200,000 transactions per year:
+    - Parquet and Feather full loads: >= 5x faster than CSV
+    - one-month projected read: >= 20x faster than CSV
+
+Requires pandas and pyarrow (neither is an API dependency).
+
+Run from the backend/ directory:
+    python -m benchmarks.bench_transaction_storage [--rows 200000] [--repeat 5]
+"""
+import argparse
+import os
+import tempfile
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from app.core.config import settings
+from app.domain.transactions import TransactionManager
+
+CATEGORIES = ["Food", "Transport", "Shopping", "Entertainment", "Health", "Travel", "Home", "Savings", "Salary", None]
+YEAR = 2024
+STORAGES = ("csv", "parquet", "feather")
+
+
+def generate(rows):
+    rng = np.random.default_rng(42)
+    seconds = rng.integers(0, 366 * 86400, rows)
+    df = pd.DataFrame({
+        "Transaction ID": np.arange(1, rows + 1),
+        "Date": pd.Timestamp(YEAR, 1, 1) + pd.to_timedelta(seconds, unit="s"),
+        "Amount": np.round(rng.uniform(-200, 250, rows), 2),
+        "Category": rng.choice(np.array(CATEGORIES, dtype=object), rows),
+        "Description": [f"Merchant #{i % 5000}" for i in range(rows)],
+    })
+    df = df.sort_values(["Date", "Transaction ID"], ignore_index=True)
+    df["Balance"] = df["Amount"].cumsum()
+    return df
+
+
+def timed(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    df = generate(args.rows)
+    with tempfile.TemporaryDirectory() as tmp:
+        settings.USER_DATA_DIR = tmp
+        print(f"rows: {args.rows}")
+        print(f"{'storage':<10}{'load':>10}{'month':>10}{'size':>10}")
+        baseline = {}
+        for storage in STORAGES:
+            tm = TransactionManager("bench", "Bench", storage=storage)
+            tm.transactions_df = df.copy()
+            path = tm.save(YEAR)["filepath"]
+
+            load, _ = timed(lambda: TransactionManager("bench", "Bench", storage=storage).load(YEAR), args.repeat)
+            month, rows = timed(
+                lambda: tm.read(YEAR, datetime(YEAR, 6, 1), datetime(YEAR, 7, 1), ["Date", "Amount"]),
+                args.repeat,
+            )
+            baseline.setdefault("load", load)
+            baseline.setdefault("month", month)
+            size = os.path.getsize(path) / 1e6
+            print(
+                f"{storage:<10}{load * 1000:>8.1f}ms{month * 1000:>8.1f}ms{size:>8.1f}MB"
+                f"   ({baseline['load'] / load:.1f}x load, {baseline['month'] / month:.1f}x month, {len(rows)} rows)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Benchmark - vectorized yearly report vs per-month re-scans
+
+Compares `ReportGenerator.generate_yearly_report`, which buckets the year's
+rows once by month index and category code, with the previous
+implementation (reproduced below) that re-filtered the year for each of the
+12 months and ran a separate mask and groupby per breakdown. Both reports are
+checked to agree: same keys, same ordering, amounts equal up to float
+summation order.
+
+Target on an in-memory DataFrame with 200,000 transactions per year:
+    - vectorized: >= 3x faster than the per-month re-scans
+
+The vectorized report reads the years through TransactionManager's partition
+view (Feather year files, partitions warm), the re-scan works on one
+DataFrame holding every year.
+
+Requires pandas and pyarrow (neither is an API dependency).
+
+Run from the backend/ directory:
+    python -m benchmarks.bench_yearly_report [--rows-per-year 200000] [--years 3] [--repeat 5]
+"""
+import argparse
+import math
+import tempfile
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from app.core.config import settings
+from app.domain.reports import ReportGenerator
+from app.domain.transactions import TransactionManager
+
+CATEGORIES = ["Food", "Transport", "Shopping", "Entertainment", "Health", "Travel", "Home", "Savings", "Salary", None]
+FIRST_YEAR = 2020
+
+
+def generate(years, rows_per_year):
+    rng = np.random.default_rng(42)
+    rows = years * rows_per_year
+    seconds = rng.integers(0, int((datetime(FIRST_YEAR + years, 1, 1) - datetime(FIRST_YEAR, 1, 1)).total_seconds()), rows)
+    df = pd.DataFrame({
+        "Transaction ID": np.arange(1, rows + 1),
+        "Date": pd.Timestamp(FIRST_YEAR, 1, 1) + pd.to_timedelta(seconds, unit="s"),
+        "Amount": np.round(rng.uniform(-200, 250, rows), 2),
+        "Category": rng.choice(np.array(CATEGORIES, dtype=object), rows),
+        "Description": "Bench",
+    })
+    df = df.sort_values(["Date", "Transaction ID"], ignore_index=True)
+    df["Balance"] = df["Amount"].cumsum()
+    return df
+
+
+def rescan_yearly_report(df, year):
+    """The per-month implementation the vectorized report replaced."""
+    start, end = datetime(year, 1, 1), datetime(year + 1, 1, 1)
+    year_df = df[(df["Date"] >= start) & (df["Date"] < end)]
+    balance_before = df[df["Date"] < start]["Amount"].sum()
+    income = year_df[year_df["Amount"] > 0]["Amount"].sum()
+    expenses = year_df[year_df["Amount"] < 0]["Amount"].sum()
+    expense_df = year_df[year_df["Amount"] < 0]
+    income_df = year_df[year_df["Amount"] > 0]
+    expense_by_category = expense_df.groupby("Category")["Amount"].sum().sort_values().to_dict()
+    income_by_category = income_df.groupby("Category")["Amount"].sum().sort_values(ascending=False).to_dict()
+    monthly_summary = []
+    for month in range(1, 13):
+        month_start = datetime(year, month, 1)
+        month_end = datetime(year, month + 1, 1) if month < 12 else end
+        month_df = year_df[(year_df["Date"] >= month_start) & (year_df["Date"] < month_end)]
+        monthly_income = month_df[month_df["Amount"] > 0]["Amount"].sum()
+        monthly_expenses = month_df[month_df["Amount"] < 0]["Amount"].sum()
+        monthly_summary.append({
+            "month": month,
+            "income": float(monthly_income),
+            "expenses": float(monthly_expenses),
+            "net": float(monthly_income + monthly_expenses),
+        })
+    return {
+        "year": year,
+        "balance_before": float(balance_before),
+        "income": float(income),
+        "expenses": float(expenses),
+        "net": float(income + expenses),
+        "balance_after": float(balance_before + income + expenses),
+        "transaction_count": len(year_df),
+        "expense_by_category": {k: float(v) for k, v in expense_by_category.items()},
+        "income_by_category": {k: float(v) for k, v in income_by_category.items()},
+        "monthly_summary": monthly_summary,
+    }
+
+
+def same_report(a, b):
+    if isinstance(a, dict):
+        return list(a) == list(b) and all(same_report(a[key], b[key]) for key in a)
+    if isinstance(a, list):
+        return len(a) == len(b) and all(same_report(x, y) for x, y in zip(a, b))
+    if isinstance(a, float):
+        return math.isclose(a, b, rel_tol=1e-9, abs_tol=1e-6)
+    return a == b
+
+
+def timed(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows-per-year", type=int, default=200_000)
+    parser.add_argument("--years", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    df = generate(args.years, args.rows_per_year)
+    print(f"rows: {len(df)} over {args.years} years")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        settings.USER_DATA_DIR = tmp
+        for year, year_df in df.groupby(df["Date"].dt.year):
+            tm = TransactionManager("bench", "Bench", storage="feather")
+            tm.transactions_df = year_df.reset_index(drop=True)
+            tm.save(year)
+        generator = ReportGenerator(TransactionManager("bench", "Bench", storage="feather"))
+
+        print(f"{'year':<8}{'re-scan':>10}{'vectorized':>12}{'speedup':>10}")
+        for year in range(FIRST_YEAR, FIRST_YEAR + args.years):
+            rescan, expected = timed(lambda: rescan_yearly_report(df, year), args.repeat)
+            vectorized, report = timed(lambda: generator.generate_yearly_report(year), args.repeat)
+            assert same_report(expected, report), f"reports differ for {year}"
+            print(f"{year:<8}{rescan * 1000:>8.1f}ms{vectorized * 1000:>10.1f}ms{rescan / vectorized:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+"""
+PiggyNest backend maintenance commands.
+
+Run from the backend/ directory, e.g.:
+    python manage.py migrate
+    python manage.py downgrade --target 5
+    python manage.py rebuild-rollups
+    python manage.py check-balances --repair
+    python manage.py rebuild-search-index
+    python manage.py import-statement --piggy-bank 1 statement.csv
+    python manage.py purge-deleted
+    python manage.py convert-transaction-files --to parquet
+"""
+import argparse
+import os
+
+from app.core.config import settings
+from app.db import fts, migrations
+from app.db.base import engine
+from app.db.session import SessionLocal
+from app.db.repositories.checkpoint_repo import CheckpointRepository
+from app.db.repositories.piggy_bank_repo import PiggyBankRepository
+from app.db.repositories.rollup_repo import RollupRepository
+from app.models.piggy_bank import PiggyBank
+from app.schemas.statement_import import ColumnMapping
+from app.services.account_deletion import resume_purges
+from app.services.statement_import import SUPPORTED_FORMATS, import_statement
+
+
+def migrate(args):
+    """
+    Apply pending schema migrations to the configured database, creating
+    the schema if the database is new.
+    """
+    try:
+        applied = migrations.upgrade(engine, args.target)
+    except migrations.SchemaVersionError as exc:
+        raise SystemExit(str(exc))
+    with engine.connect() as conn:
+        version = migrations.current_version(conn)
+    if applied:
+        print(f"Applied migrations {applied}.")
+    print(f"Database is at schema version {version}.")
+
+
+def downgrade(args):
+    """
+    Revert schema migrations above the target version.
+    """
+    reverted = migrations.downgrade(engine, args.target)
+    with engine.connect() as conn:
+        version = migrations.current_version(conn)
+    if reverted:
+        print(f"Reverted migrations {reverted}.")
+    print(f"Database is at schema version {version}.")
+
+
+def rebuild_rollups(args):
+    """
+    Recompute the monthly transaction rollups from the raw ledger.
+    Safe to re-run, e.g. after the ledger was edited outside the API.
+    Balance checkpoints are derived from the rollup, so they are dropped as well.
+    """
+    db = SessionLocal()
+    try:
+        count = RollupRepository(db).rebuild(args.piggy_bank or None)
+        CheckpointRepository(db).delete_by_piggy_banks(args.piggy_bank or None)
+        db.commit()
+    finally:
+        db.close()
+    print(f"Rebuilt {count} rollup buckets.")
+
+
+def check_balances(args):
+    """
+    Compare the stored piggy bank balances with the ledger and report any drift.
+    With --repair, recompute the drifted balances from the ledger.
+    """
+    db = SessionLocal()
+    try:
+        repo = PiggyBankRepository(db)
+        drift = repo.find_balance_drift()
+        for pb_id, stored, actual, stored_count, actual_count in drift:
+            print(
+                f"Piggy bank {pb_id}: stored balance {stored:.2f} ({stored_count} tx), "
+                f"ledger {actual:.2f} ({actual_count} tx)"
+            )
+        if drift and args.repair:
+            repo.recompute_balances([row[0] for row in drift])
+            db.commit()
+    finally:
+        db.close()
+
+    if not drift:
+        print("All piggy bank balances match the ledger.")
+    elif args.repair:
+        print(f"Repaired {len(drift)} piggy bank balances.")
+    else:
+        raise SystemExit(f"{len(drift)} piggy bank balances drifted; re-run with --repair to fix.")
+
+
+def rebuild_search_index(args):
+    """
+    Create the transaction full-text index if needed and re-index every transaction.
+    """
+    with engine.begin() as conn:
+        fts.install(conn)
+        fts.rebuild(conn)
+        count = conn.exec_driver_sql("SELECT COUNT(*) FROM transactions").scalar()
+    print(f"Indexed {count} transactions.")
+
+
+def import_statement_file(args):
+    """
+    Stream a CSV/OFX/QIF statement straight into a piggy bank, printing progress
+    after every committed chunk.
+    """
+    fmt = (args.format or os.path.splitext(args.file)[1].lstrip(".")).lower()
+    mapping = ColumnMapping(**dict(pair.split("=", 1) for pair in args.map or []))
+
+    db = SessionLocal()
+    try:
+        pb = db.get(PiggyBank, args.piggy_bank)
+        if pb is None:
+            raise SystemExit(f"Piggy bank {args.piggy_bank} not found.")
+
+        def progress(imported, rejected):
+            print(f"\r{imported} imported, {rejected} rejected", end="", flush=True)
+
+        with open(args.file, "r", encoding=mapping.encoding, errors="replace", newline="") as stream:
+            result = import_statement(
+                db, pb.user_id, pb.id, stream, fmt, mapping, args.chunk_size, progress
+            )
+    finally:
+        db.close()
+
+    print(f"\nImported {result['imported']} transactions, rejected {result['rejected']}.")
+    for error in result["errors"][:20]:
+        print(f"  line {error['line']}: {error['detail']}")
+
+
+def convert_transaction_files(args):
+    """
+    Convert the CSV year files under USER_DATA_DIR to a columnar format.
+    Needs pandas, plus pyarrow for Parquet and Feather.
+    """
+    from app.domain.transaction_storage import convert_csv_tree
+
+    written = convert_csv_tree(args.root or settings.USER_DATA_DIR, args.to, args.remove_csv)
+    for path in written:
+        print(f"  {path}")
+    print(f"Converted {len(written)} transaction files to {args.to}.")
+
+
+def purge_deleted(args):
+    """
+    Finish account and piggy bank deletions whose background purge was cut
+    short, e.g. by a worker restart.
+    """
+    users, piggy_banks = resume_purges(args.chunk_size)
+    print(f"Purged {users} users and {piggy_banks} piggy banks.")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="PiggyNest backend maintenance commands")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    migrate_parser = subparsers.add_parser("migrate", help="Apply pending schema migrations")
+    migrate_parser.add_argument("--target", type=int, help="Stop at this schema version")
+    migrate_parser.set_defaults(func=migrate)
+
+    downgrade_parser = subparsers.add_parser("downgrade", help="Revert schema migrations")
+    downgrade_parser.add_argument(
+        "--target", type=int, required=True, help="Schema version to return to (0 reverts all)"
+    )
+    downgrade_parser.set_defaults(func=downgrade)
+
+    rollups = subparsers.add_parser("rebuild-rollups", help="Recompute monthly transaction rollups")
+    rollups.add_argument(
+        "--piggy-bank", type=int, action="append",
+        help="Only rebuild the given piggy bank id (repeatable)"
+    )
+    rollups.set_defaults(func=rebuild_rollups)
+
+    balances = subparsers.add_parser(
+        "check-balances", help="Verify stored piggy bank balances against the ledger"
+    )
+    balances.add_argument("--repair", action="store_true", help="Recompute drifted balances")
+    balances.set_defaults(func=check_balances)
+
+    search = subparsers.add_parser(
+        "rebuild-search-index", help="Rebuild the transaction full-text search index"
+    )
+    search.set_defaults(func=rebuild_search_index)
+
+    importer = subparsers.add_parser("import-statement", help="Import a bank statement file")
+    importer.add_argument("file", help="Path to the statement file")
+    importer.add_argument("--piggy-bank", type=int, required=True, help="Target piggy bank id")
+    importer.add_argument("--format", choices=SUPPORTED_FORMATS, help="Defaults to the file extension")
+    importer.add_argument(
+        "--map", action="append", metavar="FIELD=VALUE",
+        help="CSV column mapping, e.g. --map date=Booking --map amount=Value (repeatable)"
+    )
+    importer.add_argument("--chunk-size", type=int, default=1000)
+    importer.set_defaults(func=import_statement_file)
+
+    purge = subparsers.add_parser(
+        "purge-deleted", help="Finish interrupted user and piggy bank deletions"
+    )
+    purge.add_argument("--chunk-size", type=int, help="Defaults to ACCOUNT_DELETE_CHUNK_SIZE")
+    purge.set_defaults(func=purge_deleted)
+
+    converter = subparsers.add_parser(
+        "convert-transaction-files", help="Convert CSV transaction year files to Parquet or Feather"
+    )
+    converter.add_argument("--to", choices=("parquet", "feather"), default="parquet")
+    converter.add_argument("--root", help="Defaults to USER_DATA_DIR")
+    converter.add_argument(
+        "--remove-csv", action="store_true", help="Delete each CSV file once it is converted"
+    )
+    converter.set_defaults(func=convert_transaction_files)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
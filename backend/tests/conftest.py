@@ -4,8 +4,13 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
+from app.core.config import settings
 from app.main import app
+from app.api.caching import response_cache
+from app.api.deps import token_cache, user_cache
 from app.db.base import Base
+from app.db.instrumentation import install_query_instrumentation
+from app.db.sqlite import install_pragmas
 from app.db.session import get_db
 
 # Use an in-memory SQLite database for testing
@@ -16,7 +21,12 @@ engine = create_engine(
     connect_args={"check_same_thread": False},
     poolclass=StaticPool,
 )
+# Enforce foreign keys like the application engine does
+install_pragmas(engine, {"foreign_keys": "ON"})
+install_query_instrumentation(engine)
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# The startup check looks at the configured database, not the test engine
+settings.DB_SCHEMA_CHECK = False
 
 @pytest.fixture(scope="session")
 def db_engine():
@@ -48,6 +58,10 @@ def client(db):
             pass
     
     app.dependency_overrides[get_db] = override_get_db
+    # User ids are reused once each test rolls back, so cached payloads must not leak
+    response_cache.clear()
+    user_cache.clear()
+    token_cache.clear()
     with TestClient(app) as c:
         yield c
     app.dependency_overrides.clear()
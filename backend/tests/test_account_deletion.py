@@ -0,0 +1,150 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.models.balance_checkpoint import BalanceCheckpoint
+from app.models.category import Category
+from app.models.piggy_bank import PiggyBank
+from app.models.transaction import Transaction
+from app.models.transaction_rollup import TransactionRollup
+from app.models.user_data_version import UserDataVersion
+from app.api.v1 import auth, piggy_banks
+from app.db.repositories.transaction_repo import TransactionRepository
+from app.models.user import User
+from app.services import account_deletion
+
+@pytest.fixture
+def auth_headers(client):
+    client.post(
+        "/api/v1/auth/register",
+        json={"username": "deletion_user", "email": "deletion_user@example.com", "password": "password"}
+    )
+    response = client.post(
+        "/api/v1/auth/login",
+        data={"username": "deletion_user@example.com", "password": "password"}
+    )
+    token = response.json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+@pytest.fixture
+def piggy_bank_id(client, auth_headers):
+    response = client.post("/api/v1/piggy-banks", headers=auth_headers, json={"name": "Deletion_Bank"})
+    return response.json()["id"]
+
+@pytest.fixture
+def purge_sessions(db, monkeypatch):
+    """Background purges open their own session; bind it to the test connection."""
+    monkeypatch.setattr(account_deletion, "SessionLocal", lambda: Session(bind=db.get_bind()))
+
+def add_transactions(client, auth_headers, pb_id, count):
+    client.post(
+        f"/api/v1/piggy-banks/{pb_id}/transactions:batch",
+        headers=auth_headers,
+        json=[
+            {"amount": -1.0, "category": "Food", "description": f"Lunch {i}", "date": f"2024-01-{i + 1:02d}T12:00:00"}
+            for i in range(count)
+        ],
+    )
+    # Materialize a checkpoint so its cascade is covered too
+    client.get(f"/api/v1/piggy-banks/{pb_id}/balance?as_of=2024-03-01", headers=auth_headers)
+
+def remaining(db, pb_id):
+    db.expire_all()
+    return {
+        model.__tablename__: db.query(model).filter(model.piggy_bank_id == pb_id).count()
+        for model in (Transaction, TransactionRollup, BalanceCheckpoint)
+    }
+
+def indexed(db, word):
+    return db.execute(text("SELECT COUNT(*) FROM transactions_fts WHERE transactions_fts MATCH :q"), {"q": word}).scalar()
+
+def test_piggy_bank_delete_cascades(client, db, auth_headers, piggy_bank_id):
+    add_transactions(client, auth_headers, piggy_bank_id, 3)
+    assert remaining(db, piggy_bank_id) == {"transactions": 3, "transaction_rollups": 1, "balance_checkpoints": 1}
+
+    response = client.delete(f"/api/v1/piggy-banks/{piggy_bank_id}", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json() == {"success": True}
+    assert remaining(db, piggy_bank_id) == {"transactions": 0, "transaction_rollups": 0, "balance_checkpoints": 0}
+    assert indexed(db, "lunch") == 0
+
+def test_user_delete_cascades(client, db, auth_headers, piggy_bank_id):
+    add_transactions(client, auth_headers, piggy_bank_id, 3)
+    user_id = db.query(PiggyBank.user_id).filter(PiggyBank.id == piggy_bank_id).scalar()
+
+    assert client.delete("/api/v1/auth/me", headers=auth_headers).json() == {"success": True}
+    db.expire_all()
+    assert db.query(PiggyBank).filter(PiggyBank.user_id == user_id).count() == 0
+    assert db.query(Category).filter(Category.user_id == user_id).count() == 0
+    assert db.query(UserDataVersion).filter(UserDataVersion.user_id == user_id).count() == 0
+    assert remaining(db, piggy_bank_id) == {"transactions": 0, "transaction_rollups": 0, "balance_checkpoints": 0}
+
+def test_large_piggy_bank_is_purged_in_chunks(client, db, auth_headers, piggy_bank_id, purge_sessions, monkeypatch):
+    monkeypatch.setattr(settings, "ACCOUNT_DELETE_CHUNK_SIZE", 2)
+    add_transactions(client, auth_headers, piggy_bank_id, 5)
+
+    # TestClient runs the background purge before returning
+    response = client.delete(f"/api/v1/piggy-banks/{piggy_bank_id}", headers=auth_headers)
+    assert response.status_code == 202
+    assert response.json() == {"success": True, "status": "scheduled"}
+    assert remaining(db, piggy_bank_id) == {"transactions": 0, "transaction_rollups": 0, "balance_checkpoints": 0}
+    assert db.get(PiggyBank, piggy_bank_id) is None
+    assert client.get("/api/v1/piggy-banks/balances", headers=auth_headers).json() == []
+
+def test_large_user_is_deactivated_then_purged(client, db, auth_headers, piggy_bank_id, purge_sessions, monkeypatch):
+    monkeypatch.setattr(settings, "ACCOUNT_DELETE_CHUNK_SIZE", 2)
+    add_transactions(client, auth_headers, piggy_bank_id, 5)
+
+    response = client.delete("/api/v1/auth/me", headers=auth_headers)
+    assert response.status_code == 202
+    db.expire_all()
+    assert db.get(PiggyBank, piggy_bank_id) is None
+    assert remaining(db, piggy_bank_id)["transactions"] == 0
+    assert client.get("/api/v1/piggy-banks", headers=auth_headers).status_code == 401
+
+def test_interrupted_piggy_bank_purge_is_hidden_and_resumed(client, db, auth_headers, piggy_bank_id, purge_sessions, monkeypatch):
+    monkeypatch.setattr(settings, "ACCOUNT_DELETE_CHUNK_SIZE", 2)
+    add_transactions(client, auth_headers, piggy_bank_id, 5)
+
+    def dies_after_one_chunk(user_id, pb_id, chunk_size=None):
+        session = account_deletion.SessionLocal()
+        TransactionRepository(session).delete_chunk([pb_id], 2)
+        session.commit()
+        session.close()
+
+    monkeypatch.setattr(piggy_banks, "purge_piggy_bank", dies_after_one_chunk)
+    assert client.delete(f"/api/v1/piggy-banks/{piggy_bank_id}", headers=auth_headers).status_code == 202
+    assert remaining(db, piggy_bank_id)["transactions"] == 3
+
+    # The half-purged bank is gone for the user: no reads, writes or second purge
+    assert client.get("/api/v1/piggy-banks", headers=auth_headers).json() == []
+    assert client.get("/api/v1/piggy-banks/balances", headers=auth_headers).json() == []
+    url = f"/api/v1/piggy-banks/{piggy_bank_id}/transactions"
+    assert client.get(url, headers=auth_headers).status_code == 404
+    assert client.post(url, headers=auth_headers, json={"amount": 1.0}).status_code == 404
+    assert client.delete(f"/api/v1/piggy-banks/{piggy_bank_id}", headers=auth_headers).status_code == 404
+    assert client.post("/api/v1/piggy-banks", headers=auth_headers, json={"name": "Deletion_Bank"}).status_code == 200
+
+    assert account_deletion.resume_purges() == (0, 1)
+    db.expire_all()
+    assert db.get(PiggyBank, piggy_bank_id) is None
+    assert remaining(db, piggy_bank_id) == {"transactions": 0, "transaction_rollups": 0, "balance_checkpoints": 0}
+
+def test_interrupted_user_purge_is_resumed(client, db, auth_headers, piggy_bank_id, purge_sessions, monkeypatch):
+    monkeypatch.setattr(settings, "ACCOUNT_DELETE_CHUNK_SIZE", 2)
+    add_transactions(client, auth_headers, piggy_bank_id, 5)
+    user_id = db.query(PiggyBank.user_id).filter(PiggyBank.id == piggy_bank_id).scalar()
+
+    # The worker restarts before the purge runs
+    monkeypatch.setattr(auth, "purge_user", lambda user_id: None)
+    assert client.delete("/api/v1/auth/me", headers=auth_headers).status_code == 202
+    assert client.get("/api/v1/piggy-banks", headers=auth_headers).status_code == 400
+
+    assert account_deletion.resume_purges() == (1, 0)
+    db.expire_all()
+    assert db.get(User, user_id) is None
+    assert remaining(db, piggy_bank_id)["transactions"] == 0
+    assert client.post(
+        "/api/v1/auth/register",
+        json={"username": "deletion_user", "email": "deletion_user@example.com", "password": "password"}
+    ).status_code == 200
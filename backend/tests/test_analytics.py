@@ -0,0 +1,86 @@
+import pytest
+
+@pytest.fixture
+def auth_headers(client):
+    client.post(
+        "/api/v1/auth/register",
+        json={"username": "cube_user", "email": "cube_user@example.com", "password": "password"}
+    )
+    response = client.post(
+        "/api/v1/auth/login",
+        data={"username": "cube_user@example.com", "password": "password"}
+    )
+    token = response.json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+@pytest.fixture
+def piggy_banks(client, auth_headers):
+    usd = client.post("/api/v1/piggy-banks", headers=auth_headers, json={"name": "Cube_USD"}).json()["id"]
+    eur = client.post("/api/v1/piggy-banks", headers=auth_headers, json={"name": "Cube_EUR", "currency": "EUR"}).json()["id"]
+    txs = [
+        (usd, {"amount": 3000.0, "type": "income", "category": "Salary", "date": "2024-01-05T09:00:00"}),
+        (usd, {"amount": -40.0, "category": "Food", "date": "2024-01-20T12:00:00"}),
+        (usd, {"amount": -60.0, "category": "Food", "date": "2024-01-21T12:00:00"}),
+        (usd, {"amount": -15.0, "category": "Fun", "date": "2024-01-22T12:00:00"}),
+        (usd, {"amount": -5.0, "category": "", "date": "2024-01-23T12:00:00"}),
+        (usd, {"amount": -25.0, "category": "Food", "date": "2024-04-02T12:00:00"}),
+        (eur, {"amount": 100.0, "type": "income", "category": "Gift", "date": "2023-12-31T23:00:00"}),
+    ]
+    for pb_id, payload in txs:
+        client.post(f"/api/v1/piggy-banks/{pb_id}/transactions", headers=auth_headers, json=payload)
+    return usd, eur
+
+def cube(client, auth_headers, **params):
+    response = client.get("/api/v1/analytics/cube", headers=auth_headers, params=params)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+def test_cube_groups_by_dimensions(client, auth_headers, piggy_banks):
+    data = cube(client, auth_headers, dimensions=["quarter", "currency"], measures=["sum", "count", "avg", "min", "max"])
+    assert data["dimensions"] == ["quarter", "currency"]
+    assert data["row_count"] == 3
+    assert data["columns"] == {
+        "quarter": ["2023-Q4", "2024-Q1", "2024-Q2"],
+        "currency": ["EUR", "USD", "USD"],
+        "sum": [100.0, 2880.0, -25.0],
+        "count": [1, 5, 1],
+        "avg": [100.0, 576.0, -25.0],
+        "min": [100.0, -60.0, -25.0],
+        "max": [100.0, 3000.0, -25.0],
+    }
+
+def test_cube_calendar_dimensions_and_filters(client, auth_headers, piggy_banks):
+    usd, _ = piggy_banks
+    data = cube(
+        client, auth_headers, dimensions=["week", "weekday"], measures=["count"],
+        piggy_bank_id=usd, start_date="2024-01-20T00:00:00", end_date="2024-01-31T00:00:00",
+    )
+    # 2024-01-20 is a Saturday, the 21st a Sunday: weeks start on Monday
+    assert data["columns"] == {
+        "week": ["2024-01-15", "2024-01-15", "2024-01-22", "2024-01-22"],
+        "weekday": [0, 6, 1, 2],
+        "count": [1, 1, 1, 1],
+    }
+
+def test_cube_top_n_folds_the_rest_into_other(client, auth_headers, piggy_banks):
+    data = cube(client, auth_headers, dimensions=["month", "category"], measures=["sum", "count", "avg"], top=2)
+    columns = data["columns"]
+    rows = list(zip(columns["month"], columns["category"], columns["sum"], columns["count"], columns["avg"]))
+    assert rows == [
+        ("2023-12", "Gift", 100.0, 1, 100.0),
+        ("2024-01", "Salary", 3000.0, 1, 3000.0),
+        ("2024-01", "Food", -100.0, 2, -50.0),
+        ("2024-01", "Other", -20.0, 2, -10.0),
+        ("2024-04", "Food", -25.0, 1, -25.0),
+    ]
+
+def test_cube_is_scoped_and_validated(client, auth_headers, piggy_banks):
+    client.post("/api/v1/auth/register", json={"username": "cube_other", "email": "cube_other@example.com", "password": "password"})
+    token = client.post("/api/v1/auth/login", data={"username": "cube_other@example.com", "password": "password"}).json()["access_token"]
+    other = cube(client, {"Authorization": f"Bearer {token}"}, dimensions=["piggy_bank"])
+    assert other["row_count"] == 0
+
+    bad = {"Authorization": auth_headers["Authorization"]}
+    assert client.get("/api/v1/analytics/cube?dimensions=hour", headers=bad).status_code == 422
+    assert client.get("/api/v1/analytics/cube?dimensions=month&dimensions=month", headers=bad).status_code == 400
+    assert client.get("/api/v1/analytics/cube?dimensions=month&top=2&top_dimension=category", headers=bad).status_code == 400
@@ -0,0 +1,116 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+
+from app.api.caching import response_cache
+from app.api.deps import token_cache, user_cache
+from app.api.v1 import auth, piggy_banks, statistics, transactions, transfers
+from app.db import migrations
+from app.db.base import create_async_db_engine, create_db_engine
+from app.db.session import get_async_db, get_db
+
+PREFIX = "/api/v1"
+
+@pytest.fixture
+def async_client(tmp_path):
+    """
+    App wired like DB_MODE=async: sync auth/piggy bank routes next to the
+    async transaction, transfer and statistics routes, sharing one file DB.
+    """
+    url = f"sqlite:///{tmp_path / 'async.db'}"
+    engine = create_db_engine(url)
+    async_engine = create_async_db_engine(url)
+    migrations.upgrade(engine)
+    SyncSession = sessionmaker(bind=engine, autoflush=False)
+    AsyncSession = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+    def override_get_db():
+        db = SyncSession()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    async def override_get_async_db():
+        async with AsyncSession() as db:
+            yield db
+
+    app = FastAPI()
+    app.include_router(auth.router, prefix=f"{PREFIX}/auth")
+    app.include_router(piggy_banks.router, prefix=f"{PREFIX}/piggy-banks")
+    app.include_router(transactions.async_router, prefix=PREFIX)
+    app.include_router(transfers.async_router, prefix=f"{PREFIX}/transfers")
+    app.include_router(statistics.async_router, prefix=f"{PREFIX}/statistics")
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+
+    response_cache.clear()
+    user_cache.clear()
+    token_cache.clear()
+    with TestClient(app) as client:
+        yield client
+        # aiosqlite connections belong to the client's event loop
+        client.portal.call(async_engine.dispose)
+    engine.dispose()
+
+@pytest.fixture
+def auth_headers(async_client):
+    async_client.post(
+        f"{PREFIX}/auth/register",
+        json={"username": "async_user", "email": "async_user@example.com", "password": "password"}
+    )
+    response = async_client.post(
+        f"{PREFIX}/auth/login",
+        data={"username": "async_user@example.com", "password": "password"}
+    )
+    token = response.json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+def test_async_routes_match_sync_behaviour(async_client, auth_headers):
+    source = async_client.post(f"{PREFIX}/piggy-banks", headers=auth_headers, json={"name": "Async_Source"}).json()["id"]
+    target = async_client.post(f"{PREFIX}/piggy-banks", headers=auth_headers, json={"name": "Async_Target"}).json()["id"]
+    url = f"{PREFIX}/piggy-banks/{source}/transactions"
+
+    created = async_client.post(url, headers=auth_headers, json={"amount": 100.0, "type": "income", "description": "Salary"})
+    assert created.status_code == 200
+    assert created.json()["amount"] == 100.0
+
+    batch = async_client.post(f"{url}:batch", headers=auth_headers, json=[{"amount": -10.0, "category": "Food"}, {"amount": "x"}])
+    assert len(batch.json()["created_ids"]) == 1
+    assert batch.json()["errors"][0]["index"] == 1
+
+    transfer = async_client.post(f"{PREFIX}/transfers", headers=auth_headers, json={
+        "source_piggy_bank_id": source, "target_piggy_bank_id": target, "amount": 40.0
+    })
+    assert transfer.json()["success"] is True
+
+    balance = async_client.get(f"{PREFIX}/piggy-banks/{source}/balance", headers=auth_headers).json()
+    assert balance == {"balance": 50.0, "transaction_count": 3}
+
+    page = async_client.get(f"{url}/paged", params={"limit": 2}, headers=auth_headers).json()
+    assert len(page["items"]) == 2 and page["next_cursor"]
+
+    assert [tx["description"] for tx in async_client.get(
+        f"{PREFIX}/transactions/search", params={"q": "sal"}, headers=auth_headers
+    ).json()] == ["Salary"]
+
+    stats = async_client.get(f"{PREFIX}/statistics/", headers=auth_headers)
+    assert stats.status_code == 200 and stats.json()
+
+    deleted = async_client.delete(f"{PREFIX}/transactions/{created.json()['id']}", headers=auth_headers)
+    assert deleted.json() == {"success": True}
+    assert len(async_client.get(url, headers=auth_headers).json()) == 2
+
+def test_async_routes_enforce_auth_and_ownership(async_client, auth_headers):
+    assert async_client.get(f"{PREFIX}/piggy-banks/1/balance").status_code == 401
+    assert async_client.get(
+        f"{PREFIX}/piggy-banks/1/balance", headers={"Authorization": "Bearer nope"}
+    ).status_code == 401
+    assert async_client.get(f"{PREFIX}/piggy-banks/999/balance", headers=auth_headers).status_code == 404
+
+    # Another worker deactivated the account; the cached snapshot carries the flag
+    user_id = async_client.post(f"{PREFIX}/auth/test-token", headers=auth_headers).json()["id"]
+    user_cache.set(user_id, {**user_cache.get(user_id), "is_active": False})
+    assert async_client.get(f"{PREFIX}/piggy-banks/999/balance", headers=auth_headers).status_code == 400
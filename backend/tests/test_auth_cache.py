@@ -0,0 +1,86 @@
+import pytest
+from sqlalchemy import event
+
+from app.api.deps import invalidate_cached_user, token_cache, user_cache
+from app.core.cache import TTLCache
+from app.models.user import User
+
+@pytest.fixture
+def auth_headers(client):
+    client.post(
+        "/api/v1/auth/register",
+        json={"username": "cached_user", "email": "cached_user@example.com", "password": "password"}
+    )
+    response = client.post(
+        "/api/v1/auth/login",
+        data={"username": "cached_user@example.com", "password": "password"}
+    )
+    token = response.json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+@pytest.fixture
+def user_queries(db):
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if "FROM users" in statement:
+            statements.append(statement)
+
+    engine = db.get_bind().engine
+    event.listen(engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", record)
+
+def test_repeated_requests_skip_the_user_query(client, auth_headers, user_queries):
+    first = client.post("/api/v1/auth/test-token", headers=auth_headers)
+    assert len(user_queries) == 1
+
+    second = client.post("/api/v1/auth/test-token", headers=auth_headers)
+    assert second.json() == first.json()
+    assert len(user_queries) == 1
+
+    assert client.get("/api/v1/system/cache-stats").status_code == 401
+    # Authenticating the stats request is itself a third lookup
+    stats = client.get("/api/v1/system/cache-stats", headers=auth_headers).json()
+    assert stats["users"]["hits"] == 2
+    assert stats["tokens"]["hits"] == 2
+
+def test_update_user_refreshes_the_cache(client, auth_headers):
+    client.post("/api/v1/auth/test-token", headers=auth_headers)
+    response = client.put("/api/v1/auth/me", headers=auth_headers, json={"username": "renamed_user"})
+    assert response.status_code == 200
+
+    assert client.post("/api/v1/auth/test-token", headers=auth_headers).json()["username"] == "renamed_user"
+
+def test_deleted_user_is_rejected(client, auth_headers):
+    client.post("/api/v1/auth/test-token", headers=auth_headers)
+    assert client.delete("/api/v1/auth/me", headers=auth_headers).status_code == 200
+
+    assert client.post("/api/v1/auth/test-token", headers=auth_headers).status_code == 401
+    assert user_cache.stats()["size"] == 0
+    assert token_cache.stats()["size"] == 1
+
+def test_deactivated_user_is_rejected(client, db, auth_headers):
+    user_id = client.post("/api/v1/auth/test-token", headers=auth_headers).json()["id"]
+    db.get(User, user_id).is_active = False
+    db.commit()
+    invalidate_cached_user(user_id)
+
+    # Once from the database, then from the cached snapshot
+    for _ in range(2):
+        response = client.get("/api/v1/piggy-banks", headers=auth_headers)
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Inactive user"
+    assert user_cache.stats()["size"] == 1
+
+def test_ttl_cache_expires_entries():
+    now = [0.0]
+    cache = TTLCache(maxsize=2, ttl=10, clock=lambda: now[0])
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=1)
+    now[0] = 5
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    now[0] = 10
+    assert cache.get("a") is None
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 2
@@ -0,0 +1,69 @@
+import pytest
+from app.models.balance_checkpoint import BalanceCheckpoint
+
+@pytest.fixture
+def auth_headers(client):
+    client.post(
+        "/api/v1/auth/register",
+        json={"username": "asof_user", "email": "asof_user@example.com", "password": "password"}
+    )
+    response = client.post(
+        "/api/v1/auth/login",
+        data={"username": "asof_user@example.com", "password": "password"}
+    )
+    token = response.json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+@pytest.fixture
+def piggy_bank_id(client, auth_headers):
+    response = client.post("/api/v1/piggy-banks", headers=auth_headers, json={"name": "AsOf_Bank"})
+    return response.json()["id"]
+
+def checkpoints(db, pb_id):
+    rows = db.query(BalanceCheckpoint).filter(BalanceCheckpoint.piggy_bank_id == pb_id).all()
+    return sorted((r.month, r.closing_balance, r.tx_count) for r in rows)
+
+def balance_as_of(client, auth_headers, pb_id, as_of):
+    response = client.get(
+        f"/api/v1/piggy-banks/{pb_id}/balance", params={"as_of": as_of}, headers=auth_headers
+    )
+    assert response.status_code == 200
+    return response.json()
+
+def test_balance_as_of_uses_checkpoints(client, db, auth_headers, piggy_bank_id):
+    url = f"/api/v1/piggy-banks/{piggy_bank_id}/transactions"
+    client.post(f"{url}:batch", headers=auth_headers, json=[
+        {"amount": 100.0, "date": "2024-01-10T09:00:00"},
+        {"amount": -30.0, "date": "2024-01-31T23:59:59"},
+        {"amount": 50.0, "date": "2024-03-05T12:00:00"},
+        {"amount": -5.0, "date": "2024-03-20T08:00:00"},
+    ])
+
+    assert balance_as_of(client, auth_headers, piggy_bank_id, "2023-12-31") == {
+        "as_of": "2023-12-31", "balance": 0.0, "transaction_count": 0
+    }
+    assert balance_as_of(client, auth_headers, piggy_bank_id, "2024-01-31")["balance"] == 70.0
+    assert balance_as_of(client, auth_headers, piggy_bank_id, "2024-03-05") == {
+        "as_of": "2024-03-05", "balance": 120.0, "transaction_count": 3
+    }
+    assert checkpoints(db, piggy_bank_id) == [("2024-01", 70.0, 2)]
+
+    assert balance_as_of(client, auth_headers, piggy_bank_id, "2024-05-01")["balance"] == 115.0
+    assert checkpoints(db, piggy_bank_id) == [("2024-01", 70.0, 2), ("2024-03", 115.0, 4)]
+
+def test_late_dated_writes_invalidate_forward(client, db, auth_headers, piggy_bank_id):
+    url = f"/api/v1/piggy-banks/{piggy_bank_id}/transactions"
+    client.post(url, headers=auth_headers, json={"amount": 10.0, "date": "2024-01-15T00:00:00"})
+    client.post(url, headers=auth_headers, json={"amount": 20.0, "date": "2024-03-15T00:00:00"})
+    balance_as_of(client, auth_headers, piggy_bank_id, "2024-06-30")
+    assert checkpoints(db, piggy_bank_id) == [("2024-01", 10.0, 1), ("2024-03", 30.0, 2)]
+
+    late = client.post(url, headers=auth_headers, json={"amount": 5.0, "date": "2024-02-01T00:00:00"}).json()
+    assert checkpoints(db, piggy_bank_id) == [("2024-01", 10.0, 1)]
+    assert balance_as_of(client, auth_headers, piggy_bank_id, "2024-06-30")["balance"] == 35.0
+
+    client.delete(f"/api/v1/transactions/{late['id']}", headers=auth_headers)
+    assert checkpoints(db, piggy_bank_id) == [("2024-01", 10.0, 1)]
+    assert balance_as_of(client, auth_headers, piggy_bank_id, "2024-06-30") == {
+        "as_of": "2024-06-30", "balance": 30.0, "transaction_count": 2
+    }
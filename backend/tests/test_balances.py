@@ -0,0 +1,78 @@
+import pytest
+from app.models.piggy_bank import PiggyBank
+from app.db.repositories.piggy_bank_repo import PiggyBankRepository
+
+@pytest.fixture
+def auth_headers(client):
+    client.post(
+        "/api/v1/auth/register",
+        json={"username": "balance_user", "email": "balance_user@example.com", "password": "password"}
+    )
+    response = client.post(
+        "/api/v1/auth/login",
+        data={"username": "balance_user@example.com", "password": "password"}
+    )
+    token = response.json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+@pytest.fixture
+def piggy_bank_id(client, auth_headers):
+    response = client.post("/api/v1/piggy-banks", headers=auth_headers, json={"name": "Balance_Bank"})
+    return response.json()["id"]
+
+def stored(db, pb_id):
+    db.expire_all()
+    pb = db.get(PiggyBank, pb_id)
+    return pb.balance, pb.transaction_count
+
+def test_stored_balance_follows_every_write(client, db, auth_headers, piggy_bank_id):
+    url = f"/api/v1/piggy-banks/{piggy_bank_id}/transactions"
+    tx = client.post(url, headers=auth_headers, json={"amount": 100.0, "type": "income"}).json()
+    client.post(f"{url}:batch", headers=auth_headers, json=[{"amount": -10.0}, {"amount": -15.5}])
+    assert stored(db, piggy_bank_id) == (74.5, 3)
+
+    client.delete(f"/api/v1/transactions/{tx['id']}", headers=auth_headers)
+    assert stored(db, piggy_bank_id) == (-25.5, 2)
+
+    target = client.post("/api/v1/piggy-banks", headers=auth_headers, json={"name": "Balance_Target"}).json()["id"]
+    client.post("/api/v1/transfers", headers=auth_headers, json={
+        "source_piggy_bank_id": piggy_bank_id, "target_piggy_bank_id": target, "amount": 4.5
+    })
+    assert stored(db, piggy_bank_id) == (-30.0, 3)
+    assert stored(db, target) == (4.5, 1)
+    assert PiggyBankRepository(db).find_balance_drift() == []
+
+def test_drift_is_detected_and_repaired(client, db, auth_headers, piggy_bank_id):
+    url = f"/api/v1/piggy-banks/{piggy_bank_id}/transactions"
+    client.post(url, headers=auth_headers, json={"amount": 42.0})
+
+    pb = db.get(PiggyBank, piggy_bank_id)
+    pb.balance, pb.transaction_count = 7.0, 5
+    db.flush()
+
+    repo = PiggyBankRepository(db)
+    assert repo.find_balance_drift() == [(piggy_bank_id, 7.0, 42.0, 5, 1)]
+    assert repo.recompute_balances([piggy_bank_id]) == 1
+    assert repo.find_balance_drift() == []
+    assert stored(db, piggy_bank_id) == (42.0, 1)
+
+def test_balances_listing_returns_all_banks(client, auth_headers, piggy_bank_id):
+    empty = client.post("/api/v1/piggy-banks", headers=auth_headers, json={"name": "Balance_Empty"}).json()["id"]
+    url = f"/api/v1/piggy-banks/{piggy_bank_id}/transactions"
+    client.post(url, headers=auth_headers, json={"amount": 50.0, "date": "2024-03-01T00:00:00"})
+    client.post(url, headers=auth_headers, json={"amount": -20.0, "date": "2024-05-02T08:30:00"})
+
+    response = client.get("/api/v1/piggy-banks/balances", headers=auth_headers)
+    assert response.status_code == 200
+    summaries = {pb["id"]: pb for pb in response.json()}
+    assert summaries[piggy_bank_id]["balance"] == 30.0
+    assert summaries[piggy_bank_id]["transaction_count"] == 2
+    assert summaries[piggy_bank_id]["last_activity"] == "2024-05-02T08:30:00"
+    assert summaries[empty] == {
+        "id": empty, "name": "Balance_Empty", "currency": "USD", "user_id": summaries[empty]["user_id"],
+        "balance": 0.0, "transaction_count": 0, "last_activity": None,
+    }
+
+    client.post(url, headers=auth_headers, json={"amount": 1.0, "date": "2024-06-01T00:00:00"})
+    refreshed = client.get("/api/v1/piggy-banks/balances", headers=auth_headers).json()
+    assert {pb["id"]: pb["balance"] for pb in refreshed}[piggy_bank_id] == 31.0
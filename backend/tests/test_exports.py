@@ -0,0 +1,67 @@
+import csv
+import io
+import json
+import pytest
+
+@pytest.fixture
+def auth_headers(client):
+    client.post(
+        "/api/v1/auth/register",
+        json={"username": "export_user", "email": "export_user@example.com", "password": "password"}
+    )
+    response = client.post(
+        "/api/v1/auth/login",
+        data={"username": "export_user@example.com", "password": "password"}
+    )
+    token = response.json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+@pytest.fixture
+def piggy_banks(client, auth_headers):
+    first = client.post("/api/v1/piggy-banks", headers=auth_headers, json={"name": "Export_A"}).json()["id"]
+    second = client.post("/api/v1/piggy-banks", headers=auth_headers, json={"name": "Export_B", "currency": "EUR"}).json()["id"]
+    client.post(
+        f"/api/v1/piggy-banks/{first}/transactions:batch",
+        headers=auth_headers,
+        json=[{"amount": float(i), "category": "Bulk", "date": f"2024-01-{i:02d}T08:00:00"} for i in range(1, 11)]
+    )
+    client.post(
+        f"/api/v1/piggy-banks/{second}/transactions",
+        headers=auth_headers,
+        json={"amount": -3.5, "description": 'Quote "and", comma', "date": "2024-02-01T00:00:00"}
+    )
+    return first, second
+
+def test_export_csv(client, auth_headers, piggy_banks):
+    response = client.get("/api/v1/export/transactions?format=csv", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == 11
+    assert rows[-1]["piggy_bank"] == "Export_B"
+    assert rows[-1]["currency"] == "EUR"
+    assert rows[-1]["description"] == 'Quote "and", comma'
+
+def test_export_ndjson_with_filters(client, auth_headers, piggy_banks):
+    first, _ = piggy_banks
+    response = client.get(
+        "/api/v1/export/transactions",
+        headers=auth_headers,
+        params={"format": "ndjson", "piggy_bank_id": first, "start_date": "2024-01-05T00:00:00", "end_date": "2024-01-07T23:59:59"}
+    )
+    assert response.status_code == 200
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert [r["amount"] for r in records] == [5.0, 6.0, 7.0]
+    assert records[0]["date"].startswith("2024-01-05T08:00:00")
+
+def test_export_parquet(client, auth_headers, piggy_banks):
+    pq = pytest.importorskip("pyarrow.parquet")
+    response = client.get("/api/v1/export/transactions?format=parquet", headers=auth_headers)
+    assert response.status_code == 200
+    table = pq.read_table(io.BytesIO(response.content))
+    assert table.num_rows == 11
+    assert table.column("amount").to_pylist()[:3] == [1.0, 2.0, 3.0]
+
+def test_export_rejects_foreign_piggy_bank(client, auth_headers):
+    response = client.get("/api/v1/export/transactions?piggy_bank_id=999999", headers=auth_headers)
+    assert response.status_code == 404
@@ -0,0 +1,125 @@
+import io
+import json
+import pytest
+
+from app.models.piggy_bank import PiggyBank
+from app.schemas.statement_import import ColumnMapping
+from app.services.statement_import import import_statement, parse_amount
+
+@pytest.fixture
+def auth_headers(client):
+    client.post(
+        "/api/v1/auth/register",
+        json={"username": "import_user", "email": "import_user@example.com", "password": "password"}
+    )
+    response = client.post(
+        "/api/v1/auth/login",
+        data={"username": "import_user@example.com", "password": "password"}
+    )
+    token = response.json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+@pytest.fixture
+def piggy_bank_id(client, auth_headers):
+    response = client.post("/api/v1/piggy-banks", headers=auth_headers, json={"name": "Import_Bank"})
+    return response.json()["id"]
+
+CSV_STATEMENT = """Booking Date;Value;Payee;Tag
+05.01.2024;-12.50;Coffee Shop;Food
+06.01.2024;2500.00;Employer;Salary
+not-a-date;1.00;Broken;
+07.01.2024;;Missing amount;
+"""
+
+QIF_STATEMENT = """!Type:Bank
+D1/ 5'24
+T-4.50
+PBakery
+LFood
+^
+D01/31/2024
+T1,000.00
+PEmployer
+MJanuary pay
+^
+"""
+
+OFX_STATEMENT = """OFXHEADER:100
+<OFX><BANKMSGSRSV1><STMTTRNRS><STMTRS><BANKTRANLIST>
+<STMTTRN><TRNTYPE>DEBIT<DTPOSTED>20240105120000[-5:EST]<TRNAMT>-20.00<NAME>Grocer<MEMO>Weekly</STMTTRN>
+<STMTTRN>
+<TRNTYPE>CREDIT
+<DTPOSTED>20240110
+<TRNAMT>150.00
+<MEMO>Refund
+</STMTTRN>
+</BANKTRANLIST></STMTRS></STMTTRNRS></BANKMSGSRSV1></OFX>
+"""
+
+def test_parse_amount_formats():
+    assert parse_amount("1,234.50") == 1234.5
+    assert parse_amount("$-12") == -12.0
+    assert parse_amount("(12.00)") == -12.0
+    assert parse_amount("12.00-") == -12.0
+
+def test_csv_import_with_mapping(client, auth_headers, piggy_bank_id):
+    mapping = {"date": "Booking Date", "amount": "Value", "description": "Payee",
+               "category": "Tag", "date_format": "%d.%m.%Y", "delimiter": ";"}
+    response = client.post(
+        f"/api/v1/piggy-banks/{piggy_bank_id}/imports",
+        headers=auth_headers,
+        files={"file": ("statement.csv", CSV_STATEMENT.encode("utf-8"), "text/csv")},
+        data={"mapping": json.dumps(mapping)},
+    )
+    assert response.status_code == 200, response.text
+    data = response.json()
+    assert data["imported"] == 2
+    assert data["rejected"] == 2
+    assert [e["line"] for e in data["errors"]] == [4, 5]
+
+    txs = client.get(f"/api/v1/piggy-banks/{piggy_bank_id}/transactions", headers=auth_headers).json()
+    assert [(tx["type"], tx["amount"], tx["category"]) for tx in txs] == [
+        ("income", 2500.0, "Salary"), ("expense", -12.5, "Food")
+    ]
+
+def test_qif_and_ofx_imports(client, auth_headers, piggy_bank_id):
+    for name, body in (("statement.qif", QIF_STATEMENT), ("statement.ofx", OFX_STATEMENT)):
+        response = client.post(
+            f"/api/v1/piggy-banks/{piggy_bank_id}/imports",
+            headers=auth_headers,
+            files={"file": (name, body.encode("utf-8"), "application/octet-stream")},
+        )
+        assert response.status_code == 200, response.text
+        assert response.json()["imported"] == 2
+
+    txs = client.get(f"/api/v1/piggy-banks/{piggy_bank_id}/transactions", headers=auth_headers).json()
+    assert [(tx["date"][:10], tx["amount"], tx["description"]) for tx in txs] == [
+        ("2024-01-31", 1000.0, "Employer"),
+        ("2024-01-10", 150.0, "Refund"),
+        ("2024-01-05", -20.0, "Grocer"),
+        ("2024-01-05", -4.5, "Bakery"),
+    ]
+
+def test_import_rejects_unknown_format(client, auth_headers, piggy_bank_id):
+    response = client.post(
+        f"/api/v1/piggy-banks/{piggy_bank_id}/imports",
+        headers=auth_headers,
+        files={"file": ("statement.xlsx", b"", "application/octet-stream")},
+    )
+    assert response.status_code == 400
+
+def test_import_commits_in_chunks(client, db, auth_headers, piggy_bank_id):
+    rows = "\n".join(f"2024-03-01,{i}.00" for i in range(1, 26))
+    stream = io.StringIO("date,amount\n" + rows + "\n")
+    user_id = db.get(PiggyBank, piggy_bank_id).user_id
+    calls = []
+
+    result = import_statement(
+        db, user_id, piggy_bank_id, stream, "csv", ColumnMapping(), chunk_size=10,
+        progress=lambda imported, rejected: calls.append(imported),
+    )
+    assert result["imported"] == 25
+    assert calls == [10, 20, 25]
+
+    balance = client.get(f"/api/v1/piggy-banks/{piggy_bank_id}/balance", headers=auth_headers).json()
+    assert balance == {"balance": 325.0, "transaction_count": 25}
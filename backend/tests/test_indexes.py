@@ -0,0 +1,87 @@
+from sqlalchemy import create_engine, func, inspect
+
+from app.db import migrations
+from app.db.repositories.transaction_repo import TransactionRepository
+from app.models.category import Category
+from app.models.piggy_bank import PiggyBank
+from app.models.transaction import Transaction
+
+def query_plan(db, query) -> str:
+    compiled = query.statement.compile(
+        dialect=db.bind.dialect, compile_kwargs={"render_postcompile": True}
+    )
+    params = compiled.construct_params()
+    rows = db.connection().exec_driver_sql(
+        f"EXPLAIN QUERY PLAN {compiled}",
+        tuple(params[name] for name in compiled.positiontup),
+    ).fetchall()
+    return "\n".join(row[-1] for row in rows)
+
+def test_listing_uses_piggy_bank_date_index(db):
+    plan = query_plan(db, TransactionRepository(db).filtered(1))
+    assert "USING INDEX ix_transactions_pb_date_id (piggy_bank_id=?)" in plan
+    # The index already provides the ordering
+    assert "TEMP B-TREE" not in plan
+
+def test_category_filter_is_an_index_search(db):
+    plan = query_plan(db, TransactionRepository(db).filtered(1, category="Food"))
+    assert "SEARCH transactions USING INDEX ix_transactions_pb_" in plan
+
+def test_category_breakdown_uses_piggy_bank_category_index(db):
+    query = db.query(Transaction.category, func.count(Transaction.id)).filter(
+        Transaction.piggy_bank_id == 1
+    ).group_by(Transaction.category)
+    plan = query_plan(db, query)
+    assert "USING COVERING INDEX ix_transactions_pb_category (piggy_bank_id=?)" in plan
+    assert "TEMP B-TREE" not in plan
+
+def test_statistics_scan_uses_index(db):
+    query = db.query(Transaction.id).filter(Transaction.piggy_bank_id.in_([1, 2, 3]))
+    assert "USING COVERING INDEX ix_transactions_pb_" in query_plan(db, query)
+
+def test_category_lookup_uses_user_name_index(db):
+    query = db.query(Category).filter(Category.user_id == 1, Category.name == "Food")
+    assert "ix_categories_user_name (user_id=? AND name=?)" in query_plan(db, query)
+
+def test_migrations_upgrade_legacy_database(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    with engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE users (id INTEGER PRIMARY KEY, email VARCHAR(255), hashed_password VARCHAR(255), is_active BOOLEAN)")
+        conn.exec_driver_sql("CREATE TABLE piggy_banks (id INTEGER PRIMARY KEY, user_id INTEGER, name VARCHAR(50))")
+        conn.exec_driver_sql("CREATE TABLE categories (id INTEGER PRIMARY KEY, name VARCHAR(100), user_id INTEGER)")
+        conn.exec_driver_sql("CREATE TABLE transactions (id INTEGER PRIMARY KEY, piggy_bank_id INTEGER, amount FLOAT, category VARCHAR(100), description VARCHAR(255), date DATETIME)")
+        conn.exec_driver_sql("INSERT INTO users VALUES (1, 'legacy@example.com', 'x', 1)")
+        conn.exec_driver_sql("INSERT INTO piggy_banks VALUES (1, 1, 'Legacy')")
+        # Orphan left behind by a delete that ran without foreign keys
+        conn.exec_driver_sql("INSERT INTO transactions VALUES (2, 99, -1.0, 'Food', 'Orphan', '2024-01-02 10:00:00')")
+        conn.exec_driver_sql("INSERT INTO transactions VALUES (1, 1, -5.0, 'Transfer Out', 'To savings', '2024-01-01 10:00:00')")
+
+    assert migrations.upgrade(engine) == [m.VERSION for m in migrations.MIGRATIONS]
+    assert migrations.upgrade(engine) == []
+
+    inspector = inspect(engine)
+    assert {c["name"] for c in inspector.get_columns("piggy_banks")} >= {
+        "currency", "balance", "transaction_count"
+    }
+    assert {i["name"] for i in inspector.get_indexes("transactions")} >= {
+        "ix_transactions_pb_date_id", "ix_transactions_pb_category"
+    }
+    for table in ("piggy_banks", "categories", "transactions"):
+        assert [fk["options"] for fk in inspector.get_foreign_keys(table)] == [{"ondelete": "CASCADE"}]
+    with engine.connect() as conn:
+        assert migrations.current_version(conn) == migrations.LATEST_VERSION
+        assert conn.exec_driver_sql("SELECT type, date FROM transactions").one() == (
+            "transfer", "2024-01-01 10:00:00.000000"
+        )
+        assert conn.exec_driver_sql(
+            "SELECT balance, transaction_count FROM piggy_banks"
+        ).one() == (-5.0, 1)
+        assert conn.exec_driver_sql(
+            "SELECT rowid FROM transactions_fts WHERE transactions_fts MATCH 'savings'"
+        ).all() == [(1,)]
+        conn.exec_driver_sql("PRAGMA foreign_keys=ON")
+        conn.exec_driver_sql("DELETE FROM users")
+        assert conn.exec_driver_sql("SELECT COUNT(*) FROM transactions").scalar() == 0
+        assert conn.exec_driver_sql(
+            "SELECT rowid FROM transactions_fts WHERE transactions_fts MATCH 'savings'"
+        ).all() == []
@@ -0,0 +1,86 @@
+import logging
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from app.api.middleware import MetricsMiddleware
+from app.core import metrics
+from app.db.instrumentation import install_query_instrumentation
+
+@pytest.fixture
+def auth_headers(client):
+    client.post(
+        "/api/v1/auth/register",
+        json={"username": "metrics_user", "email": "metrics_user@example.com", "password": "password"}
+    )
+    response = client.post(
+        "/api/v1/auth/login",
+        data={"username": "metrics_user@example.com", "password": "password"}
+    )
+    token = response.json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+@pytest.fixture
+def piggy_bank_id(client, auth_headers):
+    response = client.post("/api/v1/piggy-banks", headers=auth_headers, json={"name": "Metrics_Bank"})
+    return response.json()["id"]
+
+def test_metrics_report_routes_and_queries(client, auth_headers, piggy_bank_id):
+    metrics.reset()
+    route = "/api/v1/piggy-banks/{pb_id}/transactions"
+    client.get(f"/api/v1/piggy-banks/{piggy_bank_id}/transactions", headers=auth_headers)
+    client.get(f"/api/v1/piggy-banks/{piggy_bank_id}/transactions", headers=auth_headers)
+
+    assert metrics.requests_total.value(method="GET", route=route, status="200") == 2
+    assert metrics.request_queries.count(method="GET", route=route) == 2
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+    assert f'http_requests_total{{method="GET",route="{route}",status="200"}} 2' in body
+    assert f'http_request_duration_seconds_count{{method="GET",route="{route}"}} 2' in body
+    assert f'http_request_db_queries_bucket{{method="GET",route="{route}",le="0"}} 0' in body
+    assert 'app_cache_size{cache="users"}' in body
+
+def test_server_timing_header(db):
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware, server_timing=True)
+
+    def get_session():
+        yield db
+
+    @app.get("/items/{item_id}")
+    def read_item(item_id: int, session=Depends(get_session)):
+        session.execute(text("SELECT 1"))
+        session.execute(text("SELECT 2"))
+        return {"id": item_id}
+
+    metrics.reset()
+    response = TestClient(app).get("/items/7")
+    assert 'desc="2 queries"' in response.headers["server-timing"]
+    assert metrics.requests_total.value(method="GET", route="/items/{item_id}", status="200") == 1
+    assert TestClient(app).get("/missing").status_code == 404
+    assert metrics.requests_total.value(method="GET", route="unmatched", status="404") == 1
+
+def test_slow_query_log_includes_plan(caplog):
+    engine = create_engine("sqlite://")
+    install_query_instrumentation(engine, slow_query_ms=0.0)
+    with engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE items (id INTEGER PRIMARY KEY, name VARCHAR(20))")
+        with caplog.at_level(logging.WARNING, logger="app.db.slow_query"):
+            conn.execute(text("SELECT id FROM items WHERE name = :name"), {"name": "x"})
+
+    record = caplog.records[-1].getMessage()
+    assert "SELECT id FROM items WHERE name = ?" in record
+    assert "SCAN items" in record
+    assert "Parameters: <redacted>" in record
+
+def test_slow_query_parameters_are_opt_in(caplog):
+    engine = create_engine("sqlite://")
+    install_query_instrumentation(engine, slow_query_ms=0.0, log_parameters=True)
+    with engine.begin() as conn:
+        with caplog.at_level(logging.WARNING, logger="app.db.slow_query"):
+            conn.execute(text("SELECT :email"), {"email": "someone@example.com"})
+
+    assert "someone@example.com" in caplog.records[-1].getMessage()
@@ -0,0 +1,99 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, inspect
+from app import main
+from app.core.config import settings
+from app.db import migrations
+from app.db.base import Base
+
+def legacy_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    with engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE users (id INTEGER PRIMARY KEY, email VARCHAR(255), hashed_password VARCHAR(255), is_active BOOLEAN)")
+        conn.exec_driver_sql("CREATE TABLE piggy_banks (id INTEGER PRIMARY KEY, user_id INTEGER, name VARCHAR(50))")
+        conn.exec_driver_sql("CREATE TABLE categories (id INTEGER PRIMARY KEY, name VARCHAR(100), user_id INTEGER)")
+        conn.exec_driver_sql("CREATE TABLE transactions (id INTEGER PRIMARY KEY, piggy_bank_id INTEGER, amount FLOAT, category VARCHAR(100), description VARCHAR(255), date DATETIME)")
+        conn.exec_driver_sql("INSERT INTO users VALUES (1, 'legacy@example.com', 'x', 1)")
+        conn.exec_driver_sql("INSERT INTO piggy_banks VALUES (1, 1, 'Legacy')")
+        conn.exec_driver_sql("INSERT INTO transactions VALUES (1, 1, 100.0, 'Salary', 'Pay', '2024-01-01 10:00:00')")
+        conn.exec_driver_sql("INSERT INTO transactions VALUES (2, 1, -30.0, 'Food', 'Lunch', '2024-01-15 10:00:00')")
+    return engine
+
+def schema(engine):
+    inspector = inspect(engine)
+    return {
+        table: sorted(column["name"] for column in inspector.get_columns(table))
+        for table in inspector.get_table_names()
+    }
+
+def test_new_database_is_created_and_stamped(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'new.db'}")
+    with pytest.raises(migrations.SchemaVersionError):
+        migrations.verify(engine)
+
+    assert migrations.upgrade(engine) == [m.VERSION for m in migrations.MIGRATIONS]
+    assert migrations.verify(engine) == migrations.LATEST_VERSION
+    assert migrations.upgrade(engine) == []
+    assert set(Base.metadata.tables) <= set(inspect(engine).get_table_names())
+
+def test_new_database_refuses_a_partial_target(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'new.db'}")
+    with pytest.raises(migrations.SchemaVersionError):
+        migrations.upgrade(engine, target=3)
+    # Nothing was stamped, so a full migrate still creates the schema
+    assert migrations.upgrade(engine) == [m.VERSION for m in migrations.MIGRATIONS]
+    assert set(Base.metadata.tables) <= set(inspect(engine).get_table_names())
+
+def test_migrated_legacy_database_matches_models(tmp_path):
+    engine = legacy_engine(tmp_path)
+    migrations.upgrade(engine)
+    assert migrations.verify(engine) == migrations.LATEST_VERSION
+
+    fresh = create_engine(f"sqlite:///{tmp_path / 'fresh.db'}")
+    migrations.upgrade(fresh)
+    for table in ("transaction_rollups", "user_data_versions", "balance_checkpoints", "data_version_sequence"):
+        assert schema(engine)[table] == schema(fresh)[table]
+
+    with engine.connect() as conn:
+        assert conn.exec_driver_sql(
+            "SELECT month, type, category, credit_total, debit_total, tx_count "
+            "FROM transaction_rollups ORDER BY category"
+        ).all() == [("2024-01", "expense", "Food", 0.0, -30.0, 1), ("2024-01", "expense", "Salary", 100.0, 0.0, 1)]
+        # Existing users are seeded from the sequence instead of starting at 0
+        assert conn.exec_driver_sql("SELECT user_id, version FROM user_data_versions").all() == [(1, 1)]
+        assert conn.exec_driver_sql("SELECT value FROM data_version_sequence").scalar() == 1
+
+def test_downgrade_and_upgrade_round_trip(tmp_path):
+    engine = legacy_engine(tmp_path)
+    migrations.upgrade(engine)
+
+    assert migrations.downgrade(engine, 4) == [9, 8, 7, 6, 5]
+    inspector = inspect(engine)
+    assert "transactions_fts" not in inspector.get_table_names()
+    assert "transaction_rollups" not in inspector.get_table_names()
+    assert [fk["options"] for fk in inspector.get_foreign_keys("transactions")] == [{}]
+    with pytest.raises(migrations.SchemaVersionError):
+        migrations.verify(engine)
+
+    assert migrations.downgrade(engine, 0) == [4, 3, 2, 1]
+    assert "username" not in schema(engine)["users"]
+    assert "balance" not in schema(engine)["piggy_banks"]
+
+    assert migrations.upgrade(engine) == [m.VERSION for m in migrations.MIGRATIONS]
+    with engine.connect() as conn:
+        assert conn.exec_driver_sql("SELECT balance, transaction_count FROM piggy_banks").one() == (70.0, 2)
+        assert conn.exec_driver_sql(
+            "SELECT rowid FROM transactions_fts WHERE transactions_fts MATCH 'lunch'"
+        ).all() == [(2,)]
+
+def test_app_refuses_outdated_schema(tmp_path, monkeypatch):
+    engine = legacy_engine(tmp_path)
+    monkeypatch.setattr(settings, "DB_SCHEMA_CHECK", True)
+    monkeypatch.setattr(main, "engine", engine)
+    with pytest.raises(migrations.SchemaVersionError):
+        with TestClient(main.app):
+            pass
+
+    migrations.upgrade(engine)
+    with TestClient(main.app) as client:
+        assert client.get("/").status_code == 200
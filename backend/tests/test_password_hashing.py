@@ -0,0 +1,70 @@
+from fastapi.testclient import TestClient
+from app.core import security
+from app.core.config import settings
+from app.main import app
+from app.models.user import User
+
+def register_and_login(client, password="password"):
+    client.post(
+        "/api/v1/auth/register",
+        json={"username": "hash_user", "email": "hash_user@example.com", "password": password}
+    )
+    return client.post(
+        "/api/v1/auth/login",
+        data={"username": "hash_user@example.com", "password": password}
+    )
+
+def stored_hash(db):
+    db.expire_all()
+    return db.query(User).filter(User.email == "hash_user@example.com").one().hashed_password
+
+def test_hash_rounds_and_needs_rehash(monkeypatch):
+    hashed = security.get_password_hash("secret", rounds=4)
+    assert security.hash_rounds(hashed) == 4
+    assert security.hash_rounds("not-a-hash") is None
+
+    monkeypatch.setattr(settings, "BCRYPT_ROUNDS", 4)
+    assert not security.needs_rehash(hashed)
+    monkeypatch.setattr(settings, "BCRYPT_ROUNDS", 5)
+    assert security.needs_rehash(hashed)
+
+def test_login_rehashes_when_cost_changes(client, db, monkeypatch):
+    monkeypatch.setattr(settings, "BCRYPT_ROUNDS", 4)
+    assert register_and_login(client).status_code == 200
+    assert security.hash_rounds(stored_hash(db)) == 4
+
+    monkeypatch.setattr(settings, "BCRYPT_ROUNDS", 5)
+    response = client.post(
+        "/api/v1/auth/login",
+        data={"username": "hash_user@example.com", "password": "password"}
+    )
+    assert response.status_code == 200
+    assert security.hash_rounds(stored_hash(db)) == 5
+
+    wrong = client.post(
+        "/api/v1/auth/login",
+        data={"username": "hash_user@example.com", "password": "wrong"}
+    )
+    assert wrong.status_code == 400
+
+def test_worker_pool_stops_with_the_app(monkeypatch):
+    monkeypatch.setattr(settings, "BCRYPT_ROUNDS", 4)
+    with TestClient(app) as client:
+        hashed = client.portal.call(security.hash_password_async, "secret")
+        assert security._executor is not None
+    assert security._executor is None
+    assert security.verify_password("secret", hashed)
+
+def test_inline_hashing_without_worker_pool(client, monkeypatch):
+    monkeypatch.setattr(settings, "BCRYPT_ROUNDS", 4)
+    monkeypatch.setattr(settings, "PASSWORD_HASH_WORKERS", 0)
+    assert register_and_login(client).status_code == 200
+
+def test_full_queue_returns_503(client, monkeypatch):
+    monkeypatch.setattr(settings, "PASSWORD_HASH_MAX_PENDING", 0)
+    response = client.post(
+        "/api/v1/auth/register",
+        json={"username": "hash_user", "email": "hash_user@example.com", "password": "password"}
+    )
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
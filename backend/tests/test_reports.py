@@ -0,0 +1,155 @@
+import pytest
+from app.models.transaction import Transaction
+from app.services.reporting import SQLReportGenerator
+
+@pytest.fixture
+def auth_headers(client):
+    client.post(
+        "/api/v1/auth/register",
+        json={"username": "report_user", "email": "report_user@example.com", "password": "password"}
+    )
+    response = client.post(
+        "/api/v1/auth/login",
+        data={"username": "report_user@example.com", "password": "password"}
+    )
+    token = response.json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+@pytest.fixture
+def piggy_bank_id(client, auth_headers):
+    pb_id = client.post("/api/v1/piggy-banks", headers=auth_headers, json={"name": "Report_Bank"}).json()["id"]
+    txs = [
+        {"amount": 500.0, "type": "income", "category": "Salary", "date": "2023-11-30T09:00:00"},
+        {"amount": 3000.0, "type": "income", "category": "Salary", "date": "2024-01-05T09:00:00"},
+        {"amount": 50.0, "type": "income", "category": "Gift", "date": "2024-01-06T09:00:00"},
+        {"amount": -40.0, "category": "Food", "date": "2024-01-20T12:00:00"},
+        {"amount": -60.0, "category": "Food", "date": "2024-01-21T12:00:00"},
+        {"amount": -15.0, "category": "Fun", "date": "2024-01-22T12:00:00"},
+        {"amount": -200.0, "category": "Savings", "date": "2024-01-25T12:00:00"},
+        {"amount": -5.0, "category": "", "date": "2024-01-31T12:00:00"},
+        {"amount": -25.0, "category": "Food", "date": "2024-04-02T12:00:00"},
+        {"amount": 10.0, "type": "income", "category": "Gift", "date": "2025-01-01T00:00:00"},
+    ]
+    client.post(f"/api/v1/piggy-banks/{pb_id}/transactions:batch", headers=auth_headers, json=txs)
+    return pb_id
+
+def get(client, auth_headers, path, **params):
+    response = client.get(f"/api/v1/piggy-banks{path}", headers=auth_headers, params=params)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+def test_monthly_report(client, auth_headers, piggy_bank_id):
+    report = get(client, auth_headers, f"/{piggy_bank_id}/reports/monthly", year=2024, month=1)
+    assert report == {
+        "year": 2024,
+        "month": 1,
+        "period": "2024-01",
+        "balance_before": 500.0,
+        "income": 3050.0,
+        "expenses": -320.0,
+        "net": 2730.0,
+        "balance_after": 3230.0,
+        "transaction_count": 7,
+        # Savings transfers and uncategorized rows are left out of the breakdown
+        "expense_by_category": {"Food": -100.0, "Fun": -15.0},
+        "income_by_category": {"Salary": 3000.0, "Gift": 50.0},
+    }
+    assert list(report["expense_by_category"]) == ["Food", "Fun"]
+
+def test_yearly_report(client, auth_headers, piggy_bank_id):
+    report = get(client, auth_headers, f"/{piggy_bank_id}/reports/yearly", year=2024)
+    assert report["balance_before"] == 500.0
+    assert report["expenses"] == -345.0
+    assert report["balance_after"] == 3205.0
+    assert report["transaction_count"] == 8
+    assert list(report["expense_by_category"].items()) == [("Savings", -200.0), ("Food", -125.0), ("Fun", -15.0)]
+    assert len(report["monthly_summary"]) == 12
+    assert report["monthly_summary"][0] == {"month": 1, "income": 3050.0, "expenses": -320.0, "net": 2730.0}
+    assert report["monthly_summary"][3] == {"month": 4, "income": 0.0, "expenses": -25.0, "net": -25.0}
+    assert report["monthly_summary"][11] == {"month": 12, "income": 0.0, "expenses": 0.0, "net": 0.0}
+
+def test_category_summary_bounds_are_inclusive(client, auth_headers, piggy_bank_id):
+    summary = get(
+        client, auth_headers, f"/{piggy_bank_id}/reports/category-summary",
+        start_date="2024-01-20T12:00:00", end_date="2024-04-02T12:00:00",
+    )
+    assert summary == {
+        "total_income": 0.0,
+        "total_expenses": -345.0,
+        "expense_by_category": {"Savings": -200.0, "Food": -125.0, "Fun": -15.0},
+        "income_by_category": {},
+    }
+    by_year = get(client, auth_headers, f"/{piggy_bank_id}/reports/category-summary", year=2025)
+    assert by_year["income_by_category"] == {"Gift": 10.0}
+
+def test_category_summary_accepts_aware_bounds(client, auth_headers, piggy_bank_id):
+    # Aware bounds are compared in UTC, including against the year's naive limits
+    summary = get(
+        client, auth_headers, f"/{piggy_bank_id}/reports/category-summary",
+        year=2024, start_date="2024-01-20T14:00:00+02:00", end_date="2024-04-02T12:00:00Z",
+    )
+    assert summary["total_expenses"] == -345.0
+    assert summary["expense_by_category"] == {"Savings": -200.0, "Food": -125.0, "Fun": -15.0}
+
+def test_reports_are_scoped_and_validated(client, auth_headers, piggy_bank_id):
+    assert client.get(
+        f"/api/v1/piggy-banks/{piggy_bank_id}/reports/monthly?year=2024&month=13", headers=auth_headers
+    ).status_code == 400
+
+    client.post("/api/v1/auth/register", json={"username": "report_other", "email": "report_other@example.com", "password": "password"})
+    token = client.post("/api/v1/auth/login", data={"username": "report_other@example.com", "password": "password"}).json()["access_token"]
+    response = client.get(
+        f"/api/v1/piggy-banks/{piggy_bank_id}/reports/yearly?year=2024", headers={"Authorization": f"Bearer {token}"}
+    )
+    assert response.status_code == 404
+
+def year_files(tmp_path, monkeypatch, df):
+    """Save `df` as one file per year and return a manager over them, nothing loaded."""
+    pytest.importorskip("pyarrow")
+    from app.core.config import settings
+    from app.domain.transactions import TransactionManager
+
+    monkeypatch.setattr(settings, "USER_DATA_DIR", str(tmp_path))
+    df = df.assign(**{"Transaction ID": range(1, len(df) + 1), "Description": "", "Balance": df["Amount"].cumsum()})
+    for year, year_df in df.groupby(df["Date"].dt.year):
+        tm = TransactionManager("alice", "Wallet", storage="parquet")
+        tm.transactions_df = year_df.reset_index(drop=True)
+        tm.save(year)
+    return TransactionManager("alice", "Wallet", storage="parquet")
+
+def test_matches_pandas_report_generator(client, db, auth_headers, piggy_bank_id, tmp_path, monkeypatch):
+    pd = pytest.importorskip("pandas")
+    from app.domain.reports import ReportGenerator
+
+    rows = db.query(Transaction).filter(Transaction.piggy_bank_id == piggy_bank_id).order_by(Transaction.date).all()
+    df = pd.DataFrame({
+        "Date": pd.to_datetime([tx.date for tx in rows]),
+        "Amount": [tx.amount for tx in rows],
+        "Category": [tx.category or None for tx in rows],
+    })
+    expected = ReportGenerator(year_files(tmp_path, monkeypatch, df))
+    actual = SQLReportGenerator(db, piggy_bank_id)
+
+    for month in (1, 2, 4):
+        assert actual.generate_monthly_report(2024, month) == expected.generate_monthly_report(2024, month)
+    assert actual.generate_yearly_report(2024) == expected.generate_yearly_report(2024)
+    assert actual.get_category_summary() == expected.get_category_summary()
+
+def test_pandas_yearly_report_single_pass(tmp_path, monkeypatch):
+    pd = pytest.importorskip("pandas")
+    from app.domain.reports import ReportGenerator
+
+    df = pd.DataFrame({
+        "Date": pd.to_datetime(["2023-12-31 23:00", "2024-01-05 00:00", "2024-01-20 00:00", "2024-03-01 00:00", "2024-03-02 00:00", "2024-12-31 23:59", "2025-01-01 00:00"]),
+        "Amount": [100.0, 50.0, -20.0, -20.0, 0.0, 30.0, 999.0],
+        "Category": ["Salary", "Gift", "Food", None, "Food", "Gift", "Salary"],
+    })
+    report = ReportGenerator(year_files(tmp_path, monkeypatch, df)).generate_yearly_report(2024)
+    # The opening balance is carried over from the 2023 file
+    assert report["balance_before"] == 100.0
+    assert (report["income"], report["expenses"], report["balance_after"]) == (80.0, -40.0, 140.0)
+    assert report["transaction_count"] == 5
+    # Uncategorized rows count towards the totals but not the breakdowns
+    assert report["expense_by_category"] == {"Food": -20.0}
+    assert report["income_by_category"] == {"Gift": 80.0}
+    assert [row["net"] for row in report["monthly_summary"]] == [30.0, 0.0, -20.0] + [0.0] * 8 + [30.0]
@@ -0,0 +1,99 @@
+import pytest
+from app.api.caching import make_etag, response_cache
+from app.db.repositories.data_version_repo import DataVersionRepository
+
+@pytest.fixture
+def auth_headers(client):
+    client.post(
+        "/api/v1/auth/register",
+        json={"username": "cache_user", "email": "cache_user@example.com", "password": "password"}
+    )
+    response = client.post(
+        "/api/v1/auth/login",
+        data={"username": "cache_user@example.com", "password": "password"}
+    )
+    token = response.json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+@pytest.fixture
+def piggy_bank_id(client, auth_headers):
+    response = client.post("/api/v1/piggy-banks", headers=auth_headers, json={"name": "Cache_Bank"})
+    return response.json()["id"]
+
+def test_balance_is_served_from_cache_until_write(client, auth_headers, piggy_bank_id):
+    url = f"/api/v1/piggy-banks/{piggy_bank_id}/balance"
+    first = client.get(url, headers=auth_headers)
+    second = client.get(url, headers=auth_headers)
+    assert first.json() == second.json() == {"balance": 0.0, "transaction_count": 0}
+    assert response_cache.hits == 1
+
+    client.post(f"/api/v1/piggy-banks/{piggy_bank_id}/transactions", headers=auth_headers, json={"amount": 42.0})
+    third = client.get(url, headers=auth_headers)
+    assert third.json()["balance"] == 42.0
+    assert third.headers["etag"] != first.headers["etag"]
+
+def test_etag_revalidation(client, auth_headers, piggy_bank_id):
+    url = "/api/v1/statistics/?timeframe=monthly"
+    first = client.get(url, headers=auth_headers)
+    etag = first.headers["etag"]
+
+    revalidated = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+
+    client.post("/api/v1/categories", headers=auth_headers, json={"name": "Books"})
+    changed = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+
+def test_cache_is_scoped_per_parameters(client, auth_headers, piggy_bank_id):
+    client.post(
+        f"/api/v1/piggy-banks/{piggy_bank_id}/transactions",
+        headers=auth_headers,
+        json={"amount": 10.0, "type": "income", "date": "2024-05-01T00:00:00"}
+    )
+    monthly = client.get("/api/v1/statistics/?timeframe=monthly", headers=auth_headers).json()
+    yearly = client.get("/api/v1/statistics/?timeframe=yearly", headers=auth_headers).json()
+    assert monthly[0]["period"] == "2024-05"
+    assert yearly[0]["period"] == "2024"
+
+def test_unowned_balance_is_not_cached(client, auth_headers):
+    response = client.get("/api/v1/piggy-banks/999999/balance", headers=auth_headers)
+    assert response.status_code == 404
+    assert response_cache.stats()["size"] == 0
+
+def test_unowned_ids_get_404_even_with_a_matching_etag(client, db, auth_headers):
+    user_id = client.post("/api/v1/auth/test-token", headers=auth_headers).json()["id"]
+    version = DataVersionRepository(db).get(user_id)
+    for url, endpoint, params in [
+        ("/api/v1/piggy-banks/999999/balance", "balance", (999999, None)),
+        ("/api/v1/piggy-banks/999999/reports/yearly?year=2024", "report_yearly", (999999, 2024)),
+    ]:
+        etag = make_etag(user_id, version, endpoint, params)
+        response = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == 404
+
+def test_reused_user_id_never_matches_a_deleted_users_cache(client, db, auth_headers, piggy_bank_id):
+    client.post(f"/api/v1/piggy-banks/{piggy_bank_id}/transactions", headers=auth_headers, json={"amount": 42.0})
+    old = client.get("/api/v1/statistics/?timeframe=monthly", headers=auth_headers)
+    old_id = client.post("/api/v1/auth/test-token", headers=auth_headers).json()["id"]
+    old_version = DataVersionRepository(db).get(old_id)
+    assert client.delete("/api/v1/auth/me", headers=auth_headers).json() == {"success": True}
+
+    # Another worker would still hold the old entry; SQLite hands the id out again
+    client.post(
+        "/api/v1/auth/register",
+        json={"username": "cache_user2", "email": "cache_user2@example.com", "password": "password"}
+    )
+    token = client.post(
+        "/api/v1/auth/login", data={"username": "cache_user2@example.com", "password": "password"}
+    ).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    assert client.post("/api/v1/auth/test-token", headers=headers).json()["id"] == old_id
+    # Versions keep counting up across accounts instead of restarting at 0
+    assert DataVersionRepository(db).get(old_id) > old_version
+
+    new = client.get("/api/v1/statistics/?timeframe=monthly", headers={**headers, "If-None-Match": old.headers["etag"]})
+    assert new.status_code == 200
+    assert new.headers["etag"] != old.headers["etag"]
+    assert new.json() == []
@@ -0,0 +1,79 @@
+import pytest
+from app.models.transaction_rollup import TransactionRollup
+from app.db.repositories.rollup_repo import RollupRepository
+
+@pytest.fixture
+def auth_headers(client):
+    client.post(
+        "/api/v1/auth/register",
+        json={"username": "rollup_user", "email": "rollup_user@example.com", "password": "password"}
+    )
+    response = client.post(
+        "/api/v1/auth/login",
+        data={"username": "rollup_user@example.com", "password": "password"}
+    )
+    token = response.json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+@pytest.fixture
+def piggy_bank_id(client, auth_headers):
+    response = client.post("/api/v1/piggy-banks", headers=auth_headers, json={"name": "Rollup_Bank"})
+    return response.json()["id"]
+
+def snapshot(db, pb_id):
+    rows = db.query(TransactionRollup).filter(TransactionRollup.piggy_bank_id == pb_id).all()
+    return sorted((r.month, r.type, r.category, r.credit_total, r.debit_total, r.tx_count) for r in rows)
+
+def test_rollup_follows_adds_and_deletes(client, db, auth_headers, piggy_bank_id):
+    url = f"/api/v1/piggy-banks/{piggy_bank_id}/transactions"
+    client.post(url, headers=auth_headers, json={"amount": 100.0, "type": "income", "category": "Salary", "date": "2024-01-01T00:00:00"})
+    client.post(url, headers=auth_headers, json={"amount": -30.0, "category": "Food", "date": "2024-01-15T00:00:00"})
+    tx = client.post(url, headers=auth_headers, json={"amount": -20.0, "category": "Food", "date": "2024-01-20T00:00:00"}).json()
+    client.post(url, headers=auth_headers, json={"amount": -5.0, "date": "2024-02-01T00:00:00"})
+
+    assert snapshot(db, piggy_bank_id) == [
+        ("2024-01", "expense", "Food", 0.0, -50.0, 2),
+        ("2024-01", "income", "Salary", 100.0, 0.0, 1),
+        ("2024-02", "expense", "", 0.0, -5.0, 1),
+    ]
+
+    client.delete(f"/api/v1/transactions/{tx['id']}", headers=auth_headers)
+    assert ("2024-01", "expense", "Food", 0.0, -30.0, 1) in snapshot(db, piggy_bank_id)
+
+    balance = client.get(f"/api/v1/piggy-banks/{piggy_bank_id}/balance", headers=auth_headers).json()
+    assert balance == {"balance": 65.0, "transaction_count": 3}
+
+def test_rollup_drops_empty_buckets(client, db, auth_headers, piggy_bank_id):
+    url = f"/api/v1/piggy-banks/{piggy_bank_id}/transactions"
+    tx = client.post(url, headers=auth_headers, json={"amount": -5.0, "date": "2024-02-01T00:00:00"}).json()
+    client.delete(f"/api/v1/transactions/{tx['id']}", headers=auth_headers)
+    assert snapshot(db, piggy_bank_id) == []
+
+def test_retraction_only_checks_the_touched_buckets(client, db, auth_headers, piggy_bank_id):
+    # An emptied bucket elsewhere is not this delete's business (and not worth a scan)
+    db.add(TransactionRollup(piggy_bank_id=piggy_bank_id, month="2023-12", type="expense", category="",
+                             credit_total=0.0, debit_total=0.0, tx_count=0))
+    db.commit()
+    url = f"/api/v1/piggy-banks/{piggy_bank_id}/transactions"
+    tx = client.post(url, headers=auth_headers, json={"amount": -5.0, "date": "2024-02-01T00:00:00"}).json()
+    client.delete(f"/api/v1/transactions/{tx['id']}", headers=auth_headers)
+    assert snapshot(db, piggy_bank_id) == [("2023-12", "expense", "", 0.0, 0.0, 0)]
+
+def test_rebuild_matches_incremental_rollup(client, db, auth_headers, piggy_bank_id):
+    target = client.post("/api/v1/piggy-banks", headers=auth_headers, json={"name": "Rollup_Target"}).json()["id"]
+    url = f"/api/v1/piggy-banks/{piggy_bank_id}/transactions"
+    client.post(url, headers=auth_headers, json={"amount": 500.0, "type": "income", "date": "2023-12-31T23:59:59"})
+    client.post(url, headers=auth_headers, json={"amount": -12.5, "category": "Food"})
+    client.post("/api/v1/transfers", headers=auth_headers, json={
+        "source_piggy_bank_id": piggy_bank_id, "target_piggy_bank_id": target, "amount": 200.0
+    })
+
+    incremental = snapshot(db, piggy_bank_id), snapshot(db, target)
+    RollupRepository(db).rebuild()
+    db.expire_all()
+    assert (snapshot(db, piggy_bank_id), snapshot(db, target)) == incremental
+
+def test_piggy_bank_delete_clears_rollup(client, db, auth_headers, piggy_bank_id):
+    client.post(f"/api/v1/piggy-banks/{piggy_bank_id}/transactions", headers=auth_headers, json={"amount": 1.0})
+    client.delete(f"/api/v1/piggy-banks/{piggy_bank_id}", headers=auth_headers)
+    assert snapshot(db, piggy_bank_id) == []
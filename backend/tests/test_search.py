@@ -0,0 +1,63 @@
+import pytest
+from app.db import fts
+
+@pytest.fixture
+def auth_headers(client):
+    client.post(
+        "/api/v1/auth/register",
+        json={"username": "search_user", "email": "search_user@example.com", "password": "password"}
+    )
+    response = client.post(
+        "/api/v1/auth/login",
+        data={"username": "search_user@example.com", "password": "password"}
+    )
+    token = response.json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+@pytest.fixture
+def piggy_bank_id(client, auth_headers):
+    response = client.post("/api/v1/piggy-banks", headers=auth_headers, json={"name": "Search_Bank"})
+    return response.json()["id"]
+
+def search(client, auth_headers, q, **params):
+    response = client.get("/api/v1/transactions/search", params={"q": q, **params}, headers=auth_headers)
+    assert response.status_code == 200
+    return [tx["description"] for tx in response.json()]
+
+def test_match_query_quotes_prefix_terms():
+    assert fts.match_query('star "bucks" OR') == '"star"* "bucks"* "OR"*'
+    assert fts.match_query("  -*- ") is None
+
+def test_search_ranks_prefix_matches(client, auth_headers, piggy_bank_id):
+    url = f"/api/v1/piggy-banks/{piggy_bank_id}/transactions"
+    client.post(f"{url}:batch", headers=auth_headers, json=[
+        {"amount": -4.5, "description": "Starbucks Coffee", "category": "Food"},
+        {"amount": -60.0, "description": "Shell Station", "category": "Fuel"},
+        {"amount": -3.0, "description": "Coffee beans", "category": "Groceries"},
+        {"amount": -8.0, "description": "Café Crème", "category": "Food"},
+    ])
+
+    assert search(client, auth_headers, "star") == ["Starbucks Coffee"]
+    assert sorted(search(client, auth_headers, "coff")) == ["Coffee beans", "Starbucks Coffee"]
+    assert search(client, auth_headers, "food coffee") == ["Starbucks Coffee"]
+    assert search(client, auth_headers, "cafe") == ["Café Crème"]
+    assert search(client, auth_headers, "fuel", piggy_bank_id=piggy_bank_id) == ["Shell Station"]
+
+def test_search_follows_deletes_and_is_scoped_to_user(client, auth_headers, piggy_bank_id):
+    url = f"/api/v1/piggy-banks/{piggy_bank_id}/transactions"
+    tx = client.post(url, headers=auth_headers, json={"amount": -9.0, "description": "Bookshop"}).json()
+    assert search(client, auth_headers, "book") == ["Bookshop"]
+
+    client.post("/api/v1/auth/register", json={"username": "search_other", "email": "search_other@example.com", "password": "password"})
+    token = client.post("/api/v1/auth/login", data={"username": "search_other@example.com", "password": "password"}).json()["access_token"]
+    other = {"Authorization": f"Bearer {token}"}
+    assert search(client, other, "book") == []
+    response = client.get("/api/v1/transactions/search", params={"q": "book", "piggy_bank_id": piggy_bank_id}, headers=other)
+    assert response.status_code == 404
+
+    client.delete(f"/api/v1/transactions/{tx['id']}", headers=auth_headers)
+    assert search(client, auth_headers, "book") == []
+
+def test_search_requires_a_word(client, auth_headers):
+    response = client.get("/api/v1/transactions/search", params={"q": "***"}, headers=auth_headers)
+    assert response.status_code == 400
@@ -0,0 +1,45 @@
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.core.config import settings
+from app.db.base import create_db_engine
+
+def pragma(engine, name):
+    with engine.connect() as conn:
+        return conn.exec_driver_sql(f"PRAGMA {name}").scalar()
+
+def test_file_engine_applies_configured_pragmas(tmp_path):
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'tuned.db'}")
+    try:
+        assert pragma(engine, "journal_mode") == settings.SQLITE_JOURNAL_MODE.lower()
+        assert pragma(engine, "synchronous") == 1  # NORMAL
+        assert pragma(engine, "busy_timeout") == settings.SQLITE_BUSY_TIMEOUT_MS
+        assert pragma(engine, "cache_size") == settings.SQLITE_CACHE_SIZE
+        assert pragma(engine, "temp_store") == 2  # MEMORY
+        assert pragma(engine, "foreign_keys") == 1
+        assert engine.pool.size() == settings.DB_POOL_SIZE
+    finally:
+        engine.dispose()
+
+def test_explicit_pragmas_override_settings(tmp_path):
+    engine = create_db_engine(
+        f"sqlite:///{tmp_path / 'plain.db'}", {"journal_mode": "DELETE", "synchronous": "FULL"}
+    )
+    try:
+        assert pragma(engine, "journal_mode") == "delete"
+        assert pragma(engine, "synchronous") == 2
+        assert pragma(engine, "foreign_keys") == 0
+    finally:
+        engine.dispose()
+
+def test_foreign_keys_are_enforced(tmp_path):
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'fk.db'}")
+    try:
+        with engine.begin() as conn:
+            conn.exec_driver_sql("CREATE TABLE parent (id INTEGER PRIMARY KEY)")
+            conn.exec_driver_sql("CREATE TABLE child (id INTEGER PRIMARY KEY, parent_id INTEGER REFERENCES parent(id))")
+        with pytest.raises(IntegrityError):
+            with engine.begin() as conn:
+                conn.exec_driver_sql("INSERT INTO child VALUES (1, 42)")
+    finally:
+        engine.dispose()
@@ -0,0 +1,63 @@
+import pytest
+
+@pytest.fixture
+def auth_headers(client):
+    client.post(
+        "/api/v1/auth/register",
+        json={"username": "stats_user", "email": "stats_user@example.com", "password": "password"}
+    )
+    response = client.post(
+        "/api/v1/auth/login",
+        data={"username": "stats_user@example.com", "password": "password"}
+    )
+    token = response.json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+@pytest.fixture
+def piggy_banks(client, auth_headers):
+    usd = client.post("/api/v1/piggy-banks", headers=auth_headers, json={"name": "Stats_USD"}).json()["id"]
+    eur = client.post("/api/v1/piggy-banks", headers=auth_headers, json={"name": "Stats_EUR", "currency": "EUR"}).json()["id"]
+    txs = [
+        (usd, {"amount": 3000.0, "type": "income", "category": "Salary", "date": "2024-01-05T09:00:00"}),
+        (usd, {"amount": -40.0, "type": "expense", "category": "Food", "date": "2024-01-20T12:00:00"}),
+        (usd, {"amount": 25.0, "type": "expense", "category": "Food", "date": "2024-02-02T12:00:00"}),
+        (usd, {"amount": 10.0, "type": "adjustment", "date": "2024-03-01T12:00:00"}),
+        (eur, {"amount": 100.0, "type": "deposit", "category": "", "date": "2023-12-31T23:00:00"}),
+    ]
+    for pb_id, payload in txs:
+        client.post(f"/api/v1/piggy-banks/{pb_id}/transactions", headers=auth_headers, json=payload)
+    return usd, eur
+
+def test_monthly_statistics(client, auth_headers, piggy_banks):
+    response = client.get("/api/v1/statistics/?timeframe=monthly", headers=auth_headers)
+    assert response.status_code == 200, response.text
+    data = response.json()
+
+    assert [(r["period"], r["currency"]) for r in data] == [
+        ("2023-12", "EUR"), ("2024-01", "USD"), ("2024-02", "USD"), ("2024-03", "USD")
+    ]
+    dec, jan, feb, mar = data
+    assert dec["income"] == 100.0 and dec["category_incomes"] == {}
+    assert jan["income"] == 3000.0
+    assert jan["expense"] == 40.0
+    assert jan["category_incomes"] == {"Salary": 3000.0}
+    assert jan["category_expenses"] == {"Food": 40.0}
+    assert feb["expense"] == 25.0
+    # Unknown types still open a period but do not count as income or expense
+    assert mar["income"] == 0.0 and mar["expense"] == 0.0
+
+def test_yearly_and_all_statistics(client, auth_headers, piggy_banks):
+    yearly = client.get("/api/v1/statistics/?timeframe=yearly", headers=auth_headers).json()
+    assert [(r["period"], r["currency"]) for r in yearly] == [("2023", "EUR"), ("2024", "USD")]
+    assert yearly[1]["expense"] == 65.0
+    assert yearly[1]["category_expenses"] == {"Food": 65.0}
+
+    everything = client.get("/api/v1/statistics/?timeframe=all", headers=auth_headers).json()
+    assert sorted((r["period"], r["currency"], r["income"]) for r in everything) == [
+        ("all", "EUR", 100.0), ("all", "USD", 3000.0)
+    ]
+
+def test_statistics_without_piggy_banks(client, auth_headers):
+    response = client.get("/api/v1/statistics/", headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json() == []
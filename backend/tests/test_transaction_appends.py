@@ -0,0 +1,94 @@
+import random
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from app.core.config import settings
+from app.domain.transactions import TransactionManager
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "USER_DATA_DIR", str(tmp_path))
+    return TransactionManager("alice", "Wallet", storage="csv")
+
+def expected_frame(rows):
+    """Sort everything and sum from scratch, as the per-row refresh used to."""
+    df = pd.DataFrame(rows, columns=["Transaction ID", "Date", "Amount"])
+    df["Date"] = pd.to_datetime(df["Date"])
+    df = df.sort_values(["Date", "Transaction ID"], ignore_index=True)
+    df["Balance"] = df["Amount"].cumsum()
+    return df
+
+def test_in_order_appends_are_buffered(manager):
+    result = manager.add_transactions(
+        [("2024-01-01", 10.0, "Salary"), {"date": "2024-01-03", "amount": -4.0, "category": "Food", "description": "Lunch"}]
+    )
+    assert result == {"success": True, "count": 2, "balance": 6.0}
+    added = manager.add_transaction("2024-01-03", 1.5, "Gift")
+    assert added["transaction"]["Transaction ID"] == 3
+    assert added["transaction"]["Balance"] == 7.5
+    assert manager._pending
+
+    df = manager.transactions_df
+    assert not manager._pending
+    assert list(df["Transaction ID"]) == [1, 2, 3]
+    assert list(df["Balance"]) == [10.0, 6.0, 7.5]
+    assert list(df["Description"]) == ["", "Lunch", ""]
+
+def test_backdated_rows_rebalance_from_the_earliest_date(manager):
+    manager.add_transactions([("2024-01-01", 10.0, "A"), ("2024-01-05", 20.0, "B"), ("2024-01-09", 30.0, "C")])
+    added = manager.add_transaction("2024-01-05", -1.0, "D")
+    # Same date as an existing row: goes after it, by ID
+    assert added["transaction"]["Balance"] == 29.0
+    assert added["balance"] == 59.0
+
+    manager.add_transactions([("2024-01-02", 100.0, "E"), ("2023-12-31", 1000.0, "F")])
+    df = manager.transactions_df
+    assert list(df["Transaction ID"]) == [6, 1, 5, 2, 4, 3]
+    assert list(df["Balance"]) == [1000.0, 1010.0, 1110.0, 1130.0, 1129.0, 1159.0]
+    assert manager.current_balance == 1159.0
+
+def test_matches_full_resort(manager):
+    rng = random.Random(7)
+    rows = []
+    for batch in range(30):
+        items = [
+            (f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}", round(rng.uniform(-50, 50), 2), "X")
+            for _ in range(rng.randint(1, 20))
+        ]
+        first_id = manager.transaction_counter
+        if batch % 3 == 0:
+            for item in items:
+                manager.add_transaction(*item)
+        else:
+            manager.add_transactions(iter(items))
+        rows += [(first_id + i, date, amount) for i, (date, amount, _) in enumerate(items)]
+
+    expected = expected_frame(rows)
+    df = manager.transactions_df
+    assert list(df["Transaction ID"]) == list(expected["Transaction ID"])
+    assert df["Balance"].to_numpy() == pytest.approx(expected["Balance"].to_numpy())
+
+def test_invalid_date_adds_nothing(manager):
+    manager.add_transaction("2024-01-01", 10.0, "A")
+    result = manager.add_transactions([("2024-01-02", 1.0, "B"), ("not a date", 2.0, "C")])
+    assert result["success"] is False
+    assert result["index"] == 1
+    assert "Invalid date format" in result["error"]
+    assert manager.add_transaction("nope", 1.0, "A")["success"] is False
+    assert len(manager.transactions_df) == 1
+    assert manager.transaction_counter == 2
+
+def test_aware_and_naive_dates_mix(manager):
+    result = manager.add_transactions([("2024-01-01T00:00:00Z", 1.0, "A"), ("2024-01-02", 2.0, "B"), ("2024-01-01T03:00:00+02:00", 4.0, "C")])
+    assert result == {"success": True, "count": 3, "balance": 7.0}
+    df = manager.transactions_df
+    assert list(df["Date"].astype(str)) == ["2024-01-01 00:00:00", "2024-01-01 01:00:00", "2024-01-02 00:00:00"]
+    assert list(df["Balance"]) == [1.0, 5.0, 7.0]
+
+def test_saved_buffer_round_trips(manager):
+    manager.add_transactions([("2024-02-01", 5.0, "A"), ("2024-01-01", 7.0, None)])
+    manager.save(2024)
+    loaded = TransactionManager("alice", "Wallet", storage="csv")
+    assert loaded.load(2024)["balance"] == 12.0
+    assert list(loaded.transactions_df["Balance"]) == [7.0, 12.0]
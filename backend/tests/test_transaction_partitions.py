@@ -0,0 +1,79 @@
+from datetime import datetime
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("pyarrow")
+
+from app.core.cache import SizedLRUCache
+from app.core.config import settings
+from app.domain import transactions
+from app.domain.transactions import TransactionManager
+
+@pytest.fixture(autouse=True)
+def user_data_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "USER_DATA_DIR", str(tmp_path))
+    transactions.partition_cache.clear()
+    transactions.year_total_cache.clear()
+    return tmp_path
+
+@pytest.fixture
+def manager():
+    """Three year files: 2022 nets 100, 2023 nets -30, 2024 nets 5."""
+    for year, amounts in ((2022, [150.0, -50.0]), (2023, [20.0, -50.0]), (2024, [10.0, -5.0])):
+        tm = TransactionManager("alice", "Wallet")
+        for month, amount in enumerate(amounts, start=3):
+            tm.add_transaction(f"{year}-{month:02d}-01", amount, "Food")
+        tm.save(year)
+    return TransactionManager("alice", "Wallet")
+
+def cached_years():
+    return sorted(int(path.rsplit("/", 1)[-1][:4]) for path in transactions.partition_cache._data)
+
+def test_only_touched_partitions_are_loaded(manager):
+    df = manager.transactions_between(datetime(2023, 3, 15), datetime(2023, 5, 1))
+    assert list(df["Amount"]) == [-50.0]
+    assert cached_years() == [2023]
+
+    df = manager.transactions_between(datetime(2022, 12, 1), datetime(2024, 3, 2))
+    assert list(df["Amount"]) == [20.0, -50.0, 10.0]
+    assert cached_years() == [2022, 2023, 2024]
+
+def test_opening_balances_use_cached_year_totals(manager, monkeypatch):
+    assert manager.closing_balance(2023) == 70.0
+    assert manager.balance_before(datetime(2024, 1, 1)) == 70.0
+    # Year totals come from projected reads, not full partitions
+    assert cached_years() == []
+
+    # A new process finds them in closing_balances.json without reading any year file
+    transactions.year_total_cache.clear()
+    monkeypatch.setattr(manager.store, "read", lambda *args, **kwargs: pytest.fail("year file was read"))
+    assert TransactionManager("alice", "Wallet").balance_before(datetime(2024, 1, 1)) == 70.0
+
+def test_balance_before_mid_year(manager):
+    assert manager.balance_before(datetime(2023, 4, 1)) == 120.0
+    assert cached_years() == [2023]
+
+def test_saved_and_unsaved_changes_are_seen(manager):
+    manager.load(2022)
+    manager.add_transaction("2022-12-31", 1000.0, "Gift")
+    # The loaded year is served from the working DataFrame before it is saved
+    assert manager.balance_before(datetime(2024, 1, 1)) == 1070.0
+
+    manager.save(2022)
+    assert TransactionManager("alice", "Wallet").balance_before(datetime(2024, 1, 1)) == 1070.0
+
+def test_partition_cache_respects_the_memory_cap():
+    cache = SizedLRUCache(max_bytes=10, sizeof=len)
+    cache.set("a", "xxxx")
+    cache.set("b", "xxxx")
+    assert cache.get("a") == "xxxx"
+    cache.set("c", "xxxx")
+    # "b" was the least recently used
+    assert cache.get("b") is None
+    assert cache.get("a") == "xxxx" and cache.get("c") == "xxxx"
+    assert cache.stats()["bytes"] == 8
+
+    cache.set("huge", "x" * 11)
+    assert cache.get("huge") is None
+    assert cache.get("a", version=1) is None
+    assert cache.stats()["bytes"] == 4
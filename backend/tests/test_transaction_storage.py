@@ -0,0 +1,76 @@
+from datetime import datetime
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("pyarrow")
+
+from app.core.config import settings
+from app.domain.transaction_storage import convert_csv_tree
+from app.domain.transactions import TransactionManager
+
+@pytest.fixture(autouse=True)
+def user_data_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "USER_DATA_DIR", str(tmp_path))
+    return tmp_path
+
+def write_year(storage, year=2024):
+    tm = TransactionManager("alice", "Wallet", storage=storage)
+    tm.add_transaction(f"{year}-03-01", 100.0, "Salary", "March pay")
+    tm.add_transaction(f"{year}-01-15", -20.0, "Food", "Lunch")
+    tm.add_transaction(f"{year}-06-30", -5.5, None, "")
+    tm.save(year)
+    return tm
+
+@pytest.mark.parametrize("storage", ["csv", "parquet", "feather"])
+def test_round_trip(storage):
+    write_year(storage)
+    tm = TransactionManager("alice", "Wallet", storage=storage)
+    result = tm.load(2024)
+    assert result == {"success": True, "year": 2024, "count": 3, "balance": 74.5}
+
+    df = tm.transactions_df
+    assert list(df["Description"].fillna("")) == ["Lunch", "March pay", ""]
+    assert list(df["Balance"]) == [-20.0, 80.0, 74.5]
+    assert df["Date"].dtype.kind == "M"
+    assert pd.isna(df["Category"].iloc[2])
+
+@pytest.mark.parametrize("storage", ["csv", "parquet", "feather"])
+def test_read_projects_a_date_range(storage):
+    write_year(storage)
+    tm = TransactionManager("alice", "Wallet", storage=storage)
+    df = tm.read(2024, datetime(2024, 2, 1), datetime(2024, 6, 30), columns=["Amount", "Category"])
+    assert list(df.columns) == ["Amount", "Category"]
+    assert df.to_dict("records") == [{"Amount": 100.0, "Category": "Salary"}]
+    assert list(tm.read(2024, columns=["Amount"])["Amount"]) == [-20.0, 100.0, -5.5]
+    assert tm.read(2023).empty
+
+def test_parquet_columns_are_typed(user_data_dir):
+    import pyarrow.parquet as pq
+
+    tm = write_year("parquet")
+    schema = pq.read_schema(tm.get_file_path(2024))
+    assert str(schema.field("Transaction ID").type) == "int64"
+    assert str(schema.field("Date").type) == "timestamp[us]"
+    assert str(schema.field("Amount").type) == "double"
+
+def test_csv_wrappers_use_configured_storage_and_fall_back_to_csv(monkeypatch):
+    write_year("csv", 2023)
+    monkeypatch.setattr(settings, "TRANSACTION_STORAGE", "parquet")
+
+    # Unconverted years are still readable
+    tm = TransactionManager("alice", "Wallet")
+    assert tm.load_from_csv(2023)["count"] == 3
+    saved = tm.save_to_csv(2023)
+    assert saved["filepath"].endswith("parquet/2023_transactions.parquet")
+    assert TransactionManager("alice", "Wallet").load_from_csv()["year"] == 2023
+
+def test_convert_csv_tree(user_data_dir):
+    write_year("csv", 2023)
+    write_year("csv", 2024)
+
+    written = convert_csv_tree(str(user_data_dir), "parquet", remove_csv=True)
+    assert [path.rsplit("/", 1)[-1] for path in written] == ["2023_transactions.parquet", "2024_transactions.parquet"]
+
+    tm = TransactionManager("alice", "Wallet", storage="parquet")
+    assert tm.list_transaction_files("csv") == {}
+    assert tm.load(2024)["balance"] == 74.5
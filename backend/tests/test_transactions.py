@@ -109,3 +109,80 @@ def test_transfer(client, auth_headers, piggy_bank_id):
 
     assert bal1["balance"] == 300.0
     assert bal2["balance"] == 200.0
+
+def test_paginated_transactions(client, auth_headers, piggy_bank_id):
+    url = f"/api/v1/piggy-banks/{piggy_bank_id}/transactions"
+    for day in range(1, 8):
+        client.post(url, headers=auth_headers, json={"amount": float(day), "date": f"2024-01-0{day}T00:00:00"})
+    # Same timestamp twice to exercise the id tie-breaker
+    client.post(url, headers=auth_headers, json={"amount": 7.5, "date": "2024-01-07T00:00:00"})
+
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 3}
+        if cursor:
+            params["cursor"] = cursor
+        page = client.get(f"{url}/paged", headers=auth_headers, params=params).json()
+        seen.extend(tx["amount"] for tx in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen == [7.5, 7.0, 6.0, 5.0, 4.0, 3.0, 2.0, 1.0]
+    full = client.get(url, headers=auth_headers).json()
+    assert [tx["amount"] for tx in full] == seen
+
+def test_paginated_transaction_filters(client, auth_headers, piggy_bank_id):
+    url = f"/api/v1/piggy-banks/{piggy_bank_id}/transactions"
+    client.post(url, headers=auth_headers, json={"amount": -20.0, "category": "Food", "date": "2024-02-01T00:00:00"})
+    client.post(url, headers=auth_headers, json={"amount": -80.0, "category": "Food", "date": "2024-02-10T00:00:00"})
+    client.post(url, headers=auth_headers, json={"amount": 900.0, "type": "income", "category": "Salary", "date": "2024-02-15T00:00:00"})
+    client.post(url, headers=auth_headers, json={"amount": -15.0, "category": "Food", "date": "2024-03-01T00:00:00"})
+
+    page = client.get(f"{url}/paged", headers=auth_headers, params={
+        "category": "Food", "start_date": "2024-02-01T00:00:00", "end_date": "2024-02-28T00:00:00", "max_amount": -50,
+    }).json()
+    assert [tx["amount"] for tx in page["items"]] == [-80.0]
+    assert page["next_cursor"] is None
+
+    income = client.get(f"{url}/paged", headers=auth_headers, params={"type": "income"}).json()
+    assert [tx["category"] for tx in income["items"]] == ["Salary"]
+
+def test_paginated_transactions_rejects_bad_cursor(client, auth_headers, piggy_bank_id):
+    response = client.get(
+        f"/api/v1/piggy-banks/{piggy_bank_id}/transactions/paged",
+        headers=auth_headers,
+        params={"cursor": "not-a-cursor"}
+    )
+    assert response.status_code == 400
+
+def test_batch_add_transactions(client, auth_headers, piggy_bank_id):
+    items = [{"amount": float(i), "category": "Bulk", "date": f"2024-04-{i:02d}T00:00:00"} for i in range(1, 21)]
+    items.insert(5, {"amount": "not-a-number"})
+    items.append({"type": "income"})
+
+    response = client.post(
+        f"/api/v1/piggy-banks/{piggy_bank_id}/transactions:batch",
+        headers=auth_headers,
+        json=items
+    )
+    assert response.status_code == 200, response.text
+    data = response.json()
+    assert len(data["created_ids"]) == 20
+    assert data["created_ids"] == sorted(data["created_ids"])
+    assert [e["index"] for e in data["errors"]] == [5, 21]
+
+    balance = client.get(f"/api/v1/piggy-banks/{piggy_bank_id}/balance", headers=auth_headers).json()
+    assert balance == {"balance": 210.0, "transaction_count": 20}
+
+    first = client.get(f"/api/v1/piggy-banks/{piggy_bank_id}/transactions", headers=auth_headers).json()[-1]
+    assert first["id"] == data["created_ids"][0]
+    assert first["amount"] == 1.0
+
+def test_batch_add_requires_ownership(client, auth_headers):
+    response = client.post(
+        "/api/v1/piggy-banks/999999/transactions:batch",
+        headers=auth_headers,
+        json=[{"amount": 1.0}]
+    )
+    assert response.status_code == 404
@@ -6,6 +6,7 @@ A command-line interface to manage personal finances via a REST API
 and inspect the underlying SQLite database directly for debugging.
 """
 
+import json
 import requests
 import sqlite3
 import sys
@@ -121,11 +122,10 @@ def login():
 # -----------------------------
 def list_piggybanks():
     """
-    Fetches all PiggyBanks owned by the user.
-    For each bank found, it makes a secondary API call to fetch the real-time balance.
+    Fetches all PiggyBanks owned by the user together with their balances in one call.
     """
     print_header("Your PiggyBanks")
-    banks = api_get("/piggy-banks")
+    banks = api_get("/piggy-banks/balances")
     
     if not isinstance(banks, list):
         print("Error: Could not retrieve banks.")
@@ -136,9 +136,11 @@ def list_piggybanks():
     
     # Iterate through the list and display details
     for pb in banks:
-        # Get the calculated balance for this specific bank ID
-        bal = api_get(f"/piggy-banks/{pb['id']}/balance")
-        print(f"ID [{pb['id']}] | Name: {pb['name']} | Currency: {pb['currency']} | Balance: {bal.get('balance', 0)}")
+        last_activity = (pb.get("last_activity") or "-")[:10]
+        print(
+            f"ID [{pb['id']}] | Name: {pb['name']} | Currency: {pb['currency']} | "
+            f"Balance: {pb['balance']} | Transactions: {pb['transaction_count']} | Last activity: {last_activity}"
+        )
     return banks
 
 def create_piggybank():
@@ -265,6 +267,55 @@ def edit_transaction():
         print("Input Error: Invalid data format.")
 
 
+def import_statement():
+    """
+    Uploads a CSV/OFX/QIF bank statement in one request.
+    The server parses and inserts it in chunks, so this replaces scripting
+    one add_transaction call per row.
+    """
+    print_header("Import Bank Statement")
+    try:
+        pb_id = int(input("Target PiggyBank ID: "))
+        path = input("Statement file path: ").strip()
+        if not os.path.exists(path):
+            print(f"❌ File not found: {path}")
+            return
+
+        data = {}
+        if path.lower().endswith(".csv"):
+            # Only CSV needs a column mapping; Enter keeps the default header name
+            print("Column mapping [Press Enter to keep the default header name]")
+            mapping = {
+                "date": input("Date column (date): ") or "date",
+                "amount": input("Amount column (amount): ") or "amount",
+            }
+            for field in ("category", "description", "date_format"):
+                value = input(f"{field.replace('_', ' ').title()} (optional): ")
+                if value:
+                    mapping[field] = value
+            data["mapping"] = json.dumps(mapping)
+
+        headers = {"Authorization": f"Bearer {token}"} if token else {}
+        print("Uploading... (large statements may take a while)")
+        with open(path, "rb") as f:
+            r = requests.post(
+                f"{BASE_URL}/piggy-banks/{pb_id}/imports",
+                files={"file": (os.path.basename(path), f)},
+                data=data,
+                headers=headers,
+            )
+        res = r.json()
+
+        if "imported" in res:
+            print(f"✅ Imported {res['imported']} transactions, rejected {res['rejected']}.")
+            for error in res["errors"][:10]:
+                print(f"   line {error['line']}: {error['detail']}")
+        else:
+            print("❌ Import failed:", res.get("detail", res))
+    except ValueError:
+        print("Input Error: Please enter a valid numerical ID.")
+
+
 # ----------------------------------------
 # Section: Debugging & Database Inspection
 # ----------------------------------------
@@ -344,7 +395,8 @@ def main_loop():
             print("(3) Delete a PiggyBank")
             print("(4) Add Transaction")
             print("(5) Edit Transaction")
-            print("(6) Inspect Raw Database (Debug)")
+            print("(6) Import Bank Statement")
+            print("(7) Inspect Raw Database (Debug)")
             print("(q) Logout & Exit")
             
             choice = input("> ").strip().lower()
@@ -365,6 +417,9 @@ def main_loop():
                 edit_transaction()
 
             elif choice == '6':
+                import_statement()
+
+            elif choice == '7':
                 inspect_db()
 
             elif choice == 'q':
@@ -372,7 +427,7 @@ def main_loop():
                 break
 
             else:
-                print("Invalid choice. Please pick (1-6) or (q).")
+                print("Invalid choice. Please pick (1-7) or (q).")
 
 if __name__ == "__main__":
     try:
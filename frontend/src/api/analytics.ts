@@ -0,0 +1,42 @@
+import { apiClient } from './client';
+
+export type CubeDimension =
+    | 'day' | 'week' | 'month' | 'quarter' | 'year' | 'weekday'
+    | 'piggy_bank' | 'currency' | 'type' | 'category';
+export type CubeMeasure = 'sum' | 'count' | 'avg' | 'min' | 'max';
+
+export interface CubeQuery {
+    dimensions: CubeDimension[];
+    measures?: CubeMeasure[];
+    piggyBankId?: number;
+    startDate?: string;
+    endDate?: string;
+    top?: number;
+    topDimension?: CubeDimension;
+    topBy?: 'sum' | 'count';
+}
+
+export interface CubeResponse {
+    dimensions: CubeDimension[];
+    measures: CubeMeasure[];
+    // One index-aligned array per dimension and measure
+    columns: Record<string, Array<string | number | null>>;
+    row_count: number;
+}
+
+export const analyticsApi = {
+    cube: async (query: CubeQuery): Promise<CubeResponse> => {
+        // Repeated keys (dimensions=a&dimensions=b), as FastAPI expects for lists
+        const params = new URLSearchParams();
+        query.dimensions.forEach((d) => params.append('dimensions', d));
+        (query.measures ?? ['sum', 'count']).forEach((m) => params.append('measures', m));
+        if (query.piggyBankId !== undefined) params.append('piggy_bank_id', String(query.piggyBankId));
+        if (query.startDate) params.append('start_date', query.startDate);
+        if (query.endDate) params.append('end_date', query.endDate);
+        if (query.top !== undefined) params.append('top', String(query.top));
+        if (query.topDimension) params.append('top_dimension', query.topDimension);
+        if (query.topBy) params.append('top_by', query.topBy);
+        const { data } = await apiClient.get('/analytics/cube', { params });
+        return data;
+    }
+};
@@ -5,12 +5,17 @@ export const piggybanksApi = {
         const { data } = await apiClient.get('/piggy-banks');
         return data;
     },
+    listWithBalances: async () => {
+        const { data } = await apiClient.get('/piggy-banks/balances');
+        return data;
+    },
     create: async (name: string, currency: string = "USD") => {
         const { data } = await apiClient.post('/piggy-banks', { name, currency });
         return data;
     },
-    getBalance: async (id: number) => {
-        const { data } = await apiClient.get(`/piggy-banks/${id}/balance`);
+    getBalance: async (id: number, asOf?: string) => {
+        const params = asOf ? { as_of: asOf } : undefined;
+        const { data } = await apiClient.get(`/piggy-banks/${id}/balance`, { params });
         return data;
     },
     remove: async (id: number) => {
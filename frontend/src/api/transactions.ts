@@ -1,5 +1,5 @@
 import { apiClient } from './client';
-import type { Transaction } from '../types';
+import type { Transaction, TransactionFilters, TransactionPage } from '../types';
 
 export const transactionsApi = {
     /**
@@ -9,6 +9,21 @@ export const transactionsApi = {
         const { data } = await apiClient.get(`/piggy-banks/${piggyBankId}/transactions`);
         return data;
     },
+    /**
+     * Fetches one page of a PiggyBank's transactions (newest first).
+     * Pass the previous page's `next_cursor` to continue; it is null on the last page.
+     */
+    listPage: async (
+        piggyBankId: number,
+        limit: number = 50,
+        cursor: string | null = null,
+        filters: TransactionFilters = {},
+    ): Promise<TransactionPage> => {
+        const { data } = await apiClient.get(`/piggy-banks/${piggyBankId}/transactions/paged`, {
+            params: { ...filters, limit, ...(cursor ? { cursor } : {}) },
+        });
+        return data;
+    },
     /**
      * Dispatches a unified payload to create a localized PiggyBank transaction.
      */
@@ -2,14 +2,10 @@ import React, { useEffect, useState } from 'react';
 import { Link } from 'react-router-dom';
 import { useAuth } from '../context/AuthContext';
 import { piggybanksApi } from '../api/piggybanks';
-import type { PiggyBank, Balance } from '../types';
+import type { PiggyBankSummary } from '../types';
 import { Plus, Wallet, LogOut, ArrowRight, Settings } from 'lucide-react';
 import { StatisticsCharts } from '../components/StatisticsCharts';
 
-interface PiggyBankWithBalance extends PiggyBank {
-    details?: Balance;
-}
-
 /**
  * Primary user interface displayed upon successful login.
  * Manages the aggregation of PiggyBanks, total Net Worth calculation, and Analytics mounting.
@@ -17,29 +13,20 @@ interface PiggyBankWithBalance extends PiggyBank {
 export const Dashboard = () => {
     const { user, logout } = useAuth();
 
-    const [piggyBanks, setPiggyBanks] = useState<PiggyBankWithBalance[]>([]);
+    const [piggyBanks, setPiggyBanks] = useState<PiggyBankSummary[]>([]);
     const [isLoading, setIsLoading] = useState(true);
     const [showCreate, setShowCreate] = useState(false);
     const [newName, setNewName] = useState('');
     const [newCurrency, setNewCurrency] = useState('USD');
 
     /**
-     * Fetches all PiggyBanks belonging to the user and their respective current balances.
-     * Maps these together into the `piggyBanks` state array.
+     * Fetches all PiggyBanks belonging to the user together with their current balances
+     * in a single request and stores them in the `piggyBanks` state array.
      */
     const loadData = async () => {
         try {
-            const pbs = await piggybanksApi.list();
-
-            // Fetch balance for each piggy bank
-            const pbsWithBalance = await Promise.all(
-                pbs.map(async (pb: PiggyBank) => {
-                    const details = await piggybanksApi.getBalance(pb.id);
-                    return { ...pb, details };
-                })
-            );
-
-            setPiggyBanks(pbsWithBalance);
+            const pbs = await piggybanksApi.listWithBalances();
+            setPiggyBanks(pbs);
         } catch (err) {
             console.error("Failed to load dashboard data", err);
         } finally {
@@ -87,7 +74,7 @@ export const Dashboard = () => {
      * Compute total user balance separated by currency to prevent inaccurate cross-currency math.
      */
     const balancesByCurrency = piggyBanks.reduce((acc, pb) => {
-        const bal = pb.details?.balance || 0;
+        const bal = pb.balance || 0;
         acc[pb.currency] = (acc[pb.currency] || 0) + bal;
         return acc;
     }, {} as Record<string, number>);
@@ -191,11 +178,11 @@ export const Dashboard = () => {
                         </div>
 
                         <p className="text-text-secondary text-sm mb-1">Current Balance</p>
-                        <p className="text-2xl font-bold">{getCurrencySymbol(pb.currency)}{pb.details?.balance.toFixed(2) || '0.00'}</p>
+                        <p className="text-2xl font-bold">{getCurrencySymbol(pb.currency)}{pb.balance.toFixed(2)}</p>
 
                         <div className="flex justify-between items-center mt-4 mt-auto">
                             <p className="text-xs text-muted">
-                                {pb.details?.transaction_count || 0} transactions
+                                {pb.transaction_count} transactions
                             </p>
                             <button
                                 onClick={(e) => {
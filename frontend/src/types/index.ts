@@ -28,7 +28,26 @@ export interface Transaction {
   date: string;
 }
 
+export interface TransactionFilters {
+  start_date?: string;
+  end_date?: string;
+  type?: string;
+  category?: string;
+  min_amount?: number;
+  max_amount?: number;
+}
+
+export interface TransactionPage {
+  items: Transaction[];
+  next_cursor: string | null;
+}
+
 export interface Balance {
   balance: number;
   transaction_count: number;
+  as_of?: string;
+}
+
+export interface PiggyBankSummary extends PiggyBank, Balance {
+  last_activity: string | null;
 }